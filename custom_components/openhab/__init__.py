@@ -4,22 +4,46 @@ Custom integration to integrate openHAB with Home Assistant.
 For more details about this integration, please refer to
 https://github.com/kubawolanin/ha-openhab
 """
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
+import homeassistant.helpers.config_validation as cv
 
 from .api import OpenHABApiClient
+from .connection import OpenHABConnectionPool
 from .const import (
+    ATTR_DURATION,
     CONF_AUTH_TOKEN,
     CONF_AUTH_TYPE,
     CONF_BASE_URL,
     CONF_PASSWORD,
+    CONF_POOL_DNS_CACHE_TTL,
+    CONF_POOL_KEEPALIVE,
+    CONF_POOL_LIMIT,
     CONF_USERNAME,
+    DEFAULT_POOL_DNS_CACHE_TTL,
+    DEFAULT_POOL_KEEPALIVE,
+    DEFAULT_POOL_LIMIT,
+    DEFAULT_PROFILE_DURATION,
     DOMAIN,
     LOGGER,
     PLATFORMS,
+    SERVICE_PROFILE,
+    SERVICE_SAVE_SSE_RECORDING,
     STARTUP_MESSAGE,
 )
 from .coordinator import OpenHABDataUpdateCoordinator
+from .profiling import SamplingProfiler
+from .snapshot import CatalogSnapshot
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            cv.positive_int, vol.Range(min=1, max=300)
+        ),
+    }
+)
 
 
 async def async_setup_entry(
@@ -30,6 +54,17 @@ async def async_setup_entry(
     LOGGER.info(STARTUP_MESSAGE)
     hass.data.setdefault(DOMAIN, {})
 
+    pool = OpenHABConnectionPool(
+        hass,
+        limit=entry.options.get(CONF_POOL_LIMIT, DEFAULT_POOL_LIMIT),
+        keepalive_timeout=entry.options.get(
+            CONF_POOL_KEEPALIVE, DEFAULT_POOL_KEEPALIVE
+        ),
+        dns_cache_ttl=entry.options.get(
+            CONF_POOL_DNS_CACHE_TTL, DEFAULT_POOL_DNS_CACHE_TTL
+        ),
+    )
+
     api_client = OpenHABApiClient(
         hass=hass,
         base_url=entry.data[CONF_BASE_URL],
@@ -37,6 +72,7 @@ async def async_setup_entry(
         auth_token=entry.data.get(CONF_AUTH_TOKEN, ""),
         username=entry.data.get(CONF_USERNAME, ""),
         password=entry.data.get(CONF_PASSWORD, ""),
+        pool=pool,
     )
 
     if api_client.openhab==False:
@@ -46,7 +82,16 @@ async def async_setup_entry(
         api_client.CreateOpenHab()
 
     coordinator = OpenHABDataUpdateCoordinator(hass, api=api_client)
-    await coordinator.async_config_entry_first_refresh()
+    timer = coordinator.setup_timer
+    try:
+        from_snapshot = await coordinator.async_start_from_snapshot()
+        if not from_snapshot:
+            with timer.phase("first_refresh"):
+                await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Release the connection pool before Home Assistant retries setup.
+        await coordinator.async_shutdown()
+        raise
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
@@ -56,13 +101,46 @@ async def async_setup_entry(
             #hass.async_add_job(
             #    hass.config_entries.async_forward_entry_setup(entry, platform)
             #)
-    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
+    with timer.phase("forward_entry_setups"):
+        await hass.config_entries.async_forward_entry_setups(
+            entry, coordinator.platforms
+        )
+    timer.finish()
+    if from_snapshot:
+        coordinator.async_start_reconcile()
 
     entry.add_update_listener(async_reload_entry)
 
+    if not hass.services.has_service(DOMAIN, SERVICE_PROFILE):
+        _async_register_services(hass)
+
     return True
 
 
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_profile(call: ServiceCall) -> None:
+        """Sample the integration hot paths; the result shows in diagnostics."""
+        duration = call.data[ATTR_DURATION]
+        LOGGER.info("Profiling openHAB integration for %d seconds", duration)
+        result = await hass.async_add_executor_job(SamplingProfiler().run, duration)
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            coordinator.last_profile = result
+
+    async def async_save_sse_recording(call: ServiceCall) -> None:
+        """Write the recorded SSE streams of all entries that record."""
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            await coordinator.async_save_recording()
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, async_profile, schema=PROFILE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SAVE_SSE_RECORDING, async_save_sse_recording
+    )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload the config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
@@ -74,9 +152,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry, [platform for platform in PLATFORMS if platform in coordinator.platforms]
     ):
         hass.data[DOMAIN].pop(entry.entry_id)
+        if not hass.data[DOMAIN]:
+            hass.services.async_remove(DOMAIN, SERVICE_PROFILE)
+            hass.services.async_remove(DOMAIN, SERVICE_SAVE_SSE_RECORDING)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored item catalog of a deleted config entry."""
+    await CatalogSnapshot(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     await async_unload_entry(hass, entry)
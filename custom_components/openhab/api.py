@@ -7,18 +7,25 @@ import os
 import aiohttp
 import pathlib
 import json
+import time
 
 from .utils import strip_ip
 
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
 from openhab import (
     OpenHAB,
     oauth2_helper
 )
 
+from .connection import OpenHABConnectionPool
 from .const import CONF_AUTH_TYPE_BASIC, CONF_AUTH_TYPE_TOKEN
+from .profiling import PhaseTimer
+from .store import StoredItem
 from homeassistant.helpers.storage import STORAGE_DIR
 
 API_HEADERS = {aiohttp.hdrs.CONTENT_TYPE: "application/json; charset=UTF-8"}
+REST_TIMEOUT = 10
 
 def get_model_name(a, b):
     sim = 0
@@ -30,14 +37,9 @@ def get_model_name(a, b):
 
     return (a[:sim]).rstrip('_')
 
-def get_from_Things(oh):
+def get_from_Things(things):
     devi_things = {}
 
-    try:
-        things = oh.req_get("/things/")
-    except:
-        things = False
-
     if things:
         for thing in things:
             if thing['thingTypeUID']=='danfoss:devismart':
@@ -70,30 +72,60 @@ def isDeviDevice(k, devi_things):
     else:
         return k.find('DeviReg')==0
 
-def fetch_all_items_new(oh):
+def fetch_all_items_new(oh, items_json=None, things=None, timer=None):
     try:
-        return fetch_all_items(oh)
+        return fetch_all_items(oh, items_json, things, timer)
     except:
         return {}
 
-def fetch_all_items(oh):
+
+def items_from_json(items_json):
+    """Build compact StoredItem objects from a raw /items response."""
+    items = {}
+    for j in items_json:
+        if j["name"] not in items:
+            items[j["name"]] = StoredItem.from_json(j)
+    return items
+
+
+def fetch_all_items(oh, items_json=None, things=None, timer=None):
+    """Fetch and classify all items.
+
+    items_json / things may be passed in when they were already fetched by
+    the native aiohttp client; otherwise they are fetched through
+    python-openhab (compatibility path). Phases are timed on timer.
+    """
     import json
     from .const import LOGGER
 
+    if timer is None:
+        timer = PhaseTimer("fetch_all_items")
+
+    if things is None:
+        with timer.phase("request_things"):
+            try:
+                things = oh.req_get("/things/")
+            except:
+                things = False
+
+    if items_json is None:
+        with timer.phase("request_items"):
+            items_json = oh.req_get("/items/")
+
     dr = {}
-    devi_things = get_from_Things(oh)
-    items = oh.fetch_all_items()
+    with timer.phase("get_from_things"):
+        devi_things = get_from_Things(things)
+    with timer.phase("build_items"):
+        items = items_from_json(items_json)
 
+    # Classification and devireg enrichment span the loops below.
+    enrichment_start = time.monotonic()
     devireg_units_found = []
     for k,v in items.items():
-        n = type(v).__name__
-        v.type_ex = False
-        v.parent_device_name = False
-
-        if n=='GroupItem' and isDeviDevice(k, devi_things):
-            x = oh.get_item(k)
-            dr[k]=x
-            x.type_ex = 'devireg_unit'
+        # devireg units are untyped groups
+        if v.group and v.type_ is None and isDeviDevice(k, devi_things):
+            dr[k]=v
+            v.type_ex = 'devireg_unit'
             devireg_units_found.append(k)
     
     if devireg_units_found:
@@ -134,17 +166,23 @@ def fetch_all_items(oh):
         if is_devi_unit==False:
             dr[k]=v
 
+    # Group members come from the groupNames of the items response itself,
+    # so devireg units need no extra requests per unit.
+    members_by_group = {}
+    if devireg_units_found:
+        for j in items_json:
+            for g in j.get("groupNames", ()):
+                members_by_group.setdefault(g, []).append(j)
+
     copy_attrs = ['minimum', 'maximum','step','readOnly']
     for k,v in dr.items():
         if v.type_ex=='devireg_unit':
             attrs = {}
-            full_info = False
-            j = oh.req_get(f"/items/{k}")
-            if 'members' in j:
-                full_info = j['members']
 
-            for m,mv in v._members.items():
+            for x in members_by_group.get(k, ()):
+                m = x['name']
                 if m.startswith(k):
+                    mv = items[m]
                     attr = {
                         'name' : m[len(k)+1:],
                         'value': mv._state,
@@ -152,22 +190,19 @@ def fetch_all_items(oh):
                         'type' : mv.type_
                     }
 
-                    if full_info:
-                        for x in full_info:
-                            if x['name']==m:
-                                if 'label' in x:
-                                    attr['label']=x['label']
+                    if 'label' in x:
+                        attr['label']=x['label']
 
-                                if 'stateDescription' in x:
-                                    sd = x['stateDescription']
+                    if 'stateDescription' in x:
+                        sd = x['stateDescription']
 
-                                    for a in copy_attrs:
-                                        if a in sd:
-                                            attr[a] = sd[a]
+                        for a in copy_attrs:
+                            if a in sd:
+                                attr[a] = sd[a]
 
-                                    if 'options' in sd:
-                                        if len(sd['options'])>0:
-                                            attr['options']=sd['options']
+                        if 'options' in sd:
+                            if len(sd['options'])>0:
+                                attr['options']=sd['options']
 
                     attrs[attr['name']]=attr
 
@@ -181,13 +216,110 @@ def fetch_all_items(oh):
                 'thing': thing,
                 'name_id': k
             }
+    timer.add("devireg_enrichment", time.monotonic() - enrichment_start)
+
+    with timer.phase("sort"):
+        return dict(sorted(dr.items()))
 
-    return dict(sorted(dr.items()))
 
 class ApiClientException(Exception):
     """Api Client Exception."""
 
 
+class ApiClientAuthException(ApiClientException):
+    """Api Client authentication Exception."""
+
+
+class OpenHABRestClient:
+    """Native asyncio client for the openHAB REST API."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        rest_url: str,
+        headers: dict[str, str] | None = None,
+        auth: aiohttp.BasicAuth | None = None,
+        timeout: float = REST_TIMEOUT,
+    ) -> None:
+        """Initialize the REST client."""
+        self._session = session
+        self._rest_url = rest_url
+        self._headers = {aiohttp.hdrs.ACCEPT: "application/json", **(headers or {})}
+        self._auth = auth
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async def _async_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, str] | None = None,
+        data: str | None = None,
+    ) -> Any:
+        """Send a request and return the decoded JSON body (if any)."""
+        headers = self._headers
+        if data is not None:
+            headers = {**headers, aiohttp.hdrs.CONTENT_TYPE: "text/plain"}
+
+        try:
+            async with self._session.request(
+                method,
+                f"{self._rest_url}{path}",
+                params=params,
+                data=data,
+                headers=headers,
+                auth=self._auth,
+                timeout=self._timeout,
+            ) as response:
+                if response.status in (401, 403):
+                    raise ApiClientAuthException(
+                        f"{method} {path} rejected with status {response.status}"
+                    )
+                if not 200 <= response.status < 300:
+                    raise ApiClientException(
+                        f"{method} {path} failed with status {response.status}"
+                    )
+                if method != "GET":
+                    return None
+                return await response.json(content_type=None)
+        except (aiohttp.ClientError, TimeoutError) as err:
+            raise ApiClientException(f"{method} {path} failed: {err}") from err
+
+    async def async_get(self, path: str, params: dict[str, str] | None = None) -> Any:
+        """GET a REST resource."""
+        return await self._async_request("GET", path, params=params)
+
+    async def async_get_items(self) -> list[dict[str, Any]]:
+        """Get the raw JSON of all items."""
+        return await self.async_get("/items", {"recursive": "false"})
+
+    async def async_get_item_states(self) -> list[dict[str, Any]]:
+        """Get only the name and state of all items."""
+        return await self.async_get(
+            "/items", {"recursive": "false", "fields": "name,state"}
+        )
+
+    async def async_get_item(self, item_name: str) -> dict[str, Any]:
+        """Get the raw JSON of a single item."""
+        return await self.async_get(f"/items/{item_name}")
+
+    async def async_get_things(self) -> list[dict[str, Any]]:
+        """Get the raw JSON of all things."""
+        return await self.async_get("/things")
+
+    async def async_get_links(self) -> list[dict[str, Any]]:
+        """Get the raw JSON of all item-channel links."""
+        return await self.async_get("/links")
+
+    async def async_send_command(self, item_name: str, command: str) -> None:
+        """Send a command to an item."""
+        await self._async_request("POST", f"/items/{item_name}", data=command)
+
+    async def async_update_state(self, item_name: str, state: str) -> None:
+        """Update the state of an item without sending a command."""
+        await self._async_request("PUT", f"/items/{item_name}/state", data=state)
+
+
 class OpenHABApiClient:
     """API Client"""
 
@@ -243,7 +375,8 @@ class OpenHABApiClient:
         auth_token: str | None,
         username: str | None,
         password: str | None,
-        creating_token = False
+        creating_token = False,
+        pool: OpenHABConnectionPool | None = None,
     ) -> None:
         """openHAB API Client."""
         self.hass = hass
@@ -262,6 +395,46 @@ class OpenHABApiClient:
         self.openhab = False
         self.CreateOpenHab()
 
+        # Connection pool shared by SSE, catalog fetch and commands. Short
+        # lived clients (config flow) use Home Assistant's shared session.
+        self.pool = pool
+        self.session = pool.session if pool else async_get_clientsession(hass)
+        # Things of the last catalog fetch (reused for the availability index).
+        self.things: list[dict[str, Any]] | bool | None = None
+
+        # Native aiohttp client; python-openhab is kept as a compatibility
+        # fallback for setups where the server rejects the native auth
+        # (e.g. OAuth2-only installations with basic auth disabled).
+        self.rest = OpenHABRestClient(
+            self.session,
+            self._rest_url,
+            headers=self.auth_headers(),
+            auth=self.basic_auth(),
+        )
+
+    def auth_headers(self) -> dict[str, str]:
+        """Return the auth headers used for native requests."""
+        if self._auth_type == CONF_AUTH_TYPE_TOKEN and self._auth_token:
+            return {"X-OPENHAB-TOKEN": self._auth_token}
+        return {}
+
+    def basic_auth(self) -> aiohttp.BasicAuth | None:
+        """Return the basic auth used for native requests."""
+        if self._auth_type == CONF_AUTH_TYPE_BASIC and self._username:
+            return aiohttp.BasicAuth(self._username, self._password or "")
+        return None
+
+    def _disable_native(self, err: ApiClientAuthException) -> None:
+        """Switch permanently to the python-openhab compatibility path."""
+        from .const import LOGGER
+
+        LOGGER.warning(
+            "Native REST client rejected by openHAB (%s) - "
+            "falling back to python-openhab",
+            err,
+        )
+        self.rest = None
+
 
     async def async_get_auth2_token(self) -> str:
         self._creating_token = False
@@ -276,26 +449,118 @@ class OpenHABApiClient:
         return False
 
     async def async_get_version(self) -> str:
-        """Get all items from the API."""
-        info = await self.hass.async_add_executor_job(self.openhab.req_get, "/")
+        """Get the openHAB version from the API."""
+        info = None
+        if self.rest is not None:
+            try:
+                info = await self.rest.async_get("/")
+            except ApiClientAuthException as err:
+                self._disable_native(err)
+        if info is None:
+            info = await self.hass.async_add_executor_job(self.openhab.req_get, "/")
         runtime_info = info["runtimeInfo"]
         return f"{runtime_info['version']} {runtime_info['buildString']}"
 
-
-    async def async_get_items(self) -> dict[str, Any]:
-        """Get all items from the API."""
-        return await self.hass.async_add_executor_job(fetch_all_items_new, self.openhab)
-
-    async def async_get_item(self, item_name: str) -> dict[str, Any]:
+    async def async_get_things(self) -> list[dict[str, Any]] | bool:
+        """Get all things from the API (False when unavailable)."""
+        if self.rest is not None:
+            try:
+                return await self.rest.async_get_things()
+            except ApiClientAuthException as err:
+                self._disable_native(err)
+            except ApiClientException:
+                return False
+        try:
+            return await self.hass.async_add_executor_job(
+                self.openhab.req_get, "/things/"
+            )
+        except Exception:  # pylint: disable=broad-except
+            return False
+
+    async def async_get_items(self, timer: PhaseTimer | None = None) -> dict[str, Any]:
+        """Get all items from the API (phases are timed on timer)."""
+        self.things = None
+        if timer is None:
+            timer = PhaseTimer("items")
+        if self.rest is not None:
+            try:
+                with timer.phase("request_items"):
+                    items_json = await self.rest.async_get_items()
+            except ApiClientAuthException as err:
+                self._disable_native(err)
+            except ApiClientException:
+                return {}
+            else:
+                with timer.phase("request_things"):
+                    things = self.things = await self.async_get_things()
+                return await self.hass.async_add_executor_job(
+                    fetch_all_items_new, self.openhab, items_json, things, timer
+                )
+        return await self.hass.async_add_executor_job(
+            fetch_all_items_new, self.openhab, None, None, timer
+        )
+
+    async def async_get_links(self) -> list[dict[str, Any]]:
+        """Get all item-channel links (empty when unavailable)."""
+        if self.rest is not None:
+            try:
+                return await self.rest.async_get_links()
+            except ApiClientAuthException as err:
+                self._disable_native(err)
+            except ApiClientException:
+                return []
+        try:
+            return await self.hass.async_add_executor_job(
+                self.openhab.req_get, "/links"
+            )
+        except Exception:  # pylint: disable=broad-except
+            return []
+
+    async def async_get_item_states(self) -> dict[str, str]:
+        """Get the raw state of every item (name/state only)."""
+        items = None
+        if self.rest is not None:
+            try:
+                items = await self.rest.async_get_item_states()
+            except ApiClientAuthException as err:
+                self._disable_native(err)
+        if items is None:
+            items = await self.hass.async_add_executor_job(
+                self.openhab.req_get, "/items?recursive=false&fields=name,state"
+            )
+        return {item["name"]: item["state"] for item in items}
+
+    async def async_get_item(self, item_name: str) -> Any:
         """Get item from the API."""
+        if self.rest is not None:
+            try:
+                item_json = await self.rest.async_get_item(item_name)
+            except ApiClientAuthException as err:
+                self._disable_native(err)
+            else:
+                return self.openhab.json_to_item(item_json)
         return await self.hass.async_add_executor_job(self.openhab.get_item, item_name)
 
     async def async_send_command(self, item_name: str, command: str) -> None:
-        """Set Item state"""
-        item = await self.hass.async_add_executor_job(self.async_get_item, item_name)
-        await item.command(command)
-
-    async def async_update_item(self, item_name: str, command: str) -> None:
-        """Set Item state"""
-        item = await self.hass.async_add_executor_job(self.async_get_item, item_name)
-        await item.update(command)
+        """Send a command to an item."""
+        if self.rest is not None:
+            try:
+                await self.rest.async_send_command(item_name, command)
+                return
+            except ApiClientAuthException as err:
+                self._disable_native(err)
+        await self.hass.async_add_executor_job(
+            self.openhab.req_post, f"/items/{item_name}", command
+        )
+
+    async def async_update_item(self, item_name: str, state: str) -> None:
+        """Update the state of an item."""
+        if self.rest is not None:
+            try:
+                await self.rest.async_update_state(item_name, state)
+                return
+            except ApiClientAuthException as err:
+                self._disable_native(err)
+        await self.hass.async_add_executor_job(
+            self.openhab.req_put, f"/items/{item_name}/state", state
+        )
@@ -4,7 +4,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import BINARY_SENSOR, DOMAIN, ITEMS_MAP
+from .const import BINARY_SENSOR, DOMAIN
 from .device_classes_map import BINARY_SENSOR_DEVICE_CLASS_MAP
 from .entity import OpenHABEntity
 
@@ -16,17 +16,14 @@ async def async_setup_entry(
 ) -> None:
     """Setup binary_sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    
-    binary_sensors = []
-    for item in coordinator.data.values():
-        if (item.type_ex == 'devireg_attr_ui_binary_sensor'):
-            binary_sensors.append(OpenHABBinarySensor(hass, coordinator, item))
-        elif ((item.type_ex == False) and (item.type_ in ITEMS_MAP[BINARY_SENSOR])):
-            binary_sensors.append(OpenHABBinarySensor(hass, coordinator, item))
-    
+
+    binary_sensors = coordinator.async_setup_platform(
+        BINARY_SENSOR,
+        lambda item: OpenHABBinarySensor(hass, coordinator, item),
+        async_add_devices,
+    )
     from .const import LOGGER
     LOGGER.info(f"Binary Sensor platform: Adding {len(binary_sensors)} binary sensor entities")
-    async_add_devices(binary_sensors)
 
 
 class OpenHABBinarySensor(OpenHABEntity, BinarySensorEntity):
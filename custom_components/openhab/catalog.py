@@ -0,0 +1,121 @@
+"""Indexed openHAB item catalog shared by all platform setups."""
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from .const import (
+    BINARY_SENSOR,
+    CLIMATE,
+    ITEMS_MAP,
+    SENSOR,
+    SWITCH,
+)
+from .store import StoredItem
+
+# Devireg classification done by fetch_all_items decides the platform first.
+TYPE_EX_PLATFORMS = {
+    "devireg_unit": CLIMATE,
+    "devireg_attr_ui_sensor": SENSOR,
+    "devireg_attr_ui_binary_sensor": BINARY_SENSOR,
+    "devireg_attr_ui_switch": SWITCH,
+}
+
+# Item type (or groupType of a typed group) -> platform.
+TYPE_PLATFORMS = {
+    item_type: platform
+    for platform, item_types in ITEMS_MAP.items()
+    for item_type in item_types
+}
+
+# Platforms that only take plain items; devireg attributes without a UI
+# classification stay hidden from them.
+PLAIN_ONLY_PLATFORMS = {BINARY_SENSOR, SENSOR, SWITCH}
+
+
+def classify(item: StoredItem) -> str | None:
+    """Return the single platform an item belongs to (None: no entity)."""
+    type_ex = getattr(item, "type_ex", False)
+    if platform := TYPE_EX_PLATFORMS.get(type_ex):
+        return platform
+    if item.type_ is None:
+        # Untyped groups are exposed as switches.
+        return SWITCH if item.group else None
+    platform = TYPE_PLATFORMS.get(item.type_)
+    if type_ex and platform in PLAIN_ONLY_PLATFORMS:
+        return None
+    return platform
+
+
+def _discard(
+    index: dict[str, list[StoredItem]], key: str | None, item: StoredItem
+) -> None:
+    """Remove an item from one index bucket."""
+    if bucket := index.get(key):
+        bucket[:] = [other for other in bucket if other is not item]
+        if not bucket:
+            del index[key]
+
+
+class ItemCatalog:
+    """Items indexed by type, type_ex, group membership, tags and platform.
+
+    Built once per full refresh; platforms read their pre-partitioned list
+    instead of scanning coordinator.data themselves.
+    """
+
+    def __init__(self, items: Iterable[StoredItem] = ()) -> None:
+        """Initialize the catalog."""
+        self.by_type: defaultdict[str | None, list[StoredItem]] = defaultdict(list)
+        self.by_type_ex: defaultdict[str, list[StoredItem]] = defaultdict(list)
+        self.by_tag: defaultdict[str, list[StoredItem]] = defaultdict(list)
+        self.groups: dict[str, StoredItem] = {}
+        self.members: defaultdict[str, list[StoredItem]] = defaultdict(list)
+        self.by_platform: defaultdict[str, list[StoredItem]] = defaultdict(list)
+        self.platform_of: dict[str, str | None] = {}
+        self._items: dict[str, StoredItem] = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item: StoredItem) -> str | None:
+        """Index an item and return its platform."""
+        self._items[item.name] = item
+        self.by_type[item.type_].append(item)
+        if type_ex := getattr(item, "type_ex", False):
+            self.by_type_ex[type_ex].append(item)
+        for tag in item.tags or ():
+            self.by_tag[tag].append(item)
+        if item.group:
+            self.groups[item.name] = item
+        for group in item.groupNames or ():
+            self.members[group].append(item)
+
+        platform = self.platform_of[item.name] = classify(item)
+        if platform is not None:
+            self.by_platform[platform].append(item)
+        return platform
+
+    def remove(self, item_name: str) -> StoredItem | None:
+        """Drop an item from every index (live catalog changes only)."""
+        item = self._items.pop(item_name, None)
+        if item is None:
+            return None
+        _discard(self.by_type, item.type_, item)
+        if type_ex := getattr(item, "type_ex", False):
+            _discard(self.by_type_ex, type_ex, item)
+        for tag in item.tags or ():
+            _discard(self.by_tag, tag, item)
+        self.groups.pop(item_name, None)
+        for group in item.groupNames or ():
+            _discard(self.members, group, item)
+        if (platform := self.platform_of.pop(item_name)) is not None:
+            _discard(self.by_platform, platform, item)
+        return item
+
+    def platform_items(self, platform: str) -> list[StoredItem]:
+        """Return the items assigned to a platform."""
+        return self.by_platform.get(platform, [])
+
+    def __len__(self) -> int:
+        """Return the number of indexed items."""
+        return len(self.platform_of)
@@ -16,7 +16,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.device_registry import DeviceEntryType
 
-from .const import DOMAIN, VERSION, NAME
+from .const import CLIMATE, DOMAIN, VERSION, NAME
 from .device_classes_map import SWITCH_DEVICE_CLASS_MAP
 from .entity import OpenHABEntity
 
@@ -41,10 +41,8 @@ async def async_setup_entry(
     """Setup sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_devices(
-        OpenHABClimate(hass, coordinator, item)
-        for item in coordinator.data.values()
-        if item.type_ex == 'devireg_unit'
+    coordinator.async_setup_platform(
+        CLIMATE, lambda item: OpenHABClimate(hass, coordinator, item), async_add_devices
     )
 
 
@@ -60,8 +58,8 @@ class OpenHABClimate(OpenHABEntity, ClimateEntity):
 
         return self.coordinator.is_online
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _device_info(self) -> DeviceInfo:
+        """Return the device of the devireg unit."""
         version = VERSION
         oh_version = self.coordinator.version
         if oh_version is not None:
@@ -181,10 +179,8 @@ class OpenHABClimate(OpenHABEntity, ClimateEntity):
         else:
             mode = 'Schedule'
 
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post,
-                f"/items/{self._id}_Mode",
-                str(mode),
+        await self.coordinator.async_send_command(
+            f"{self._id}_Mode", str(mode), str(mode)
         )
 
         await self.coordinator.async_request_refresh()
@@ -199,10 +195,8 @@ class OpenHABClimate(OpenHABEntity, ClimateEntity):
                 mode = m['value']
 
         if mode:
-            await self.hass.async_add_executor_job(
-                self.coordinator.api.openhab.req_post,
-                f"/items/{self._id}_Mode",
-                str(mode),
+            await self.coordinator.async_send_command(
+                f"{self._id}_Mode", str(mode), str(mode)
             )
 
             await self.coordinator.async_request_refresh()
@@ -214,9 +208,7 @@ class OpenHABClimate(OpenHABEntity, ClimateEntity):
 
         target_temp = self.target_temp_variable_by_state()
 
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post,
-                f"/items/{self._id}_{target_temp}",
-                str(kwargs['temperature'])
-            )
+        await self.coordinator.async_send_command(
+            f"{self._id}_{target_temp}", str(kwargs["temperature"])
+        )
         await self.coordinator.async_request_refresh()
@@ -0,0 +1,129 @@
+"""Per-item coalescing command pipeline for openHAB."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .metrics import OpenHABMetrics
+
+# Commands sent in parallel (for different items). The SSE stream keeps one
+# pooled connection, so this stays below the default pool limit.
+COMMAND_CONCURRENCY = 4
+
+
+class _QueuedCommand:
+    """The latest command waiting to be sent for one item."""
+
+    __slots__ = ("command", "expected", "future", "enqueued")
+
+    def __init__(
+        self, command: str, expected: str | None, future: asyncio.Future[None]
+    ) -> None:
+        self.command = command
+        self.expected = expected
+        self.future = future
+        self.enqueued = time.monotonic()
+
+
+class CommandPipeline:
+    """Send item commands with last-write-wins per item.
+
+    Each item has at most one command in flight and one queued. A newer
+    command replaces the queued one, and every caller whose command was
+    replaced is resolved together with the command that replaced it.
+    Commands for different items are sent concurrently, bounded by a
+    semaphore.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send: Callable[[str, str], Awaitable[None]],
+        metrics: OpenHABMetrics,
+        on_send: Callable[[str, str | None], None] | None = None,
+        concurrency: int = COMMAND_CONCURRENCY,
+    ) -> None:
+        """Initialize the pipeline.
+
+        on_send(item_name, expected_state) runs right before each request,
+        e.g. to arm echo suppression.
+        """
+        self._hass = hass
+        self._send = send
+        self._metrics = metrics
+        self._on_send = on_send
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._queued: dict[str, _QueuedCommand] = {}
+        self._workers: dict[str, asyncio.Task[None]] = {}
+
+    async def async_send(
+        self, item_name: str, command: str, expected_state: str | None = None
+    ) -> None:
+        """Queue a command and wait until it (or its replacement) was sent."""
+        queued = self._queued.get(item_name)
+        if queued is not None:
+            queued.command = command
+            queued.expected = expected_state
+            self._metrics.inc("commands_coalesced")
+        else:
+            future = self._hass.loop.create_future()
+            queued = self._queued[item_name] = _QueuedCommand(
+                command, expected_state, future
+            )
+            if item_name not in self._workers:
+                self._workers[item_name] = self._hass.async_create_background_task(
+                    self._async_worker(item_name), f"openhab command {item_name}"
+                )
+        # Shield: a cancelled caller must not cancel the shared command.
+        await asyncio.shield(queued.future)
+
+    async def _async_worker(self, item_name: str) -> None:
+        """Send the queued commands of one item, one at a time."""
+        try:
+            while item_name in self._queued:
+                async with self._semaphore:
+                    # Taken only once a slot is free, so the command stays
+                    # replaceable while it waits for one.
+                    queued = self._queued.pop(item_name)
+                    if self._on_send is not None:
+                        self._on_send(item_name, queued.expected)
+                    try:
+                        await self._send(item_name, queued.command)
+                    except Exception as err:  # noqa: BLE001
+                        self._metrics.inc("commands_failed")
+                        queued.future.set_exception(err)
+                        # Retrieved here so callers that went away don't log it.
+                        queued.future.exception()
+                    else:
+                        self._metrics.inc("commands_sent")
+                        queued.future.set_result(None)
+                    self._metrics.observe(
+                        "command_latency", time.monotonic() - queued.enqueued
+                    )
+        finally:
+            self._workers.pop(item_name, None)
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth, coalescing and latency figures."""
+        counters = self._metrics.counters
+        return {
+            "queue_depth": len(self._queued),
+            "in_flight": len(self._workers)
+            - sum(1 for item in self._workers if item in self._queued),
+            "sent": counters.get("commands_sent", 0),
+            "coalesced": counters.get("commands_coalesced", 0),
+            "failed": counters.get("commands_failed", 0),
+            "latency": self._metrics.percentiles("command_latency"),
+        }
+
+    async def async_shutdown(self) -> None:
+        """Cancel outstanding commands."""
+        for queued in self._queued.values():
+            queued.future.cancel()
+        self._queued.clear()
+        for task in list(self._workers.values()):
+            task.cancel()
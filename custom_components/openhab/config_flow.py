@@ -14,8 +14,23 @@ from .const import (
     CONF_AUTH_TYPE_BASIC,
     CONF_AUTH_TYPE_TOKEN,
     CONF_BASE_URL,
+    CONF_DIAGNOSTIC_INTERVAL,
     CONF_PASSWORD,
+    CONF_POOL_DNS_CACHE_TTL,
+    CONF_POOL_KEEPALIVE,
+    CONF_POOL_LIMIT,
+    CONF_SSE_COALESCE_WINDOW,
+    CONF_SSE_RECORD_SIZE,
+    CONF_SSE_SILENCE_TIMEOUT,
+    CONF_SSE_TOPIC_FILTER,
     CONF_USERNAME,
+    DEFAULT_DIAGNOSTIC_INTERVAL,
+    DEFAULT_POOL_DNS_CACHE_TTL,
+    DEFAULT_POOL_KEEPALIVE,
+    DEFAULT_POOL_LIMIT,
+    DEFAULT_SSE_COALESCE_WINDOW,
+    DEFAULT_SSE_RECORD_SIZE,
+    DEFAULT_SSE_SILENCE_TIMEOUT,
     DOMAIN,
     LOGGER,
     PLATFORMS,
@@ -165,12 +180,60 @@ class OpenHABOptionsFlowHandler(config_entries.OptionsFlow):
                 data=self.options,
             )
 
+        schema = {
+            vol.Required(x, default=self.options.get(x, True)): bool
+            for x in sorted(PLATFORMS)
+        }
+        schema.update(
+            {
+                vol.Required(
+                    CONF_POOL_LIMIT,
+                    default=self.options.get(CONF_POOL_LIMIT, DEFAULT_POOL_LIMIT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=2, max=100)),
+                vol.Required(
+                    CONF_POOL_KEEPALIVE,
+                    default=self.options.get(
+                        CONF_POOL_KEEPALIVE, DEFAULT_POOL_KEEPALIVE
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Required(
+                    CONF_POOL_DNS_CACHE_TTL,
+                    default=self.options.get(
+                        CONF_POOL_DNS_CACHE_TTL, DEFAULT_POOL_DNS_CACHE_TTL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                vol.Required(
+                    CONF_SSE_TOPIC_FILTER,
+                    default=self.options.get(CONF_SSE_TOPIC_FILTER, True),
+                ): bool,
+                vol.Required(
+                    CONF_SSE_COALESCE_WINDOW,
+                    default=self.options.get(
+                        CONF_SSE_COALESCE_WINDOW, DEFAULT_SSE_COALESCE_WINDOW
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+                vol.Required(
+                    CONF_SSE_SILENCE_TIMEOUT,
+                    default=self.options.get(
+                        CONF_SSE_SILENCE_TIMEOUT, DEFAULT_SSE_SILENCE_TIMEOUT
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=15, max=600)),
+                vol.Required(
+                    CONF_DIAGNOSTIC_INTERVAL,
+                    default=self.options.get(
+                        CONF_DIAGNOSTIC_INTERVAL, DEFAULT_DIAGNOSTIC_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                vol.Required(
+                    CONF_SSE_RECORD_SIZE,
+                    default=self.options.get(
+                        CONF_SSE_RECORD_SIZE, DEFAULT_SSE_RECORD_SIZE
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000000)),
+            }
+        )
+
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(x, default=self.options.get(x, True)): bool
-                    for x in sorted(PLATFORMS)
-                }
-            ),
+            data_schema=vol.Schema(schema),
         )
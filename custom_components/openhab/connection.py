@@ -0,0 +1,80 @@
+"""Shared HTTP connection pool for an openHAB config entry."""
+from __future__ import annotations
+
+from typing import Any
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import (
+    DEFAULT_POOL_DNS_CACHE_TTL,
+    DEFAULT_POOL_KEEPALIVE,
+    DEFAULT_POOL_LIMIT,
+)
+
+
+class OpenHABConnectionPool:
+    """One keep-alive connection pool shared by SSE, polling and commands."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        limit: int = DEFAULT_POOL_LIMIT,
+        keepalive_timeout: float = DEFAULT_POOL_KEEPALIVE,
+        dns_cache_ttl: int = DEFAULT_POOL_DNS_CACHE_TTL,
+    ) -> None:
+        """Initialize the pool.
+
+        The SSE stream permanently holds one connection, so the limit is
+        never allowed to drop below two.
+        """
+        self.limit = max(int(limit), 2)
+        self._connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit,
+            keepalive_timeout=keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=dns_cache_ttl,
+        )
+        self.session = aiohttp.ClientSession(connector=self._connector)
+        self._hass = hass
+        self._unsub_stop = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, self._async_close_on_stop
+        )
+
+    @callback
+    def _async_close_on_stop(self, event: Event) -> None:
+        """Close the session when Home Assistant shuts down."""
+        self._unsub_stop = None
+        self._hass.async_create_task(self.async_close())
+
+    def stats(self) -> dict[str, Any]:
+        """Return open, idle and waiting connection counts.
+
+        aiohttp does not expose pool statistics publicly, so the connector
+        internals are read defensively.
+        """
+        connector = self._connector
+        idle = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+        in_use = len(getattr(connector, "_acquired", ()))
+        waiting = sum(
+            len(waiters) for waiters in getattr(connector, "_waiters", {}).values()
+        )
+        return {
+            "limit": self.limit,
+            "open": idle + in_use,
+            "idle": idle,
+            "in_use": in_use,
+            "waiting": waiting,
+            "closed": self.session.closed,
+        }
+
+    async def async_close(self) -> None:
+        """Close the session and all pooled connections."""
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        if not self.session.closed:
+            await self.session.close()
@@ -32,13 +32,34 @@ CONF_AUTH_TYPE = "auth_type"
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 CONF_AUTH_TOKEN = "auth_token"
+CONF_POOL_LIMIT = "pool_limit"
+CONF_POOL_KEEPALIVE = "pool_keepalive"
+CONF_POOL_DNS_CACHE_TTL = "pool_dns_cache_ttl"
+CONF_SSE_TOPIC_FILTER = "sse_topic_filter"
+CONF_SSE_COALESCE_WINDOW = "sse_coalesce_window"
+CONF_SSE_SILENCE_TIMEOUT = "sse_silence_timeout"
+CONF_DIAGNOSTIC_INTERVAL = "diagnostic_interval"
+CONF_SSE_RECORD_SIZE = "sse_record_size"
 CONF_AUTH_TYPE_BASIC = "OAuth2"
 CONF_AUTH_TYPE_TOKEN = "token"
 
 AUTH_TYPES = [CONF_AUTH_TYPE_BASIC, CONF_AUTH_TYPE_TOKEN]
 
+# Services
+SERVICE_PROFILE = "profile"
+SERVICE_SAVE_SSE_RECORDING = "save_sse_recording"
+ATTR_DURATION = "duration"
+
 # Defaults
 DEFAULT_NAME = DOMAIN
+DEFAULT_POOL_LIMIT = 10
+DEFAULT_POOL_KEEPALIVE = 30
+DEFAULT_POOL_DNS_CACHE_TTL = 300
+DEFAULT_SSE_COALESCE_WINDOW = 50  # milliseconds, 0 disables coalescing
+DEFAULT_SSE_SILENCE_TIMEOUT = 30  # seconds; openHAB sends ALIVE every 10 s
+DEFAULT_DIAGNOSTIC_INTERVAL = 30  # seconds between performance sensor writes
+DEFAULT_PROFILE_DURATION = 30  # seconds
+DEFAULT_SSE_RECORD_SIZE = 0  # raw SSE chunks kept for replay, 0 disables
 
 ITEMS_MAP = {
     BINARY_SENSOR: ["Contact"],
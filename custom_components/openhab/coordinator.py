@@ -1,19 +1,87 @@
 """Data update coordinator for integration openHAB."""
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Callable, Mapping
 from typing import Any
 import asyncio
 import aiohttp
 import json
+import random
 import time
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.debounce import Debouncer
 
 from .api import ApiClientException, OpenHABApiClient
-from .const import DATA_COORDINATOR_UPDATE_INTERVAL, DOMAIN, LOGGER
+from .catalog import ItemCatalog
+from .const import (
+    CONF_SSE_COALESCE_WINDOW,
+    CONF_SSE_RECORD_SIZE,
+    CONF_SSE_SILENCE_TIMEOUT,
+    CONF_SSE_TOPIC_FILTER,
+    DATA_COORDINATOR_UPDATE_INTERVAL,
+    DEFAULT_SSE_COALESCE_WINDOW,
+    DEFAULT_SSE_SILENCE_TIMEOUT,
+    DOMAIN,
+    LOGGER,
+)
+from .commands import CommandPipeline
+from .echo import EchoSuppressor
+from .metrics import OpenHABMetrics
+from .profiling import PhaseTimer
+from .recorder import RECORDING_SUFFIX, SSERecorder
+from .snapshot import CatalogSnapshot, catalog_signature
+from .store import StoredItem, merge_items
+from .things import ThingStatusIndex
+from .sse import SSEDecoder, build_topic_filter
+
+# Event types consumed from the SSE stream; everything else is filtered out
+# server-side through the ``topics`` parameter.
+SSE_STATE_EVENTS = ("ItemStateChangedEvent", "ItemStateUpdatedEvent")
+SSE_CATALOG_EVENTS = ("ItemAddedEvent", "ItemRemovedEvent", "ItemUpdatedEvent")
+SSE_THING_EVENTS = ("ThingStatusInfoChangedEvent",)
+SSE_CONSUMED_EVENTS = SSE_STATE_EVENTS + SSE_CATALOG_EVENTS + SSE_THING_EVENTS
+
+# SSE reconnect backoff: BASE * 2^attempt seconds, capped, with jitter so
+# several Home Assistant instances don't reconnect in lockstep.
+SSE_BACKOFF_BASE = 1.0
+SSE_BACKOFF_CAP = 120.0
+# Read timeout before the first keepalive proves the server sends them.
+SSE_LEGACY_SOCK_READ = 300
+
+# Lower bound of the optimistic rollback timeout; above it the adaptive echo
+# window (derived from the measured command round trip) is used.
+OPTIMISTIC_TIMEOUT = 1.0
+
+# Refresh timing breakdowns kept for diagnostics.
+REFRESH_TIMINGS_KEPT = 10
+
+
+class OptimisticState:
+    """An expected state shown before openHAB confirmed it.
+
+    The rollback timer is only armed once the command was sent, so waiting
+    for a pipeline slot or a slow request does not count against it.
+    """
+
+    __slots__ = ("previous", "expected", "timer")
+
+    def __init__(self, previous: str, expected: str) -> None:
+        self.previous = previous
+        self.expected = expected
+        self.timer: asyncio.TimerHandle | None = None
+
+    def cancel(self) -> None:
+        """Cancel the rollback timer, if armed."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
 
 
 class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
@@ -28,19 +96,30 @@ class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
         self.version: str = ""
         self.is_online = False
         self.ha_items = {}
+        self.catalog = ItemCatalog()
+        self.things = ThingStatusIndex()
+        # Entity factories registered by the platforms, used to add entities
+        # for items created in openHAB while the integration is running.
+        self._platform_adders: dict[
+            str, tuple[Callable[[Any], Entity], AddEntitiesCallback]
+        ] = {}
+        self._catalog_lock = asyncio.Lock()
+        # Per-item listener registry: SSE state events only wake the entities
+        # subscribed to the affected item instead of every coordinator listener.
+        self._item_listeners: dict[str, list[CALLBACK_TYPE]] = {}
         self._sse_listener_task = None
         self._stop_sse = False
-        self._sse_session = None
+        self.metrics = OpenHABMetrics()
+        self.sse_topics: str | None = None
         self._sse_started = False
 
-        # Echo suppression: tracks commands explicitly sent by this integration.
-        # Populated via track_ha_command() which entity platforms call right
-        # before they send a command through the HA REST API.  SSE-based
-        # ItemCommandEvents are NOT used for this because the SSE stream does
-        # not expose a reliable source field to distinguish HA-originated
-        # commands from external ones (openHAB rules, other integrations, etc.).
-        self._recent_commands: dict[str, float] = {}
-        self._command_ignore_duration = 2.0  # seconds
+        # Echo suppression: tracks commands explicitly sent by this integration
+        # (see track_ha_command()). SSE ItemCommandEvents are NOT used for this
+        # because the stream does not expose a reliable source field.
+        self.echo = EchoSuppressor(self.metrics)
+        self.commands = CommandPipeline(
+            hass, api.async_send_command, self.metrics, on_send=self.track_ha_command
+        )
 
         # Fallback debouncer: only used when direct SSE state update fails
         # (unknown item, parse error) to trigger a full API refresh.
@@ -61,27 +140,355 @@ class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=DATA_COORDINATOR_UPDATE_INTERVAL,
         )
 
+        # Coalescing stage: state events are collected for a short window and
+        # only the latest payload per item is applied, bounding state writes
+        # to one per item per window during event storms.
+        self.coalesce_window: float = (
+            self.options.get(CONF_SSE_COALESCE_WINDOW, DEFAULT_SSE_COALESCE_WINDOW)
+            / 1000
+        )
+        self._pending_states: dict[str, str] = {}
+        self._pending_events = 0
+        self._pending_since = 0.0
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+        # Opt-in ring buffer of raw SSE chunks for offline replay.
+        self.recorder: SSERecorder | None = None
+        if record_size := self.options.get(CONF_SSE_RECORD_SIZE, 0):
+            self.recorder = SSERecorder(record_size)
+
+        # Optimistic states awaiting their SSE confirmation, by item name.
+        self._optimistic: dict[str, OptimisticState] = {}
+
+        # Connection health: watchdog on keepalive silence and downtime.
+        self.silence_timeout: float = self.options.get(
+            CONF_SSE_SILENCE_TIMEOUT, DEFAULT_SSE_SILENCE_TIMEOUT
+        )
+        self.sse_connected = False
+        self._disconnected_since: float | None = time.monotonic()
+        self._disconnected_total = 0.0
+        self._backoff_attempt = 0
+
+        # Catalog snapshot: lets setup create entities before openHAB answers.
+        self.snapshot: CatalogSnapshot | None = None
+        if self.config_entry is not None:
+            self.snapshot = CatalogSnapshot(hass, self.config_entry.entry_id)
+        self._snapshot_signature: frozenset | None = None
+
+        # Timing breakdowns and the last on-demand profile, for diagnostics.
+        self.setup_timer = PhaseTimer("setup")
+        self.refresh_timings: deque[PhaseTimer] = deque(maxlen=REFRESH_TIMINGS_KEPT)
+        self.last_profile: dict[str, Any] | None = None
+
+        # State writes done and skipped (unchanged fingerprint) by the entities
+        # during the last broadcast to all listeners.
+        self.last_refresh_writes: dict[str, int] = {"written": 0, "skipped": 0}
+
+    @property
+    def options(self) -> Mapping[str, Any]:
+        """Return the config entry options (empty outside a config entry)."""
+        if self.config_entry is None:
+            return {}
+        return self.config_entry.options
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Broadcast a refresh and count the state writes it caused."""
+        counters = self.metrics.counters
+        written = counters["refresh_writes"]
+        skipped = counters["refresh_writes_skipped"]
+        super().async_update_listeners()
+        self.last_refresh_writes = {
+            "written": counters["refresh_writes"] - written,
+            "skipped": counters["refresh_writes_skipped"] - skipped,
+        }
+
+    def sse_stats(self) -> dict[str, Any]:
+        """Return SSE throughput, split into consumed and ignored traffic."""
+        metrics = self.metrics
+        return {
+            "topic_filter": self.sse_topics,
+            "bytes_per_s": round(metrics.rate("sse_bytes"), 1),
+            "events_per_s": round(metrics.rate("sse_events"), 2),
+            "ignored_bytes_per_s": round(metrics.rate("sse_bytes_ignored"), 1),
+            "ignored_events_per_s": round(metrics.rate("sse_events_ignored"), 2),
+            "coalesce_window_ms": round(self.coalesce_window * 1000),
+            "coalesce_ratio": self.coalesce_ratio(),
+            "coalesce_batches": metrics.counters.get("coalesce_batches", 0),
+            "events_applied": metrics.counters.get("sse_events_applied", 0),
+            "events_skipped_unchanged": metrics.counters.get("sse_events_skipped", 0),
+            "connected": self.sse_connected,
+            "disconnected_for_s": round(self.disconnected_for(), 1),
+            "disconnected_total_s": round(
+                self._disconnected_total + self.disconnected_for(), 1
+            ),
+            "disconnects": metrics.counters.get("sse_disconnects", 0),
+            "watchdog_timeouts": metrics.counters.get("sse_watchdog_timeouts", 0),
+            "silence_timeout_s": self.silence_timeout,
+            "downtime": metrics.percentiles("sse_downtime"),
+        }
+
+    def disconnected_for(self) -> float:
+        """Return seconds since the SSE stream was lost (0 when connected)."""
+        if self._disconnected_since is None:
+            return 0.0
+        return time.monotonic() - self._disconnected_since
+
+    def _sse_backoff(self, server_retry: float | None) -> float:
+        """Return the next reconnect delay (exponential, capped, jittered)."""
+        base = server_retry if server_retry is not None else SSE_BACKOFF_BASE
+        delay = min(SSE_BACKOFF_CAP, base * 2**self._backoff_attempt)
+        self._backoff_attempt += 1
+        # Equal jitter: never below half the delay, spread over the rest.
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    @callback
+    def _sse_connected(self) -> None:
+        """Record the end of a disconnected period."""
+        self.sse_connected = True
+        if self._disconnected_since is not None:
+            downtime = time.monotonic() - self._disconnected_since
+            self._disconnected_total += downtime
+            self.metrics.observe("sse_downtime", downtime)
+            self._disconnected_since = None
+
+    @callback
+    def _sse_disconnected(self) -> None:
+        """Record the start of a disconnected period."""
+        if self.sse_connected:
+            self.metrics.inc("sse_disconnects")
+        self.sse_connected = False
+        if self._disconnected_since is None:
+            self._disconnected_since = time.monotonic()
+
+    def coalesce_ratio(self) -> float | None:
+        """Return how many SSE state events were folded into one write."""
+        applied = self.metrics.counters.get("coalesce_items_out", 0)
+        if not applied:
+            return None
+        return round(self.metrics.counters["coalesce_events_in"] / applied, 2)
+
+    async def async_start_from_snapshot(self) -> bool:
+        """Load the stored catalog so platforms can be set up from it.
+
+        Returns False when there is no snapshot and setup has to wait for a
+        regular first refresh. Entities stay unavailable (is_online False)
+        until async_start_reconcile() has reached openHAB.
+        """
+        if self.snapshot is None:
+            return False
+        with self.setup_timer.phase("snapshot_load"):
+            cached = await self.snapshot.async_load()
+        if cached is None:
+            return False
+
+        self.version, self.data = cached
+        with self.setup_timer.phase("catalog"):
+            self.catalog = ItemCatalog(self.data.values())
+        self._snapshot_signature = catalog_signature(self.data)
+        LOGGER.info("Started from catalog snapshot with %d items", len(self.data))
+        return True
+
+    @callback
+    def async_start_reconcile(self) -> None:
+        """Refresh a snapshot-started catalog in the background.
+
+        Call after platform setup: a changed catalog is applied through the
+        platform adders, which only exist once the platforms are set up.
+        """
+        self.config_entry.async_create_background_task(
+            self.hass, self.async_refresh(), "openhab catalog reconcile"
+        )
+
+    async def _async_apply_catalog_diff(
+        self, old: ItemCatalog, items: dict[str, StoredItem]
+    ) -> None:
+        """Add, remove and move entities whose platform changed since old."""
+        missing = object()
+        new = self.catalog.platform_of
+        for item_name, platform in old.platform_of.items():
+            if new.get(item_name, missing) != platform:
+                await self._async_remove_entity(item_name)
+        for item_name, platform in new.items():
+            if old.platform_of.get(item_name, missing) == platform:
+                continue
+            if adder := self._platform_adders.get(platform):
+                factory, async_add_entities = adder
+                async_add_entities([factory(items[item_name])])
+        LOGGER.info("Applied item catalog changes since the snapshot")
+
+    async def async_save_recording(self) -> str | None:
+        """Write the recorded SSE chunks and item catalog to a file.
+
+        Returns the path, or None when recording is disabled.
+        """
+        if self.recorder is None:
+            return None
+        capture = self.recorder.capture(self.data or {}, self.version)
+        entry_id = self.config_entry.entry_id if self.config_entry else DOMAIN
+        path = self.hass.config.path(
+            f"openhab_{entry_id}_{time.strftime('%Y%m%d_%H%M%S')}{RECORDING_SUFFIX}"
+        )
+        await self.hass.async_add_executor_job(self.recorder.save, path, *capture)
+        LOGGER.info("Saved %d recorded SSE chunks to %s", len(capture[2]), path)
+        return path
+
     async def _async_refresh_debounced(self) -> None:
         """Debounced full API refresh (fallback path only)."""
+        self.metrics.inc("fallback_refreshes")
         await self.async_request_refresh()
 
     # ------------------------------------------------------------------
     # Public API for entity platforms
     # ------------------------------------------------------------------
 
-    def track_ha_command(self, item_name: str) -> None:
+    def track_ha_command(
+        self, item_name: str, expected_state: str | None = None
+    ) -> None:
         """Record that this integration just sent a command for item_name.
 
         Call this immediately before sending a command via the openHAB REST API
-        so that the resulting ItemStateChangedEvent/ItemStateUpdatedEvent from
-        the SSE stream can be identified as an echo and suppressed.
+        so that stale echoes of it on the SSE stream can be recognised.
+        expected_state is the raw state the command should produce.
+        """
+        self.echo.track(item_name, expected_state)
+        LOGGER.debug(
+            "Echo suppression armed for %s=%s (%.2fs window)",
+            item_name,
+            expected_state,
+            self.echo.window,
+        )
+
+    @callback
+    def async_setup_platform(
+        self,
+        platform: str,
+        factory: Callable[[Any], Entity],
+        async_add_entities: AddEntitiesCallback,
+    ) -> list[Entity]:
+        """Add the entities of a platform and keep its factory for live additions."""
+        self._platform_adders[platform] = (factory, async_add_entities)
+        with self.setup_timer.phase(f"platform_{platform}"):
+            entities = [factory(item) for item in self.catalog.platform_items(platform)]
+            async_add_entities(entities)
+        return entities
+
+    async def async_send_command(
+        self, item_name: str, command: str, expected_state: str | None = None
+    ) -> None:
+        """Send a command through the coalescing command pipeline.
+
+        expected_state is the raw state the command should produce; leave it
+        None when it cannot be predicted. When given, it is shown right away
+        and rolled back unless openHAB confirms it in time after sending.
+        """
+        optimistic = None
+        if expected_state is not None:
+            optimistic = self._apply_optimistic(item_name, expected_state)
+        try:
+            await self.commands.async_send(item_name, command, expected_state)
+        except Exception:
+            if optimistic is not None:
+                self._rollback_optimistic(item_name, optimistic)
+            raise
+        # Still unconfirmed and not superseded: openHAB has it now.
+        if optimistic is not None and self._optimistic.get(item_name) is optimistic:
+            optimistic.timer = self.hass.loop.call_later(
+                max(self.echo.window, OPTIMISTIC_TIMEOUT),
+                self._rollback_optimistic,
+                item_name,
+                optimistic,
+            )
+
+    @callback
+    def _apply_optimistic(
+        self, item_name: str, expected: str
+    ) -> OptimisticState | None:
+        """Write the expected state of a command before openHAB confirms it.
+
+        Returns the pending entry, so a failed send only rolls back its own.
+        """
+        item = self.data.get(item_name) if self.data else None
+        if item is None:
+            return None
+        pending = self._optimistic.pop(item_name, None)
+        if pending is not None:
+            # Keep rolling back to the last confirmed state.
+            pending.cancel()
+            previous = pending.previous
+        elif item._raw_state == expected:
+            return None
+        else:
+            previous = item._raw_state
+        if not self._update_item_state(item_name, expected):
+            return None
+
+        # An older value waiting in the coalescing window must not undo it.
+        self._pending_states.pop(item_name, None)
+        state = OptimisticState(previous, expected)
+        self._optimistic[item_name] = state
+        self.metrics.inc("optimistic_applied")
+        self.async_notify_item(item_name)
+        return state
+
+    @callback
+    def _rollback_optimistic(
+        self, item_name: str, state: OptimisticState | None = None
+    ) -> None:
+        """Restore the confirmed state when no confirmation arrived.
+
+        With state given, only that entry is rolled back; a newer command
+        that superseded it keeps its optimistic state.
         """
-        self._recent_commands[item_name] = time.time()
+        pending = self._optimistic.get(item_name)
+        if pending is None or (state is not None and pending is not state):
+            return
+        del self._optimistic[item_name]
+        pending.cancel()
+        item = self.data.get(item_name) if self.data else None
+        # Something else (refresh, external change) already replaced it.
+        if item is None or item._raw_state != pending.expected:
+            return
         LOGGER.debug(
-            "Echo suppression armed for %s (%.1fs window)",
+            "No confirmation for %s=%s - rolling back to %s",
             item_name,
-            self._command_ignore_duration,
+            pending.expected,
+            pending.previous,
         )
+        self.metrics.inc("optimistic_rollbacks")
+        if self._update_item_state(item_name, pending.previous):
+            self.async_notify_item(item_name)
+
+    @callback
+    def async_add_item_listener(
+        self, item_name: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for state changes of a single item.
+
+        Returns a callable that removes the listener again.
+        """
+        self._item_listeners.setdefault(item_name, []).append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners = self._item_listeners.get(item_name)
+            if not listeners:
+                return
+            if update_callback in listeners:
+                listeners.remove(update_callback)
+            if not listeners:
+                del self._item_listeners[item_name]
+
+        return remove_listener
+
+    @callback
+    def async_notify_item(self, item_name: str) -> None:
+        """Notify only the listeners subscribed to item_name."""
+        listeners = self._item_listeners.get(item_name)
+        if not listeners:
+            return
+        for update_callback in list(listeners):
+            update_callback()
 
     # ------------------------------------------------------------------
     # SSE startup / polling management
@@ -107,9 +514,10 @@ class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
 
         Called from SSE error paths (non-200 response, connection exception) so
         that entities are kept up-to-date while the SSE listener retries.
-        Restoring update_interval alone is not enough - we also trigger an
-        immediate refresh so the HA scheduler re-arms itself at the end of that
-        refresh cycle.
+        Restoring update_interval alone is not enough - the HA scheduler must
+        be re-armed as well. The first poll only runs after a full interval:
+        short SSE drops are covered by the state resync on reconnect instead
+        of a full catalog fetch per drop.
         """
         if self.update_interval is None:
             self.update_interval = DATA_COORDINATOR_UPDATE_INTERVAL
@@ -117,65 +525,53 @@ class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
                 "SSE unavailable - polling re-enabled at %s interval",
                 DATA_COORDINATOR_UPDATE_INTERVAL,
             )
-            # async_request_refresh() re-schedules the next poll at the end of
-            # _async_refresh(), which honours the restored update_interval.
-            self.hass.async_create_task(self.async_request_refresh())
+            self._schedule_refresh()
 
     # ------------------------------------------------------------------
     # Direct state injection
     # ------------------------------------------------------------------
 
-    def _update_item_from_sse_payload(self, item_name: str, payload_str: str) -> bool:
-        """Parse SSE event payload and update the item state in self.data directly.
+    def _update_item_state(self, item_name: str, raw_value: str) -> bool:
+        """Update the item state in self.data directly from a raw SSE value.
 
         Returns True when the item was found and updated successfully.
         No API call is made; self.data is mutated in-place and callers
-        must follow up with async_set_updated_data(self.data).
+        must follow up with async_notify_item(item_name).
 
-        Exception handling policy for item._parse_value():
-        - NotImplementedError / AttributeError: item type has no _parse_value
-          implementation (e.g. bare GroupItem); store raw string as graceful
-          degradation and return True so the caller does NOT fall back to a
-          full API refresh (the entity will display the raw value).
+        Exception handling policy for item._parse_rest():
+        - NotImplementedError / AttributeError: item type has no _parse_rest
+          implementation; store raw string as graceful degradation and return
+          True so the caller does NOT fall back to a full API refresh (the
+          entity will display the raw value).
         - ValueError / TypeError: the value string is present but malformed for
-          this item type; propagate to the outer handler so the method returns
-          False and the fallback API refresh runs.
-        - Any other Exception from json.loads / payload parsing: caught by the
-          outer handler; return False to trigger the fallback refresh.
+          this item type; return False so the fallback API refresh runs.
         """
         if not self.data or item_name not in self.data:
             return False
 
+        item = self.data[item_name]
         try:
-            payload = json.loads(payload_str)
-            raw_value = payload.get("value")
-            if raw_value is None:
-                return False
-
-            item = self.data[item_name]
             item._raw_state = raw_value
-
-            try:
-                # Each Item subclass implements _parse_value() to convert the
-                # raw string to the typed _state representation.
-                item._state = item._parse_value(raw_value)
-            except (NotImplementedError, AttributeError):
-                # Item type has no _parse_value; store raw string as fallback.
-                item._state = raw_value
-            # ValueError / TypeError are intentionally NOT caught here so they
-            # propagate to the outer except and cause this method to return False.
-
-            LOGGER.debug("SSE direct update: %s = %s", item_name, raw_value)
-            return True
-
-        except Exception as err:  # noqa: BLE001
+            if item.is_undefined(raw_value):
+                item._state = None
+            else:
+                # Each Item subclass implements _parse_rest() to convert the
+                # raw string to the typed _state and the unit of measure.
+                item._state, item._unitOfMeasure = item._parse_rest(raw_value)
+        except (NotImplementedError, AttributeError):
+            # Item type cannot parse values; store raw string as fallback.
+            item._state = raw_value
+        except (ValueError, TypeError) as err:
             LOGGER.debug(
-                "Could not parse SSE payload for item %s: %s",
+                "Could not parse SSE value for item %s: %s",
                 item_name,
                 err,
             )
             return False
 
+        LOGGER.debug("SSE direct update: %s = %s", item_name, raw_value)
+        return True
+
     # ------------------------------------------------------------------
     # SSE listener
     # ------------------------------------------------------------------
@@ -184,30 +580,47 @@ class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
         """Listen to openHAB SSE events and update entity states in real-time."""
         sse_url = f"{self.api._rest_url}/events"
 
-        headers = {}
-        if self.api._auth_type == "token" and self.api._auth_token:
-            headers["X-OPENHAB-TOKEN"] = self.api._auth_token
+        headers = self.api.auth_headers()
+
+        params = None
+        if self.options.get(CONF_SSE_TOPIC_FILTER, True):
+            self.sse_topics = build_topic_filter(SSE_CONSUMED_EVENTS)
+            params = {"topics": self.sse_topics}
 
-        retry_delay = 5
+        server_retry: float | None = None
         first_connect = True
+        decoder = SSEDecoder()
 
         while not self._stop_sse:
+            watchdog = None
             try:
-                auth = None
-                if self.api._auth_type == "OAuth2" and self.api._username:
-                    auth = aiohttp.BasicAuth(self.api._username, self.api._password)
-
-                if not self._sse_session:
-                    self._sse_session = aiohttp.ClientSession()
+                auth = self.api.basic_auth()
 
                 LOGGER.debug("Connecting to SSE endpoint: %s", sse_url)
 
-                async with self._sse_session.get(
+                resume_id = decoder.last_event_id
+                request_headers = headers
+                if resume_id:
+                    request_headers = {**headers, "Last-Event-ID": resume_id}
+
+                async with self.api.session.get(
                     sse_url,
-                    headers=headers,
+                    params=params,
+                    headers=request_headers,
                     auth=auth,
-                    timeout=aiohttp.ClientTimeout(total=None, sock_read=300),
+                    timeout=aiohttp.ClientTimeout(
+                        total=None, sock_read=SSE_LEGACY_SOCK_READ
+                    ),
                 ) as response:
+                    if response.status == 400 and params is not None:
+                        # Older servers may reject the filter; stream unfiltered.
+                        LOGGER.warning(
+                            "openHAB rejected SSE topic filter %s - "
+                            "subscribing without filter",
+                            self.sse_topics,
+                        )
+                        params = self.sse_topics = None
+                        continue
 
                     if response.status != 200:
                         error_text = await response.text()
@@ -218,13 +631,16 @@ class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
                         )
                         # Re-enable polling so entities are updated while retrying.
                         self._enable_polling()
-                        await asyncio.sleep(retry_delay)
+                        await asyncio.sleep(self._sse_backoff(server_retry))
                         continue
 
+                    self._sse_connected()
+
                     # Connection confirmed - disable polling now that SSE is live.
                     if self.update_interval is not None:
                         self.update_method = None
                         self.update_interval = None
+                        self._unschedule_refresh()
                         LOGGER.info(
                             "SSE connection established - polling disabled, "
                             "SSE is the sole update source"
@@ -232,92 +648,127 @@ class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
                     else:
                         LOGGER.info("SSE reconnected")
 
-                    # After a reconnect, fetch fresh data from the API to catch
-                    # any state changes that occurred while SSE was disconnected.
+                    # After a reconnect, catch up on state changes that occurred
+                    # while SSE was disconnected. Last-Event-ID is sent, but
+                    # nothing confirms the server (or a proxy adding ids)
+                    # resumed from it, so a name/state-only fetch is always
+                    # diffed against self.data; replayed events are skipped
+                    # as unchanged.
                     if not first_connect:
-                        LOGGER.info("SSE reconnected - triggering full refresh")
-                        await self._refresh_debouncer.async_call()
+                        LOGGER.info("SSE reconnected - resyncing item states")
+                        self.hass.async_create_task(self._async_resync_states())
                     first_connect = False
 
-                    event_data: dict = {}
-
-                    async for line in response.content:
-                        if self._stop_sse:
-                            break
-
-                        try:
-                            decoded = line.decode("utf-8").strip()
-
-                            if not decoded:
-                                # Empty line = end of one SSE event block
-                                if event_data:
-                                    await self._process_sse_event(event_data)
-                                    event_data = {}
-                                continue
-
-                            if ":" in decoded:
-                                field, _, value = decoded.partition(":")
-                                field = field.strip()
-                                value = value.strip()
-
-                                if field == "data":
-                                    try:
-                                        data = json.loads(value)
-                                        event_data.update(data)
-                                    except json.JSONDecodeError:
-                                        pass
-                                elif field in ("event", "id"):
-                                    event_data[field] = value
-
-                        except Exception as err:  # noqa: BLE001
-                            LOGGER.debug("Error processing SSE line: %s", err)
+                    decoder.reset()
+
+                    loop = self.hass.loop
+                    # Watchdog: armed by the first ALIVE frame, pushed back by
+                    # every chunk; a half-open connection trips it after
+                    # silence_timeout instead of the 300 s read timeout.
+                    alive_seen = False
+                    async with asyncio.timeout(None) as watchdog:
+                        async for chunk in response.content.iter_any():
+                            if self._stop_sse:
+                                break
+                            if alive_seen:
+                                watchdog.reschedule(loop.time() + self.silence_timeout)
+                            alive = await self._process_sse_chunk(decoder, chunk)
+                            if alive and not alive_seen:
+                                alive_seen = True
+                                watchdog.reschedule(loop.time() + self.silence_timeout)
+
+                    if decoder.retry is not None:
+                        # The server's requested delay becomes the backoff base.
+                        server_retry = decoder.retry / 1000
+                    self._sse_disconnected()
+                    if not self._stop_sse:
+                        LOGGER.info("SSE stream closed by openHAB - reconnecting")
+                        await asyncio.sleep(self._sse_backoff(server_retry))
 
             except asyncio.CancelledError:
                 LOGGER.info("SSE listener cancelled")
                 break
 
             except Exception as err:  # noqa: BLE001
+                self._sse_disconnected()
                 if not self._stop_sse:
-                    LOGGER.warning(
-                        "SSE connection error: %s (retrying in %s seconds)",
-                        err,
-                        retry_delay,
-                    )
+                    delay = self._sse_backoff(server_retry)
+                    # Read and connect timeouts are TimeoutErrors as well;
+                    # only an expired watchdog means a silent stream.
+                    if watchdog is not None and watchdog.expired():
+                        self.metrics.inc("sse_watchdog_timeouts")
+                        LOGGER.warning(
+                            "No data from openHAB SSE stream for %ss - "
+                            "reconnecting in %.1f seconds",
+                            self.silence_timeout,
+                            delay,
+                        )
+                    else:
+                        LOGGER.warning(
+                            "SSE connection error: %s (retrying in %.1f seconds)",
+                            err or type(err).__name__,
+                            delay,
+                        )
                     # Re-enable polling so entities are updated while retrying.
                     self._enable_polling()
-                    await asyncio.sleep(retry_delay)
+                    await asyncio.sleep(delay)
 
+        self._sse_disconnected()
         LOGGER.info("SSE listener stopped")
 
+    async def _process_sse_chunk(self, decoder: SSEDecoder, chunk: bytes) -> bool:
+        """Decode one received chunk and process its frames.
+
+        Returns True when the chunk contained an ALIVE keepalive.
+        """
+        if self.recorder is not None:
+            self.recorder.record(chunk)
+        metrics = self.metrics
+        metrics.inc("sse_bytes", len(chunk))
+        # Frame receipt time: state_write_lag is measured from here.
+        received = time.monotonic()
+        alive = False
+        for frame in decoder.feed(chunk):
+            # The stream delivers again: start the next backoff from scratch.
+            self._backoff_attempt = 0
+            if frame.event == "alive":
+                metrics.inc("sse_keepalives")
+                alive = True
+                continue
+            metrics.inc("sse_events")
+            consumed = False
+            try:
+                event_data = json.loads(frame.data.decode())
+                if isinstance(event_data, dict):
+                    consumed = await self._process_sse_event(event_data, received)
+            except Exception as err:  # noqa: BLE001
+                metrics.inc("sse_parse_failures")
+                LOGGER.debug("Error processing SSE event: %s", err)
+            if not consumed:
+                metrics.inc("sse_events_ignored")
+                metrics.inc("sse_bytes_ignored", len(frame.data))
+        return alive
+
     # ------------------------------------------------------------------
     # SSE event processing
     # ------------------------------------------------------------------
 
-    def _prune_recent_commands(self) -> None:
-        """Remove expired entries from _recent_commands.
-
-        Called at every exit point of _process_sse_event() so timestamps never
-        accumulate under high-echo-traffic conditions.
-        """
-        if not self._recent_commands:
-            return
-        now = time.time()
-        expired = [
-            k
-            for k, v in self._recent_commands.items()
-            if (now - v) > self._command_ignore_duration
-        ]
-        for k in expired:
-            del self._recent_commands[k]
-
-    async def _process_sse_event(self, event_data: dict) -> None:
+    async def _process_sse_event(
+        self, event_data: dict, received: float | None = None
+    ) -> bool:
         """Process a single parsed SSE event from openHAB.
 
+        Returns False when the event type is not consumed by the integration
+        (used to measure what the server-side topic filter saves). received
+        is the monotonic time the frame arrived (default: now).
+
         For ItemStateChangedEvent / ItemStateUpdatedEvent:
-          1. Check echo suppression (only for commands tracked via track_ha_command).
-          2. Try to update the item state directly in self.data (no API call).
-          3. Call async_set_updated_data() so all HA entity listeners fire immediately.
-          4. Fall back to a debounced full API refresh when the item is unknown
+          1. Drop stale echoes of commands tracked via track_ha_command().
+          2. Confirm (or cancel) a pending optimistic state.
+          3. Drop the event when the raw value equals the latest known one.
+          4. Queue the value in the coalescing window (or apply it directly).
+          5. Call async_notify_item() so only the entities of that item are written.
+          6. Fall back to a debounced full API refresh when the item is unknown
              or the payload cannot be parsed.
 
         ItemCommandEvent is intentionally ignored here because the SSE stream
@@ -327,40 +778,293 @@ class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
         event_type = event_data.get("type", "")
         topic = event_data.get("topic", "")
 
+        if event_type in SSE_THING_EVENTS:
+            self._apply_thing_status(topic, event_data.get("payload"))
+            return True
+
         # Extract item name from topic, e.g. "openhab/items/MySwitch/statechanged"
         parts = topic.split("/")
         item_name = parts[-2] if len(parts) >= 2 and "items/" in topic else None
 
         if not item_name:
-            return
+            return False
+
+        # --- Catalog changes: handled off the SSE read loop (may fetch) ---
+        if event_type in SSE_CATALOG_EVENTS:
+            self.hass.async_create_task(
+                self._async_apply_catalog_event(event_type, item_name)
+            )
+            return True
 
         # --- State change / update events ---
-        if event_type in ("ItemStateChangedEvent", "ItemStateUpdatedEvent"):
-            # Suppress echo events for commands explicitly sent by this integration.
-            cmd_time = self._recent_commands.get(item_name)
-            if cmd_time and (time.time() - cmd_time) < self._command_ignore_duration:
+        if event_type in SSE_STATE_EVENTS:
+            raw_value = self._sse_raw_value(event_data.get("payload"))
+
+            # Suppress stale echoes of commands sent by this integration.
+            if raw_value is not None and self.echo.is_stale_echo(item_name, raw_value):
                 LOGGER.debug(
-                    "SSE echo suppressed for %s (%s)",
+                    "SSE echo suppressed for %s=%s (%s)",
                     item_name,
+                    raw_value,
                     event_type,
                 )
-                self._prune_recent_commands()
-                return
+                return True
+
+            # Confirmation (or contradiction) of an optimistic state.
+            if raw_value is not None and item_name in self._optimistic:
+                pending = self._optimistic.pop(item_name)
+                pending.cancel()
+                if raw_value == pending.expected:
+                    self.metrics.inc("optimistic_confirmed")
+                    return True
+
+            # Fast path: openHAB sends an ItemStateUpdatedEvent and an
+            # ItemStateChangedEvent for every change, plus a steady stream of
+            # unchanged updates for polled bindings. Anything that matches the
+            # latest known raw value (pending or applied) is dropped before
+            # parsing or notification.
+            if raw_value is not None and self.data and item_name in self.data:
+                current = self._pending_states.get(item_name)
+                if current is None:
+                    current = self.data[item_name]._raw_state
+                if raw_value == current:
+                    self.metrics.inc("sse_events_skipped")
+                    return True
+            self.metrics.inc("sse_events_applied")
+
+            if raw_value is None or not self._queue_state(
+                item_name, raw_value, received
+            ):
+                # Malformed payload or unknown item: resync through the API.
+                await self._refresh_debouncer.async_call()
 
-            payload_str = event_data.get("payload", "")
+            return True
+
+        return False
 
-            if payload_str and self._update_item_from_sse_payload(item_name, payload_str):
-                # Success: push updated data to all entity listeners immediately.
-                self.async_set_updated_data(self.data)
+    async def _async_apply_catalog_event(self, event_type: str, item_name: str) -> None:
+        """Add, re-describe or remove the entity of a single item."""
+        async with self._catalog_lock:
+            if self.data is None:
+                return
+            if event_type == "ItemRemovedEvent":
+                if self.data.pop(item_name, None) is None:
+                    return
+                self.catalog.remove(item_name)
+                self._pending_states.pop(item_name, None)
+                if pending := self._optimistic.pop(item_name, None):
+                    pending.cancel()
+                await self._async_remove_entity(item_name)
+                LOGGER.info("Item %s removed in openHAB", item_name)
             else:
-                # Fallback: item not yet loaded or payload malformed.
-                LOGGER.debug(
-                    "SSE direct update failed for %s - falling back to API refresh",
-                    item_name,
-                )
-                await self._refresh_debouncer.async_call()
+                try:
+                    item = await self.api.async_get_item(item_name)
+                except Exception as err:  # noqa: BLE001
+                    LOGGER.warning("Could not fetch new item %s: %s", item_name, err)
+                    return
+                if self._is_devireg_related(item):
+                    # Devireg units are assembled from several items and things.
+                    LOGGER.info("Devireg item %s changed - reloading", item_name)
+                    if self.snapshot is not None:
+                        # The reload starts from the snapshot; flush pending
+                        # changes instead of waiting for the delayed save.
+                        await self.snapshot.async_write(self.version, self.data)
+                    self.hass.async_create_task(
+                        self.hass.config_entries.async_reload(
+                            self.config_entry.entry_id
+                        )
+                    )
+                    return
+                await self._async_upsert_item(item)
+
+            if self.snapshot is not None:
+                self.snapshot.async_save(self.version, self.data)
+
+    def _is_devireg_related(self, item: Any) -> bool:
+        """Return True for items belonging to a devireg unit."""
+        units = {unit.name for unit in self.catalog.by_type_ex.get("devireg_unit", ())}
+        return (
+            item.name in units
+            or item.name.startswith("DeviReg")
+            or any(group in units for group in item.groupNames or ())
+        )
 
-        self._prune_recent_commands()
+    async def _async_upsert_item(self, item: Any) -> None:
+        """Insert or replace an item and update only its entity."""
+        item.type_ex = False
+        item.parent_device_name = False
+        item = StoredItem.from_item(item)
+        item_name = item.name
+        old_platform = self.catalog.platform_of.get(item_name)
+        if item_name in self.data:
+            self.catalog.remove(item_name)
+        self.data[item_name] = item
+        platform = self.catalog.add(item)
+
+        entity = self.ha_items.get(item_name)
+        if entity is not None and platform == old_platform:
+            # Same platform: the entity re-reads its item (label, unit, state).
+            LOGGER.info("Item %s updated in openHAB", item_name)
+            self.async_notify_item(item_name)
+            return
+        if entity is not None:
+            await self._async_remove_entity(item_name)
+        if adder := self._platform_adders.get(platform):
+            factory, async_add_entities = adder
+            async_add_entities([factory(item)])
+            LOGGER.info("Item %s added to %s", item_name, platform)
+
+    async def _async_remove_entity(self, item_name: str) -> None:
+        """Remove the entity of an item from Home Assistant and the registry."""
+        entity = self.ha_items.pop(item_name, None)
+        if entity is None:
+            return
+        if entity.registry_entry is not None:
+            # The entity removes itself when its registry entry goes away.
+            er.async_get(self.hass).async_remove(entity.entity_id)
+        else:
+            await entity.async_remove(force_remove=True)
+
+    @callback
+    def _apply_thing_status(self, topic: str, payload: Any) -> None:
+        """Flip availability of the items linked to a thing."""
+        # e.g. "openhab/things/zwave:device:ctrl:node5/statuschanged"
+        parts = topic.split("/")
+        try:
+            status = json.loads(payload)[0]["status"]
+        except (TypeError, ValueError, KeyError, IndexError):
+            return
+        if len(parts) < 4:
+            return
+        affected = self.things.update(parts[2], status)
+        self.metrics.inc("thing_status_changes")
+        if affected:
+            LOGGER.info(
+                "Thing %s is %s - updating %d items", parts[2], status, len(affected)
+            )
+        for item_name in affected:
+            self.async_notify_item(item_name)
+
+    @staticmethod
+    def _sse_raw_value(payload_str: str | None) -> str | None:
+        """Extract the raw state value from an SSE state event payload."""
+        if not payload_str:
+            return None
+        try:
+            payload = json.loads(payload_str)
+        except ValueError:
+            return None
+        if not isinstance(payload, dict):
+            return None
+        return payload.get("value")
+
+    @callback
+    def _queue_state(
+        self, item_name: str, raw_value: str, received: float | None = None
+    ) -> bool:
+        """Queue a raw state in the coalescing window (or apply it directly).
+
+        received is when the value arrived (default: now); state_write_lag
+        is measured from it on both paths. Returns False when a fallback API
+        refresh is needed.
+        """
+        if received is None:
+            received = time.monotonic()
+        if self.coalesce_window <= 0:
+            applied = self._apply_sse_state(item_name, raw_value)
+            self.metrics.observe("state_write_lag", time.monotonic() - received)
+            return applied
+
+        # Keep only the latest value per item until the window ends.
+        self._pending_states[item_name] = raw_value
+        self._pending_events += 1
+        if self._flush_handle is None:
+            self._pending_since = received
+            self._flush_handle = self.hass.loop.call_later(
+                self.coalesce_window, self._async_flush_pending_states
+            )
+        return True
+
+    async def _async_resync_states(self) -> None:
+        """Diff a lightweight name/state fetch against self.data.
+
+        Only items whose state changed while SSE was down are updated; the
+        full catalog pipeline only runs when items were added or removed.
+        """
+        try:
+            states = await self.api.async_get_item_states()
+        except Exception as err:  # noqa: BLE001
+            LOGGER.warning("State resync failed (%s) - running full refresh", err)
+            await self._refresh_debouncer.async_call()
+            return
+
+        data = self.data or {}
+        if states.keys() != data.keys():
+            LOGGER.info("Item catalog changed while SSE was down - full refresh")
+            await self._refresh_debouncer.async_call()
+            return
+
+        changed = 0
+        refresh_needed = False
+        for item_name, raw_value in states.items():
+            current = self._pending_states.get(item_name)
+            if current is None:
+                current = data[item_name]._raw_state
+            if raw_value == current:
+                continue
+            changed += 1
+            if not self._queue_state(item_name, raw_value):
+                refresh_needed = True
+
+        self.metrics.inc("sse_resyncs")
+        self.metrics.inc("sse_resync_items_changed", changed)
+        LOGGER.info("State resync updated %d of %d items", changed, len(states))
+        if refresh_needed:
+            await self._refresh_debouncer.async_call()
+
+    @callback
+    def _apply_sse_state(self, item_name: str, raw_value: str) -> bool:
+        """Apply one SSE state value and notify the item's entities.
+
+        Returns False when a fallback API refresh is needed.
+        """
+        if self._update_item_state(item_name, raw_value):
+            # Success: wake only the entities subscribed to this item.
+            # A full broadcast is reserved for poll/reconnect refreshes.
+            self.async_notify_item(item_name)
+            return True
+
+        # Fallback: item not yet loaded or payload malformed.
+        LOGGER.debug(
+            "SSE direct update failed for %s - falling back to API refresh",
+            item_name,
+        )
+        return False
+
+    @callback
+    def _async_flush_pending_states(self) -> None:
+        """Apply the coalesced batch with one notification per changed item."""
+        self._flush_handle = None
+        pending, self._pending_states = self._pending_states, {}
+        events, self._pending_events = self._pending_events, 0
+        if not pending:
+            return
+
+        refresh_needed = False
+        for item_name, raw_value in pending.items():
+            if not self._apply_sse_state(item_name, raw_value):
+                refresh_needed = True
+
+        metrics = self.metrics
+        # Lag of the oldest event in the batch until its state was written.
+        metrics.observe("state_write_lag", time.monotonic() - self._pending_since)
+        metrics.inc("coalesce_batches")
+        metrics.inc("coalesce_events_in", events)
+        metrics.inc("coalesce_items_out", len(pending))
+        metrics.observe("coalesce_batch_ratio", events / len(pending))
+
+        if refresh_needed:
+            self.hass.async_create_task(self._refresh_debouncer.async_call())
 
     # ------------------------------------------------------------------
     # Shutdown
@@ -374,6 +1078,15 @@ class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
         if self._refresh_debouncer is not None:
             self._refresh_debouncer.async_shutdown()
 
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        await self.commands.async_shutdown()
+        for pending in self._optimistic.values():
+            pending.cancel()
+        self._optimistic.clear()
+
         if self._sse_listener_task and not self._sse_listener_task.done():
             self._sse_listener_task.cancel()
             try:
@@ -381,9 +1094,8 @@ class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
             except asyncio.CancelledError:
                 pass
 
-        if self._sse_session:
-            await self._sse_session.close()
-            self._sse_session = None
+        if self.api.pool is not None:
+            await self.api.pool.async_close()
 
     # ------------------------------------------------------------------
     # Coordinator data fetch (polling path - active until SSE connects)
@@ -404,26 +1116,43 @@ class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
         yet reachable at HA startup time (e.g. after a fast HACS-triggered restart
         where openHAB needs a few extra seconds to come up).
         """
+        started = time.monotonic()
+        timer = PhaseTimer("refresh")
+        self.refresh_timings.append(timer)
         try:
             if self.version is None or len(self.version) == 0:
-                self.version = await self.api.async_get_version()
-
-            items = await self.api.async_get_items()
+                with timer.phase("request_version"):
+                    self.version = await self.api.async_get_version()
+
+            items = merge_items(self.data, await self.api.async_get_items(timer))
+            if not items and self._snapshot_signature is not None:
+                # openHAB is not answering yet: keep the snapshot catalog the
+                # entities were built from until a real one can be diffed.
+                LOGGER.info("No items from openHAB yet - keeping the snapshot")
+                return self.data
             self.is_online = bool(items)
+            old_catalog = self.catalog
+            with timer.phase("catalog"):
+                self.catalog = ItemCatalog(items.values())
+            if items:
+                with timer.phase("thing_status"):
+                    things = self.api.things
+                    if things is None:
+                        things = await self.api.async_get_things()
+                    links = await self.api.async_get_links()
+                    self.things = ThingStatusIndex(links, things)
 
             LOGGER.info("Coordinator fetched %d items from openHAB", len(items))
 
             # Log item type distribution for debugging
-            item_types: dict = {}
-            items_with_none_type: list = []
-            for item_name, item in items.items():
-                item_type = item.type_
-                item_types[item_type] = item_types.get(item_type, 0) + 1
-                if item_type is None:
-                    group_type = getattr(item, "groupType", "NO_GROUPTYPE")
-                    items_with_none_type.append(
-                        f"{item_name} ({type(item).__name__}, groupType={group_type})"
-                    )
+            item_types = {
+                item_type: len(group)
+                for item_type, group in self.catalog.by_type.items()
+            }
+            items_with_none_type = [
+                f"{item.name} ({'Group' if item.group else 'Item'})"
+                for item in self.catalog.by_type.get(None, ())
+            ]
 
             LOGGER.info("Item types distribution: %s", item_types)
 
@@ -433,10 +1162,21 @@ class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
                     items_with_none_type[:10],
                 )
 
+            if items and self.snapshot is not None:
+                if self._snapshot_signature is not None:
+                    changed = self._snapshot_signature != catalog_signature(items)
+                    self._snapshot_signature = None
+                    if changed:
+                        # Entities were created from a stale catalog.
+                        await self._async_apply_catalog_diff(old_catalog, items)
+                self.snapshot.async_save(self.version, items)
+
             # Start SSE listener after first successful fetch
             if items and not self._sse_started:
                 self._start_sse_after_first_refresh()
 
+            self.metrics.observe("poll_duration", time.monotonic() - started)
+
             return items
 
         except ApiClientException as exception:
@@ -447,3 +1187,5 @@ class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
             raise UpdateFailed(
                 f"Unexpected error communicating with openHAB: {exception}"
             ) from exception
+        finally:
+            timer.finish()
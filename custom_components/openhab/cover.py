@@ -6,7 +6,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import COVER, DOMAIN, ITEMS_MAP
+from .const import COVER, DOMAIN
 from .device_classes_map import COVER_DEVICE_CLASS_MAP
 from .entity import OpenHABEntity
 
@@ -19,16 +19,11 @@ async def async_setup_entry(
     """Setup sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    covers = []
-    for item in coordinator.data.values():
-        if item.type_ in ITEMS_MAP[COVER]:
-            covers.append(OpenHABCover(hass, coordinator, item))
-        elif (item.type_ == "Group" and hasattr(item, 'groupType') and item.groupType == "Rollershutter"):
-            covers.append(OpenHABCover(hass, coordinator, item))
-    
+    covers = coordinator.async_setup_platform(
+        COVER, lambda item: OpenHABCover(hass, coordinator, item), async_add_devices
+    )
     from .const import LOGGER
     LOGGER.info(f"Cover platform: Adding {len(covers)} cover entities")
-    async_add_devices(covers)
 
 
 class OpenHABCover(OpenHABEntity, CoverEntity):
@@ -49,38 +44,29 @@ class OpenHABCover(OpenHABEntity, CoverEntity):
         """Move the cover to a specific position."""
         if not self.item:
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post,
-            f"/items/{self._id}",
-            str(kwargs[ATTR_POSITION]),
-        )
+        position = str(kwargs[ATTR_POSITION])
+        await self.coordinator.async_send_command(self._id, position, position)
         # Don't request refresh - SSE will provide the update
 
     async def async_open_cover(self, **kwargs: dict[str, Any]) -> None:
         """Open the cover."""
         if not self.item:
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post, f"/items/{self._id}", "UP"
-        )
+        await self.coordinator.async_send_command(self._id, "UP")
         # Don't request refresh - SSE will provide the update
 
     async def async_close_cover(self, **kwargs: dict[str, Any]) -> None:
         """Close cover."""
         if not self.item:
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post, f"/items/{self._id}", "DOWN"
-        )
+        await self.coordinator.async_send_command(self._id, "DOWN")
         # Don't request refresh - SSE will provide the update
 
     async def async_stop_cover(self, **kwargs: dict[str, Any]) -> None:
         """Stop cover."""
         if not self.item:
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post, f"/items/{self._id}", "STOP"
-        )
+        await self.coordinator.async_send_command(self._id, "STOP")
         # Don't request refresh - SSE will provide the update
 
     @property
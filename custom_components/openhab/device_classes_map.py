@@ -1,4 +1,9 @@
 """Device Classes map"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+import re
 
 BINARY_SENSOR_DEVICE_CLASS_MAP = [
     "battery",
@@ -80,4 +85,45 @@ SENSOR_DEVICE_CLASS_MAP = [
 SWITCH_DEVICE_CLASS_MAP = [
     "outlet",
     "switch",
-]
\ No newline at end of file
+]
+
+# Labels separate words with spaces or dashes, class names with underscores.
+_SEPARATOR = "[ _-]"
+_TO_CLASS = str.maketrans(" -", "__")
+
+
+class DeviceClassMatcher:
+    """Find the most specific device class named in item names and labels.
+
+    All classes are searched in one pass with a single compiled pattern that
+    tries the longer classes first at every position, so "garage_door" is
+    found where the "door" inside it would have won before. Of the classes
+    found, the longest wins and ties go to the first occurrence; the order
+    of the class list no longer matters.
+    """
+
+    def __init__(self, device_classes: Iterable[str]) -> None:
+        """Compile the pattern for a device class list."""
+        classes = sorted(set(device_classes), key=lambda c: (-len(c), c))
+        self._pattern = (
+            re.compile("|".join(re.escape(c).replace("_", _SEPARATOR) for c in classes))
+            if classes
+            else None
+        )
+
+    def match(self, *texts: str) -> str:
+        """Return the most specific class found in the texts, or ""."""
+        if self._pattern is None:
+            return ""
+        found = self._pattern.findall("\n".join(texts).lower())
+        return max(found, key=len).translate(_TO_CLASS) if found else ""
+
+
+@lru_cache(maxsize=None)
+def _compiled(device_classes: tuple[str, ...]) -> DeviceClassMatcher:
+    return DeviceClassMatcher(device_classes)
+
+
+def device_class_matcher(device_classes: Iterable[str] | None) -> DeviceClassMatcher:
+    """Return the shared matcher for a device class map."""
+    return _compiled(tuple(device_classes or ()))
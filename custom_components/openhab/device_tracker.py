@@ -5,7 +5,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DEVICE_TRACKER, DOMAIN, ITEMS_MAP
+from .const import DEVICE_TRACKER, DOMAIN
 from .device_classes_map import SENSOR_DEVICE_CLASS_MAP
 from .entity import OpenHABEntity
 
@@ -18,10 +18,10 @@ async def async_setup_entry(
     """Setup device_tracker platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(
-        OpenHABTracker(hass, coordinator, item)
-        for item in coordinator.data.values()
-        if item.type_ in ITEMS_MAP[DEVICE_TRACKER]
+    coordinator.async_setup_platform(
+        DEVICE_TRACKER,
+        lambda item: OpenHABTracker(hass, coordinator, item),
+        async_add_entities,
     )
 
 
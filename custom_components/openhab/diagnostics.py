@@ -0,0 +1,45 @@
+"""Diagnostics support for openHAB."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_AUTH_TOKEN, CONF_PASSWORD, CONF_USERNAME, DOMAIN
+
+TO_REDACT = {CONF_AUTH_TOKEN, CONF_PASSWORD, CONF_USERNAME}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    pool = coordinator.api.pool
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "openhab_version": coordinator.version,
+        "is_online": coordinator.is_online,
+        "item_count": len(coordinator.data or {}),
+        "connection_pool": pool.stats() if pool is not None else None,
+        "sse": coordinator.sse_stats(),
+        "commands": coordinator.commands.stats(),
+        "metrics": coordinator.metrics.as_dict(),
+        "timings": {
+            "setup": coordinator.setup_timer.as_dict(),
+            "refreshes": [timer.as_dict() for timer in coordinator.refresh_timings],
+        },
+        "last_refresh_writes": coordinator.last_refresh_writes,
+        "profile": coordinator.last_profile,
+        "sse_recorder": (
+            {"chunks": len(recorder), "capacity": recorder.capacity}
+            if (recorder := coordinator.recorder) is not None
+            else None
+        ),
+    }
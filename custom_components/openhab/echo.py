@@ -0,0 +1,144 @@
+"""Value-aware suppression of SSE echoes of commands sent by the integration."""
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from typing import NamedTuple
+
+from .metrics import OpenHABMetrics
+
+# Echo window used until enough round trips have been measured.
+DEFAULT_WINDOW = 2.0
+MIN_WINDOW = 0.25
+MAX_WINDOW = 10.0
+# Window = RTT_FACTOR * p95 of the measured command -> event round trip.
+RTT_FACTOR = 3
+MIN_RTT_SAMPLES = 8
+
+
+class PendingCommand(NamedTuple):
+    """A command waiting for its state event."""
+
+    seq: int
+    expected: str | None
+    sent: float
+    expires: float
+
+
+def _find(commands: list[PendingCommand], expected: str | None) -> int | None:
+    """Return the index of the oldest command with the expected value."""
+    for index, command in enumerate(commands):
+        if command.expected == expected:
+            return index
+    return None
+
+
+class EchoSuppressor:
+    """Match state events against the values our own commands should produce.
+
+    A state event equal to the expected value of the latest outstanding
+    command confirms it and is applied as usual. One that matches an older
+    command while a newer one is still in flight is a stale echo and is
+    suppressed so the entity does not flicker back. openHAB reports every
+    change twice (ItemStateUpdatedEvent, then ItemStateChangedEvent), so a
+    suppressed value keeps being suppressed until the newer command is
+    confirmed or expires. Commands with an unknown expected value never
+    cause suppression. Anything else is a genuine external change and is
+    applied even inside the window.
+    Expiry uses a monotonic-clock heap, so pruning costs O(log n) per
+    expired command instead of a scan of every tracked item.
+    """
+
+    def __init__(self, metrics: OpenHABMetrics) -> None:
+        """Initialize the suppressor."""
+        self._metrics = metrics
+        self._pending: dict[str, list[PendingCommand]] = {}
+        # Last suppressed value per item, for the second event of its pair.
+        self._suppressed: dict[str, str] = {}
+        self._expiry: list[tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self.window = DEFAULT_WINDOW
+
+    def __len__(self) -> int:
+        """Return the number of outstanding commands."""
+        return sum(len(commands) for commands in self._pending.values())
+
+    def track(self, item_name: str, expected: str | None = None) -> None:
+        """Record a command that is about to be sent.
+
+        expected is the raw state the command should produce; None means
+        unknown, in which case any state event confirms the command but
+        never counts as a stale echo.
+        """
+        now = time.monotonic()
+        command = PendingCommand(next(self._seq), expected, now, now + self.window)
+        self._pending.setdefault(item_name, []).append(command)
+        heapq.heappush(self._expiry, (command.expires, command.seq, item_name))
+
+    def is_stale_echo(self, item_name: str, raw_value: str) -> bool:
+        """Consume a state event; return True when it must be suppressed."""
+        self.prune()
+        commands = self._pending.get(item_name)
+        if not commands:
+            return False
+        if self._suppressed.get(item_name) == raw_value:
+            self._metrics.inc("echo_suppressed")
+            return True
+
+        # A known expected value identifies its command; otherwise the
+        # oldest command with an unknown outcome takes the event.
+        index = _find(commands, raw_value)
+        if index is None and (index := _find(commands, None)) is None:
+            return False
+        command = commands[index]
+
+        self._observe_rtt(time.monotonic() - command.sent)
+        # Older commands can no longer be echoed after a newer one landed.
+        del commands[: index + 1]
+        if not commands:
+            self._forget(item_name)
+            self._metrics.inc("echo_confirmed")
+            return False
+        # Only a value an older command is known to produce is a stale echo;
+        # an event taken by an unknown-outcome command is a real change.
+        if command.expected is None:
+            self._suppressed.pop(item_name, None)
+            return False
+        self._suppressed[item_name] = raw_value
+        self._metrics.inc("echo_suppressed")
+        return True
+
+    def _forget(self, item_name: str) -> None:
+        """Drop the state of an item without outstanding commands."""
+        del self._pending[item_name]
+        self._suppressed.pop(item_name, None)
+
+    def prune(self) -> None:
+        """Drop commands whose window elapsed without a matching event."""
+        expiry = self._expiry
+        now = time.monotonic()
+        while expiry and expiry[0][0] <= now:
+            _, seq, item_name = heapq.heappop(expiry)
+            commands = self._pending.get(item_name)
+            if not commands:
+                continue
+            remaining = [command for command in commands if command.seq != seq]
+            if len(remaining) == len(commands):
+                continue
+            self._metrics.inc("echo_expired")
+            if remaining:
+                self._pending[item_name] = remaining
+            else:
+                self._forget(item_name)
+
+    def _observe_rtt(self, rtt: float) -> None:
+        """Record a round trip and resize the window from its p95."""
+        metrics = self._metrics
+        metrics.observe("command_rtt", rtt)
+        metrics.inc("command_rtt_samples")
+        # Re-estimate every few samples; percentiles() sorts the sample set.
+        if metrics.counters["command_rtt_samples"] % MIN_RTT_SAMPLES:
+            return
+        p95 = metrics.percentiles("command_rtt", (95,))["p95"]
+        self.window = min(max(p95 * RTT_FACTOR, MIN_WINDOW), MAX_WINDOW)
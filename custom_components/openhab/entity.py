@@ -9,11 +9,12 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.device_registry import DeviceEntryType
 
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from openhab import items
 
 from .const import ATTRIBUTION, DOMAIN, NAME, VERSION, LOGGER
 from .coordinator import OpenHABDataUpdateCoordinator
+from .device_classes_map import device_class_matcher
 from .icons_map import ICONS_MAP, ITEM_TYPE_MAP
+from .store import StoredItem
 from .utils import strip_ip
 
 
@@ -41,7 +42,7 @@ class OpenHABEntity(CoordinatorEntity):
         self,
         hass: HomeAssistant,
         coordinator: OpenHABDataUpdateCoordinator,
-        item: items.Item,
+        item: StoredItem,
     ) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
@@ -66,8 +67,30 @@ class OpenHABEntity(CoordinatorEntity):
         # not permitted in entity IDs.
         self.entity_id = f"{DOMAIN}.{self._nameid_prefix}{_slugify(self.item.name)}"
 
-        if self.item.unit_of_measure:
-            self._attr_native_unit_of_measurement = str(self.item.unit_of_measure)
+        self._update_presentation()
+        self._written_fingerprint: tuple | None = None
+
+    def _update_presentation(self) -> None:
+        """Compute name, icon, device class, device info and unit from the item.
+
+        HA reads these on every state write but they only depend on the item
+        metadata, so they are served from _attr_* fields and recomputed when
+        the metadata record changes.
+        """
+        item = self.item
+        self._item_meta = item.meta
+        self._attr_name = item.label if len(item.label) > 0 else item.name
+        self._attr_icon = self._icon()
+        self._attr_device_class = self._device_class()
+        self._attr_device_info = self._device_info()
+        unit = item.unit_of_measure
+        self._attr_native_unit_of_measurement = str(unit) if unit else None
+
+    def _set_item(self, item: StoredItem) -> None:
+        """Switch to the current item object of this entity."""
+        self.item = item
+        if item.meta is not self._item_meta:
+            self._update_presentation()
 
     @property
     def available(self):
@@ -76,12 +99,9 @@ class OpenHABEntity(CoordinatorEntity):
             if self.item.parent_device_name in self.coordinator.ha_items:
                 return  self.coordinator.ha_items[self.item.parent_device_name].available
 
-        return self.coordinator.is_online
-
-    @property
-    def name(self) -> str:
-        """Return the name of the switch."""
-        return self.item.label if len(self.item.label) > 0 else self.item.name
+        return self.coordinator.is_online and self.coordinator.things.is_available(
+            self._id
+        )
 
     @property
     def unique_id(self) -> str | None:
@@ -93,8 +113,8 @@ class OpenHABEntity(CoordinatorEntity):
         """
         return f"{DOMAIN}.{self._nameid_prefix}{self.item.name}"
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _device_info(self) -> DeviceInfo:
+        """Return the device of the entity."""
         version = VERSION
         oh_version = self.coordinator.version
         if oh_version is not None:
@@ -121,22 +141,13 @@ class OpenHABEntity(CoordinatorEntity):
             entry_type=DeviceEntryType.SERVICE,
         )
 
-    @property
-    def device_class(self):
+    def _device_class(self) -> str:
         """Return the device class"""
-        name = self.item.name.lower()
-        label = self.item.label.lower()
-        device_classes = self._attr_device_class_map
-
-        if bool(device_classes):
-            for device_class in device_classes:
-                if device_class in name or device_class in label:
-                    return device_class
-
-        return ""
+        return device_class_matcher(self._attr_device_class_map).match(
+            self.item.name, self.item.label
+        )
 
-    @property
-    def icon(self) -> str:
+    def _icon(self) -> str:
         """Return the icon of the switch."""
         category = self.item.category
         item_type = self.item.type_
@@ -183,6 +194,20 @@ class OpenHABEntity(CoordinatorEntity):
 
         return attributes
 
+    def _state_fingerprint(self) -> tuple:
+        """Return what the written state is derived from.
+
+        Metadata (name, icon, device class, devireg attributes), the raw
+        state and availability; equal fingerprints render the same state.
+        """
+        return (self.item.meta, self.item._raw_state, self.available)
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and remember its fingerprint."""
+        self._written_fingerprint = self._state_fingerprint()
+        super().async_write_ha_state()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -190,15 +215,33 @@ class OpenHABEntity(CoordinatorEntity):
         if new is not None:
             try:
                 # Avoid using != comparison which may not be implemented for all item types
-                self.item = new
+                self._set_item(new)
             except (NotImplementedError, AttributeError) as e:
                 LOGGER.debug(
                     "Could not update item %s: %s", self._id, str(e)
                 )
+        # A refresh reaches every entity; most of them have not changed.
+        if self._state_fingerprint() == self._written_fingerprint:
+            self.coordinator.metrics.inc("refresh_writes_skipped")
+            return
+        self.coordinator.metrics.inc("refresh_writes")
         self.async_write_ha_state()
-    
+
+    @callback
+    def _handle_item_update(self) -> None:
+        """Handle a state change of this entity's own item (SSE path)."""
+        new = self.coordinator.data.get(self._id)
+        if new is not None:
+            self._set_item(new)
+        self.async_write_ha_state()
+
     async def async_added_to_hass(self) -> None:
         """Connect to dispatcher listening for entity data notifications."""
+        # Full refreshes (polling, reconnect) are broadcast to every entity.
         self.async_on_remove(
             self.coordinator.async_add_listener(self._handle_coordinator_update)
         )
+        # SSE state events are dispatched to the subscribed item only.
+        self.async_on_remove(
+            self.coordinator.async_add_item_listener(self._id, self._handle_item_update)
+        )
@@ -23,24 +23,15 @@ async def async_setup_entry(
     """Setup sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    color_lights = []
-    for item in coordinator.data.values():
+    def create_light(item):
         if item.type_ == ITEMS_MAP[LIGHT][0]:  # Color
-            color_lights.append(OpenHABLightColor(hass, coordinator, item))
-        elif (item.type_ == "Group" and hasattr(item, 'groupType') and item.groupType == "Color"):
-            color_lights.append(OpenHABLightColor(hass, coordinator, item))
-    
-    dimmer_lights = []
-    for item in coordinator.data.values():
-        if item.type_ == ITEMS_MAP[LIGHT][1]:  # Dimmer
-            dimmer_lights.append(OpenHABLightDimmer(hass, coordinator, item))
-        elif (item.type_ == "Group" and hasattr(item, 'groupType') and item.groupType == "Dimmer"):
-            dimmer_lights.append(OpenHABLightDimmer(hass, coordinator, item))
-    
+            return OpenHABLightColor(hass, coordinator, item)
+        return OpenHABLightDimmer(hass, coordinator, item)
+
+    lights = coordinator.async_setup_platform(LIGHT, create_light, async_add_devices)
+
     from .const import LOGGER
-    LOGGER.info(f"Light platform: Adding {len(color_lights)} color lights and {len(dimmer_lights)} dimmer lights")
-    async_add_devices(color_lights)
-    async_add_devices(dimmer_lights)
+    LOGGER.info(f"Light platform: Adding {len(lights)} lights")
 
 
 class OpenHABLightColor(OpenHABEntity, LightEntity):
@@ -62,10 +53,9 @@ class OpenHABLightColor(OpenHABEntity, LightEntity):
         if ATTR_HS_COLOR in kwargs:
             return print(kwargs[ATTR_HS_COLOR])
         hsv = self.item._state
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post,
-            f"/items/{self._id}",
-            data=hsv_to_str([hsv[0], hsv[1], 100]),
+        await self.coordinator.async_send_command(
+            self._id,
+            hsv_to_str([hsv[0], hsv[1], 100]),
         )
         # Don't request refresh - SSE will provide the update
 
@@ -74,10 +64,9 @@ class OpenHABLightColor(OpenHABEntity, LightEntity):
         if not self.item:
             return
         hsv = self.item._state
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post,
-            f"/items/{self._id}",
-            data=hsv_to_str([hsv[0], hsv[1], 0]),
+        await self.coordinator.async_send_command(
+            self._id,
+            hsv_to_str([hsv[0], hsv[1], 0]),
         )
         # Don't request refresh - SSE will provide the update
 
@@ -117,24 +106,16 @@ class OpenHABLightDimmer(OpenHABEntity, LightEntity):
         if not self.item:
             return
         if ATTR_BRIGHTNESS in kwargs:
-            brightness = int(kwargs[ATTR_BRIGHTNESS] / 255) * 100
-            await self.hass.async_add_executor_job(
-                self.coordinator.api.openhab.req_post,
-                f"/items/{self._id}",
-                str(brightness),
-            )
+            brightness = str(round(kwargs[ATTR_BRIGHTNESS] / 255 * 100))
+            await self.coordinator.async_send_command(self._id, brightness, brightness)
             # Don't request refresh - SSE will provide the update
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post, f"/items/{self._id}", "ON"
-        )
+        await self.coordinator.async_send_command(self._id, "ON")
         # Don't request refresh - SSE will provide the update
 
     async def async_turn_off(self, **kwargs):
         """Instruct the light to turn off."""
         if not self.item:
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post, f"/items/{self._id}", "OFF"
-        )
+        await self.coordinator.async_send_command(self._id, "OFF", "0")
         # Don't request refresh - SSE will provide the update
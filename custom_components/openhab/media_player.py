@@ -10,7 +10,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, ITEMS_MAP, MEDIA_PLAYER
+from .const import DOMAIN, MEDIA_PLAYER
 from .device_classes_map import MEDIA_PLAYER_DEVICE_CLASS_MAP
 from .entity import OpenHABEntity
 
@@ -39,15 +39,10 @@ async def async_setup_entry(
     """Setup sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    for item in coordinator.data.values():
-        # if item.type_ == ITEMS_MAP[MEDIA_PLAYER]:
-        if item.name == "Tv_MediaPlayer":
-            print(item.type_)
-
-    async_add_entities(
-        OpenHABPlayer(hass, coordinator, item)
-        for item in coordinator.data.values()
-        if item.type_ == ITEMS_MAP[MEDIA_PLAYER]
+    coordinator.async_setup_platform(
+        MEDIA_PLAYER,
+        lambda item: OpenHABPlayer(hass, coordinator, item),
+        async_add_entities,
     )
 
 
@@ -102,22 +97,22 @@ class OpenHABPlayer(OpenHABEntity, MediaPlayerEntity):
 
     async def async_media_play(self) -> None:
         """Play."""
-        await self.hass.async_add_executor_job(self.item.play)
+        await self.coordinator.async_send_command(self._id, "PLAY")
         await self.coordinator.async_refresh()
 
     async def async_media_pause(self) -> None:
         """Pause."""
-        await self.hass.async_add_executor_job(self.item.pause)
+        await self.coordinator.async_send_command(self._id, "PAUSE")
         await self.coordinator.async_refresh()
 
     async def async_media_next_track(self) -> None:
         """Send next track command."""
-        await self.hass.async_add_executor_job(self.item.next)
+        await self.coordinator.async_send_command(self._id, "NEXT")
         await self.coordinator.async_refresh()
 
     async def async_media_previous_track(self) -> None:
         """Send the previous track command."""
-        await self.hass.async_add_executor_job(self.item.previous)
+        await self.coordinator.async_send_command(self._id, "PREVIOUS")
         await self.coordinator.async_refresh()
 
     async def async_set_volume_level(self, volume: str) -> None:
@@ -0,0 +1,61 @@
+"""Runtime metrics for the openHAB integration."""
+from __future__ import annotations
+
+from collections import defaultdict, deque
+import time
+from typing import Any
+
+# Number of latency samples kept per metric for percentile estimation.
+SAMPLE_SIZE = 1024
+
+
+class OpenHABMetrics:
+    """Counters and latency samples, cheap enough for the SSE hot path.
+
+    Increments are plain dict updates; rates and percentiles are only
+    computed when somebody reads them (diagnostics, sensors).
+    """
+
+    def __init__(self) -> None:
+        """Initialize metrics."""
+        self.started = time.monotonic()
+        self.counters: defaultdict[str, int] = defaultdict(int)
+        self._samples: dict[str, deque[float]] = {}
+
+    def inc(self, name: str, value: int = 1) -> None:
+        """Increment a counter."""
+        self.counters[name] += value
+
+    def observe(self, name: str, value: float) -> None:
+        """Record a sample (e.g. a latency in seconds)."""
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=SAMPLE_SIZE)
+        samples.append(value)
+
+    def percentiles(
+        self, name: str, quantiles: tuple[int, ...] = (50, 95, 99)
+    ) -> dict[str, float | None]:
+        """Return the requested percentiles of the recent samples."""
+        samples = sorted(self._samples.get(name, ()))
+        if not samples:
+            return {f"p{q}": None for q in quantiles}
+        last = len(samples) - 1
+        return {f"p{q}": samples[min(last, round(last * q / 100))] for q in quantiles}
+
+    @property
+    def uptime(self) -> float:
+        """Seconds since the metrics were created."""
+        return time.monotonic() - self.started
+
+    def rate(self, name: str) -> float:
+        """Average per-second rate of a counter since start."""
+        return self.counters.get(name, 0) / max(self.uptime, 1e-9)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all counters and sample percentiles."""
+        return {
+            "uptime": round(self.uptime, 1),
+            "counters": dict(self.counters),
+            "samples": {name: self.percentiles(name) for name in self._samples},
+        }
@@ -0,0 +1,128 @@
+"""Setup-phase timing and on-demand sampling profiles for diagnostics."""
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+import pathlib
+import sys
+import threading
+import time
+from typing import Any
+
+# Frames from files below this directory count as integration hot paths.
+PACKAGE_DIR = str(pathlib.Path(__file__).parent)
+DEFAULT_SAMPLE_INTERVAL = 0.005
+TOP_FUNCTIONS = 25
+
+
+class PhaseTimer:
+    """Wall-clock breakdown of one setup or refresh run.
+
+    Phases with the same name add up, so a phase may be entered more than
+    once (e.g. once per platform). Safe to hand to an executor job as long
+    as only one thread times phases at a time.
+    """
+
+    def __init__(self, kind: str) -> None:
+        """Initialize the timer."""
+        self.kind = kind
+        self.started = time.time()
+        self._start = time.monotonic()
+        self.total: float | None = None
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block as the given phase."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add(name, time.monotonic() - start)
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add a duration measured by the caller to a phase."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def finish(self) -> None:
+        """Record the total duration of the run."""
+        self.total = time.monotonic() - self._start
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timings in milliseconds."""
+        return {
+            "kind": self.kind,
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "total_ms": None if self.total is None else round(self.total * 1000, 1),
+            "phases_ms": {
+                name: round(seconds * 1000, 1) for name, seconds in self.phases.items()
+            },
+        }
+
+
+def _function_of(frame: Any) -> str:
+    """Return a short "file:function" label for a frame."""
+    code = frame.f_code
+    return f"{pathlib.Path(code.co_filename).name}:{code.co_name}"
+
+
+class SamplingProfiler:
+    """Sample the stacks of all threads while integration code runs.
+
+    Only stacks with at least one integration frame are counted. For each
+    of them the innermost integration function gets a "self" sample and
+    every integration function on the stack an "inclusive" sample; the
+    innermost frame overall (often library code the integration called
+    into) is counted separately as the leaf.
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL) -> None:
+        """Initialize the profiler."""
+        self.interval = interval
+        self._stop = threading.Event()
+
+    def run(self, duration: float) -> dict[str, Any]:
+        """Sample for duration seconds (blocking; run in an executor)."""
+        own_thread = threading.get_ident()
+        inclusive: Counter[str] = Counter()
+        exclusive: Counter[str] = Counter()
+        leaves: Counter[str] = Counter()
+        samples = hits = 0
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline and not self._stop.is_set():
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread:
+                    continue
+                samples += 1
+                leaf = frame
+                innermost = None
+                seen: set[str] = set()
+                while frame is not None:
+                    if frame.f_code.co_filename.startswith(PACKAGE_DIR):
+                        name = _function_of(frame)
+                        if innermost is None:
+                            innermost = name
+                        if name not in seen:
+                            seen.add(name)
+                            inclusive[name] += 1
+                    frame = frame.f_back
+                if innermost is not None:
+                    hits += 1
+                    exclusive[innermost] += 1
+                    leaves[_function_of(leaf)] += 1
+            time.sleep(self.interval)
+
+        return {
+            "duration_s": duration,
+            "interval_s": self.interval,
+            "thread_samples": samples,
+            "integration_samples": hits,
+            "inclusive": dict(inclusive.most_common(TOP_FUNCTIONS)),
+            "self": dict(exclusive.most_common(TOP_FUNCTIONS)),
+            "leaf": dict(leaves.most_common(TOP_FUNCTIONS)),
+        }
+
+    def stop(self) -> None:
+        """End a running profile early."""
+        self._stop.set()
@@ -0,0 +1,102 @@
+"""Opt-in recording of the raw SSE stream for offline replay."""
+from __future__ import annotations
+
+from collections import deque
+import gzip
+import json
+import time
+from typing import Any, NamedTuple
+
+from .snapshot import item_from_json, item_to_json
+from .store import StoredItem
+
+RECORDING_VERSION = 1
+RECORDING_SUFFIX = ".sse.gz"
+
+
+class RecordedChunk(NamedTuple):
+    """Raw stream bytes and the seconds since recording started."""
+
+    offset: float
+    data: bytes
+
+
+class Recording(NamedTuple):
+    """A loaded capture: header, item catalog and chunks."""
+
+    header: dict[str, Any]
+    items: list[dict[str, Any]]
+    chunks: list[RecordedChunk]
+
+    def build_items(self) -> dict[str, StoredItem]:
+        """Rebuild the classified items the stream refers to."""
+        return {data["name"]: item_from_json(data) for data in self.items}
+
+
+class SSERecorder:
+    """Keep the most recent raw SSE chunks in a bounded ring buffer.
+
+    Chunks are recorded exactly as they left the socket, before decoding,
+    so a replay exercises the decoder and every processing stage. Recording
+    is a timestamp and a deque append; nothing is written until save().
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the recorder."""
+        self.capacity = capacity
+        self.started = time.monotonic()
+        self._chunks: deque[RecordedChunk] = deque(maxlen=capacity)
+
+    def __len__(self) -> int:
+        """Return the number of buffered chunks."""
+        return len(self._chunks)
+
+    def record(self, chunk: bytes) -> None:
+        """Append a chunk (the oldest drops out when the buffer is full)."""
+        self._chunks.append(RecordedChunk(time.monotonic() - self.started, chunk))
+
+    def capture(
+        self, items: dict[str, StoredItem], version: str | None = None
+    ) -> tuple[dict[str, Any], list[dict[str, Any]], list[RecordedChunk]]:
+        """Copy the buffer and catalog (in the event loop) for save()."""
+        chunks = list(self._chunks)
+        header = {
+            "version": RECORDING_VERSION,
+            "openhab_version": version,
+            "recorded": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "chunks": len(chunks),
+        }
+        return header, [item_to_json(item) for item in items.values()], chunks
+
+    @staticmethod
+    def save(
+        path: str,
+        header: dict[str, Any],
+        items: list[dict[str, Any]],
+        chunks: list[RecordedChunk],
+    ) -> None:
+        """Write a capture to a gzip file (blocking; run in an executor).
+
+        Layout: a JSON header line, a JSON line with the item catalog, then
+        per chunk an "<offset> <length>" line followed by the raw bytes.
+        """
+        with gzip.open(path, "wb") as file:
+            file.write(json.dumps(header).encode() + b"\n")
+            file.write(json.dumps(items).encode() + b"\n")
+            for offset, data in chunks:
+                file.write(f"{offset:.6f} {len(data)}\n".encode())
+                file.write(data)
+
+
+def load_recording(path: str) -> Recording:
+    """Read a capture written by SSERecorder.save (blocking)."""
+    with gzip.open(path, "rb") as file:
+        header = json.loads(file.readline())
+        if header.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Unsupported SSE recording version in {path}")
+        items = json.loads(file.readline())
+        chunks = []
+        while line := file.readline():
+            offset, length = line.split()
+            chunks.append(RecordedChunk(float(offset), file.read(int(length))))
+    return Recording(header, items, chunks)
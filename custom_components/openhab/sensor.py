@@ -1,13 +1,36 @@
 """Sensor platform for openHAB."""
-from homeassistant.components.sensor import SensorEntity
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import time
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfDataRate, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import StateType
 
-from .const import DOMAIN, ITEMS_MAP, SENSOR, LOGGER
+from .const import (
+    CONF_DIAGNOSTIC_INTERVAL,
+    DEFAULT_DIAGNOSTIC_INTERVAL,
+    DOMAIN,
+    SENSOR,
+    LOGGER,
+)
+from .coordinator import OpenHABDataUpdateCoordinator
 from .device_classes_map import SENSOR_DEVICE_CLASS_MAP
 from .entity import OpenHABEntity
+from .utils import strip_ip
 
 
 async def async_setup_entry(
@@ -18,27 +41,17 @@ async def async_setup_entry(
     """Setup sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Define group types that have specific platforms
-    specific_group_types = {"Switch", "Rollershutter", "Color", "Dimmer", "Contact", "Player"}
-
-    sensors = []
-    skipped_untyped_groups = 0
-    for item in coordinator.data.values():
-        # Skip untyped groups - they will be handled as switches
-        if type(item).__name__ == 'GroupItem' and item.type_ is None and (not hasattr(item, 'groupType') or item.groupType is None):
-            skipped_untyped_groups += 1
-            continue
-            
-        if (item.type_ex == 'devireg_attr_ui_sensor'):
-            sensors.append(OpenHABSensor(hass, coordinator, item))
-        elif ((item.type_ex == False) and (item.type_ in ITEMS_MAP[SENSOR])):
-            sensors.append(OpenHABSensor(hass, coordinator, item))
-        elif (item.type_ == "Group" and (not hasattr(item, 'groupType') or item.groupType not in specific_group_types)):
-            sensors.append(OpenHABSensor(hass, coordinator, item))
-    
-    LOGGER.info(f"Sensor platform: Skipped {skipped_untyped_groups} untyped groups (handled as switches)")
+    sensors = coordinator.async_setup_platform(
+        SENSOR,
+        lambda item: OpenHABSensor(hass, coordinator, item),
+        async_add_entities,
+    )
     LOGGER.info(f"Sensor platform: Adding {len(sensors)} sensor entities out of {len(coordinator.data)} total items")
-    async_add_entities(sensors)
+
+    async_add_entities(
+        OpenHABPerformanceSensor(coordinator, entry, description)
+        for description in PERFORMANCE_SENSORS
+    )
 
 
 class OpenHABSensor(OpenHABEntity, SensorEntity):
@@ -50,3 +63,181 @@ class OpenHABSensor(OpenHABEntity, SensorEntity):
     def state(self) -> StateType:
         """Return the state of the sensor."""
         return self.item._state
+
+
+@dataclass
+class OpenHABPerformanceSensorDescription(SensorEntityDescription):
+    """Describes a runtime performance sensor.
+
+    Exactly one source is set: counter (per-second rate over the last
+    update interval), total (counter value), sample (p50 in ms, p95/p99 as
+    attributes) or value_fn.
+    """
+
+    counter: str | None = None
+    total: str | None = None
+    sample: str | None = None
+    value_fn: Callable[[OpenHABDataUpdateCoordinator], StateType] | None = None
+
+
+PERFORMANCE_SENSORS: tuple[OpenHABPerformanceSensorDescription, ...] = (
+    OpenHABPerformanceSensorDescription(
+        key="sse_events_rate",
+        name="SSE events",
+        icon="mdi:transit-connection-variant",
+        native_unit_of_measurement="events/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        counter="sse_events",
+    ),
+    OpenHABPerformanceSensorDescription(
+        key="sse_bytes_rate",
+        name="SSE throughput",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        counter="sse_bytes",
+    ),
+    OpenHABPerformanceSensorDescription(
+        key="sse_parse_failures",
+        name="SSE parse failures",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        total="sse_parse_failures",
+    ),
+    OpenHABPerformanceSensorDescription(
+        key="fallback_refreshes",
+        name="Fallback refreshes",
+        icon="mdi:refresh",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        total="fallback_refreshes",
+    ),
+    OpenHABPerformanceSensorDescription(
+        key="echo_suppressed",
+        name="Suppressed echoes",
+        icon="mdi:volume-off",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        total="echo_suppressed",
+    ),
+    OpenHABPerformanceSensorDescription(
+        key="refresh_writes_skipped",
+        name="Unchanged states not rewritten",
+        icon="mdi:content-save-off-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        total="refresh_writes_skipped",
+    ),
+    OpenHABPerformanceSensorDescription(
+        key="state_write_lag",
+        name="State write lag",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        sample="state_write_lag",
+    ),
+    OpenHABPerformanceSensorDescription(
+        key="command_latency",
+        name="Command latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        sample="command_latency",
+    ),
+    OpenHABPerformanceSensorDescription(
+        key="poll_duration",
+        name="Poll duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        sample="poll_duration",
+    ),
+    OpenHABPerformanceSensorDescription(
+        key="item_count",
+        name="Items",
+        icon="mdi:format-list-bulleted",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: len(coordinator.catalog),
+    ),
+)
+
+
+class OpenHABPerformanceSensor(SensorEntity):
+    """Runtime performance figure of the integration itself.
+
+    Reads the coordinator metrics on its own timer instead of listening to
+    the coordinator, so it never adds work to the SSE path and writes its
+    state at most once per interval (and only when the value changed).
+    """
+
+    entity_description: OpenHABPerformanceSensorDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        coordinator: OpenHABDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: OpenHABPerformanceSensorDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self.entity_description = description
+        self._interval = timedelta(
+            seconds=entry.options.get(
+                CONF_DIAGNOSTIC_INTERVAL, DEFAULT_DIAGNOSTIC_INTERVAL
+            )
+        )
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, strip_ip(coordinator.api._base_url))}
+        )
+        self._attr_extra_state_attributes = None
+        self._last_count = 0
+        self._last_time = 0.0
+
+    async def async_added_to_hass(self) -> None:
+        """Start the update timer."""
+        self._last_count = self.coordinator.metrics.counters.get(
+            self.entity_description.counter or "", 0
+        )
+        self._last_time = time.monotonic()
+        self._refresh()
+        self.async_on_remove(
+            async_track_time_interval(self.hass, self._async_tick, self._interval)
+        )
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Write the state if it changed since the last interval."""
+        previous = (self._attr_native_value, self._attr_extra_state_attributes)
+        self._refresh()
+        if (self._attr_native_value, self._attr_extra_state_attributes) != previous:
+            self.async_write_ha_state()
+
+    def _refresh(self) -> None:
+        """Recompute the value from the coordinator metrics."""
+        description = self.entity_description
+        metrics = self.coordinator.metrics
+        if description.counter is not None:
+            now = time.monotonic()
+            count = metrics.counters.get(description.counter, 0)
+            elapsed = now - self._last_time
+            if elapsed > 0:
+                self._attr_native_value = (count - self._last_count) / elapsed
+            self._last_count, self._last_time = count, now
+        elif description.total is not None:
+            self._attr_native_value = metrics.counters.get(description.total, 0)
+        elif description.sample is not None:
+            percentiles = {
+                name: None if value is None else round(value * 1000, 1)
+                for name, value in metrics.percentiles(description.sample).items()
+            }
+            self._attr_native_value = percentiles.pop("p50")
+            self._attr_extra_state_attributes = percentiles
+        elif description.value_fn is not None:
+            self._attr_native_value = description.value_fn(self.coordinator)
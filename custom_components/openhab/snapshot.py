@@ -0,0 +1,92 @@
+"""Persistent snapshot of the classified openHAB item catalog."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, LOGGER
+from .store import StoredItem
+
+STORAGE_VERSION = 1
+# Full fetches come in bursts (startup, reconnect fallbacks); write once.
+SAVE_DELAY = 10
+
+
+def item_to_json(item: StoredItem) -> dict[str, Any]:
+    """Serialize an item into the minimal /items JSON json_to_item accepts.
+
+    Empty fields are omitted and the classification done by fetch_all_items
+    (type_ex, parent_device_name, devireg) is stored alongside.
+    """
+    data: dict[str, Any] = {"name": item.name, "state": item._raw_state}
+    if item.group:
+        data["type"] = "Group"
+        data["members"] = []
+        if item.type_:
+            data["groupType"] = item.type_
+    else:
+        data["type"] = item.type_
+    for key in ("label", "category", "tags", "groupNames", "editable"):
+        if value := getattr(item, key):
+            data[key] = value
+    if type_ex := getattr(item, "type_ex", False):
+        data["type_ex"] = type_ex
+    if parent := getattr(item, "parent_device_name", False):
+        data["parent_device_name"] = parent
+    if devireg := getattr(item, "devireg", None):
+        data["devireg"] = devireg
+    return data
+
+
+def item_from_json(data: dict[str, Any]) -> StoredItem:
+    """Rebuild a classified item from its snapshot JSON."""
+    return StoredItem.from_json(data)
+
+
+def _to_data(version: str, items: dict[str, StoredItem]) -> dict[str, Any]:
+    """Build the stored document."""
+    return {"version": version, "items": [item_to_json(i) for i in items.values()]}
+
+
+def catalog_signature(items: dict[str, StoredItem]) -> frozenset:
+    """Return what decides which entities exist for a catalog."""
+    return frozenset(
+        (name, item.type_, item.group, getattr(item, "type_ex", False))
+        for name, item in items.items()
+    )
+
+
+class CatalogSnapshot:
+    """Store the item catalog so setup does not have to wait for openHAB."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the snapshot store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.catalog"
+        )
+
+    async def async_load(self) -> tuple[str, dict[str, StoredItem]] | None:
+        """Return (openHAB version, items) from the snapshot, if any."""
+        data = await self._store.async_load()
+        if not data:
+            return None
+        try:
+            items = {item["name"]: item_from_json(item) for item in data["items"]}
+        except Exception as err:  # noqa: BLE001
+            LOGGER.warning("Discarding unreadable item catalog snapshot: %s", err)
+            return None
+        return data.get("version", ""), items
+
+    def async_save(self, version: str, items: dict[str, StoredItem]) -> None:
+        """Schedule a write of the catalog."""
+        self._store.async_delay_save(lambda: _to_data(version, items), SAVE_DELAY)
+
+    async def async_write(self, version: str, items: dict[str, StoredItem]) -> None:
+        """Write the catalog now (before a reload reads it back)."""
+        await self._store.async_save(_to_data(version, items))
+
+    async def async_remove(self) -> None:
+        """Delete the snapshot (config entry removed)."""
+        await self._store.async_remove()
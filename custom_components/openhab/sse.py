@@ -0,0 +1,125 @@
+"""Incremental Server-Sent Events decoder for the openHAB event stream."""
+from __future__ import annotations
+
+from typing import NamedTuple
+
+_LF = b"\n"
+_CR = b"\r"
+_FRAME_END = b"\n\n"
+_COLON = 0x3A
+_SPACE = b" "
+_MESSAGE_PREFIX = b"event: message\ndata: "
+_MESSAGE_PREFIX_LEN = len(_MESSAGE_PREFIX)
+
+# openHAB event types mapped to the topic patterns accepted by the
+# ``topics`` query parameter of /rest/events.
+SSE_EVENT_TOPICS = {
+    "ItemStateChangedEvent": "openhab/items/*/statechanged",
+    "ItemStateUpdatedEvent": "openhab/items/*/stateupdated",
+    "ItemAddedEvent": "openhab/items/*/added",
+    "ItemRemovedEvent": "openhab/items/*/removed",
+    "ItemUpdatedEvent": "openhab/items/*/updated",
+    "ThingStatusInfoChangedEvent": "openhab/things/*/statuschanged",
+}
+
+
+def build_topic_filter(event_types) -> str:
+    """Build the minimal ``topics`` filter for the consumed event types."""
+    return ",".join(sorted({SSE_EVENT_TOPICS[event] for event in event_types}))
+
+
+class SSEEvent(NamedTuple):
+    """A complete SSE frame."""
+
+    event: str
+    data: bytes
+    id: str
+
+
+class SSEDecoder:
+    """Decode an SSE byte stream into complete event frames.
+
+    Works directly on raw chunks as they arrive from the socket and follows
+    the WHATWG event stream rules: CRLF/LF/CR line endings, multi-line
+    ``data:`` fields, ``:`` comments (keepalives), ``event``, ``id`` and
+    ``retry``. Field values stay ``bytes``; only the (short) event name and
+    id are decoded, so callers can hand ``data`` straight to ``json.loads``.
+    """
+
+    __slots__ = ("_buffer", "last_event_id", "retry", "comments")
+
+    def __init__(self) -> None:
+        """Initialize the decoder."""
+        self._buffer = b""
+        # Survive reconnects: the id is sent back as Last-Event-ID and the
+        # retry value is the server's requested reconnection delay (ms).
+        self.last_event_id = ""
+        self.retry: int | None = None
+        self.comments = 0
+
+    def reset(self) -> None:
+        """Drop any partially received frame (e.g. after a reconnect)."""
+        self._buffer = b""
+
+    def feed(self, chunk: bytes) -> list[SSEEvent]:
+        """Feed a chunk of bytes and return the frames it completed."""
+        buffer = self._buffer + chunk if self._buffer else chunk
+        held = b""
+        if _CR in buffer:
+            if buffer.endswith(_CR):
+                # Might be the first half of a CRLF split across chunks.
+                buffer, held = buffer[:-1], _CR
+            buffer = buffer.replace(b"\r\n", _LF).replace(_CR, _LF)
+
+        # Incomplete frames stay buffered until their blank line arrives.
+        blocks = buffer.split(_FRAME_END)
+        self._buffer = blocks.pop() + held
+
+        events: list[SSEEvent] = []
+        for block in blocks:
+            # Fast path: the single-line frames openHAB sends for every event.
+            if block.startswith(_MESSAGE_PREFIX):
+                if block.find(_LF, _MESSAGE_PREFIX_LEN) == -1:
+                    events.append(
+                        SSEEvent(
+                            "message", block[_MESSAGE_PREFIX_LEN:], self.last_event_id
+                        )
+                    )
+                    continue
+            if event := self._parse_block(block):
+                events.append(event)
+        return events
+
+    def _parse_block(self, block: bytes) -> SSEEvent | None:
+        """Parse one frame line by line (general case)."""
+        data: list[bytes] = []
+        event = b""
+        for line in block.split(_LF):
+            if not line:
+                continue
+            if line[0] == _COLON:
+                self.comments += 1
+                continue
+
+            field, _, value = line.partition(b":")
+            if value[:1] == _SPACE:
+                value = value[1:]
+
+            if field == b"data":
+                data.append(value)
+            elif field == b"event":
+                event = value
+            elif field == b"id":
+                if b"\0" not in value:
+                    self.last_event_id = value.decode("utf-8", "replace")
+            elif field == b"retry":
+                if value.isdigit():
+                    self.retry = int(value)
+
+        if not data:
+            return None
+        return SSEEvent(
+            event.decode("utf-8", "replace") if event else "message",
+            data[0] if len(data) == 1 else _LF.join(data),
+            self.last_event_id,
+        )
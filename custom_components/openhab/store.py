@@ -0,0 +1,190 @@
+"""Compact item store: immutable metadata records plus a small mutable state."""
+from __future__ import annotations
+
+from sys import intern
+from typing import Any, NamedTuple
+
+from openhab import OpenHAB
+from openhab.items import Item
+
+
+class ItemMeta(NamedTuple):
+    """Immutable item metadata, replaced only when openHAB changes the item."""
+
+    name: str
+    type_: str | None
+    group: bool
+    label: str
+    category: str
+    tags: tuple[str, ...]
+    groupNames: tuple[str, ...]
+    quantityType: str | None
+    editable: bool | None
+    type_ex: str | bool = False
+    parent_device_name: str | bool = False
+    devireg: dict[str, Any] | None = None
+
+
+def _intern(value: str | None) -> str | None:
+    """Intern a frequently repeated string (types, categories, groups)."""
+    return intern(value) if value else value
+
+
+def _interned(values: Any) -> tuple[str, ...]:
+    return tuple(intern(value) for value in values) if values else ()
+
+
+# One python-openhab item per item type, only used for its state parser.
+_PARSERS: dict[str | None, Item] = {}
+
+
+def _parser(type_: str | None) -> Item:
+    """Return the state parser for an item type."""
+    parser = _PARSERS.get(type_)
+    if parser is None:
+        data = {"name": "_parser", "state": "NULL"}
+        if type_ is None:
+            data.update(type="Group", members=[])
+        else:
+            data["type"] = type_
+        # json_to_item only needs the connection for group members.
+        parser = _PARSERS[type_] = OpenHAB.json_to_item(None, data)
+    return parser
+
+
+class StoredItem:
+    """One item in coordinator.data.
+
+    Reads like the python-openhab item it replaces (name, type_, label,
+    _state, _parse_rest, ...), but holds no connection, members dict or
+    per-instance attribute dict: metadata lives in one immutable ItemMeta
+    tuple per item, whose repeated strings (types, categories, tags, groups)
+    are interned, and only the state fields are mutable.
+    """
+
+    __slots__ = ("meta", "_raw_state", "_state", "_unitOfMeasure")
+
+    def __init__(
+        self,
+        meta: ItemMeta,
+        raw_state: Any = None,
+        state: Any = None,
+        unit_of_measure: str = "",
+    ) -> None:
+        """Initialize the item."""
+        self.meta = meta
+        self._raw_state = raw_state
+        self._state = state
+        self._unitOfMeasure = unit_of_measure
+
+    @classmethod
+    def from_item(cls, item: Item | StoredItem) -> StoredItem:
+        """Convert a classified python-openhab item."""
+        if isinstance(item, StoredItem):
+            return item
+        meta = ItemMeta(
+            item.name,
+            _intern(item.type_),
+            bool(item.group),
+            item.label or "",
+            _intern(item.category) or "",
+            _interned(item.tags),
+            _interned(item.groupNames),
+            _intern(item.quantityType),
+            item.editable,
+            _intern(getattr(item, "type_ex", False)) or False,
+            getattr(item, "parent_device_name", False),
+            getattr(item, "devireg", None),
+        )
+        return cls(meta, item._raw_state, item._state, item._unitOfMeasure)
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> StoredItem:
+        """Build an item from /items JSON (plus stored classification)."""
+        group = data["type"] == "Group"
+        type_ = data.get("groupType") if group else data["type"]
+        meta = ItemMeta(
+            data["name"],
+            _intern(type_),
+            group,
+            data.get("label", ""),
+            _intern(data.get("category", "")),
+            _interned(data.get("tags")),
+            _interned(data.get("groupNames")),
+            _intern(type_.partition(":")[2] or None) if type_ and not group else None,
+            data.get("editable"),
+            _intern(data.get("type_ex", False)) or False,
+            data.get("parent_device_name", False),
+            data.get("devireg"),
+        )
+        item = cls(meta)
+        item.set_state(data["state"])
+        return item
+
+    def set_state(self, raw_value: Any) -> None:
+        """Parse and store a raw state (errors propagate to the caller)."""
+        self._raw_state = raw_value
+        if self.is_undefined(raw_value):
+            self._state = None
+        else:
+            self._state, self._unitOfMeasure = self._parse_rest(raw_value)
+
+    def _parse_rest(self, value: str) -> tuple[Any, str]:
+        """Convert a raw state with the parser of the item type."""
+        return _parser(self.meta.type_)._parse_rest(value)
+
+    def is_undefined(self, value: str) -> bool:
+        """Return True for NULL/UNDEF states."""
+        return _parser(self.meta.type_).is_undefined(value)
+
+    name = property(lambda self: self.meta.name)
+    type_ = property(lambda self: self.meta.type_)
+    group = property(lambda self: self.meta.group)
+    label = property(lambda self: self.meta.label)
+    category = property(lambda self: self.meta.category)
+    tags = property(lambda self: self.meta.tags)
+    groupNames = property(lambda self: self.meta.groupNames)
+    quantityType = property(lambda self: self.meta.quantityType)
+    editable = property(lambda self: self.meta.editable)
+
+    def _classify(field: str) -> property:  # noqa: N805
+        """Property whose setter replaces the metadata record.
+
+        Only the classification done by fetch_all_items is assigned after
+        construction; everything else is read-only.
+        """
+
+        def setter(self: StoredItem, value: Any) -> None:
+            self.meta = self.meta._replace(**{field: value})
+
+        return property(lambda self: getattr(self.meta, field), setter)
+
+    type_ex = _classify("type_ex")
+    parent_device_name = _classify("parent_device_name")
+    devireg = _classify("devireg")
+    del _classify
+    unit_of_measure = property(lambda self: self._unitOfMeasure)
+
+    def __repr__(self) -> str:
+        """Return a short representation."""
+        return f"<StoredItem {self.meta.name} {self.meta.type_}={self._raw_state!r}>"
+
+
+def merge_items(
+    current: dict[str, StoredItem] | None, fresh: dict[str, StoredItem]
+) -> dict[str, StoredItem]:
+    """Keep the current object of every item whose metadata did not change.
+
+    Only the state is copied over, so entities keep their item and a full
+    refresh leaves no second copy of the catalog alive.
+    """
+    if not current:
+        return fresh
+    for name, item in fresh.items():
+        old = current.get(name)
+        if isinstance(old, StoredItem) and old.meta == item.meta:
+            old._raw_state = item._raw_state
+            old._state = item._state
+            old._unitOfMeasure = item._unitOfMeasure
+            fresh[name] = old
+    return fresh
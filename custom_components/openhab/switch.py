@@ -8,7 +8,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, ITEMS_MAP, SWITCH, LOGGER
+from .const import DOMAIN, SWITCH, LOGGER
 from .device_classes_map import SWITCH_DEVICE_CLASS_MAP
 from .entity import OpenHABEntity
 
@@ -21,39 +21,12 @@ async def async_setup_entry(
     """Setup sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Debug logging
-    total_items = len(coordinator.data.values())
-    group_items = [item for item in coordinator.data.values() if item.type_ == "Group"]
-    switch_groups = [item for item in coordinator.data.values() 
-                     if item.type_ == "Group" and hasattr(item, 'groupType') and item.groupType == "Switch"]
-    
-    LOGGER.info(f"Switch platform: Total items: {total_items}, Groups: {len(group_items)}, Switch groups: {len(switch_groups)}")
-    
-    # Count how many Switch items we have
-    switch_items = [item for item in coordinator.data.values() if item.type_ == "Switch"]
-    LOGGER.info(f"Switch items available: {len(switch_items)}")
-    
-    # Log some group details
-    for item in group_items[:5]:  # First 5 groups
-        group_type = getattr(item, 'groupType', 'NO_GROUPTYPE')
-        LOGGER.info(f"  Group: {item.name}, type: {item.type_}, groupType: {group_type}")
-
-    switches = []
-    for item in coordinator.data.values():
-        if (item.type_ex == 'devireg_attr_ui_switch'):
-            switches.append(OpenHABBinarySwitch(hass, coordinator, item))
-        elif (item.type_ex == False) and (item.type_ in ITEMS_MAP[SWITCH]):
-            switches.append(OpenHABBinarySwitch(hass, coordinator, item))
-        elif item.type_ == "Group" and hasattr(item, 'groupType') and item.groupType == "Switch":
-            LOGGER.info(f"  Adding switch group: {item.name}")
-            switches.append(OpenHABBinarySwitch(hass, coordinator, item))
-        # Treat untyped groups (type_ = None, no groupType) as switches
-        elif type(item).__name__ == 'GroupItem' and item.type_ is None and (not hasattr(item, 'groupType') or item.groupType is None):
-            LOGGER.info(f"  Adding untyped group as switch: {item.name}")
-            switches.append(OpenHABBinarySwitch(hass, coordinator, item))
-    
+    switches = coordinator.async_setup_platform(
+        SWITCH,
+        lambda item: OpenHABBinarySwitch(hass, coordinator, item),
+        async_add_devices,
+    )
     LOGGER.info(f"Switch platform: Adding {len(switches)} switch entities")
-    async_add_devices(switches)
 
 
 class OpenHABBinarySwitch(OpenHABEntity, SwitchEntity):
@@ -61,19 +34,32 @@ class OpenHABBinarySwitch(OpenHABEntity, SwitchEntity):
 
     _attr_device_class_map = SWITCH_DEVICE_CLASS_MAP
 
+    def _expected(self, command: str) -> str | None:
+        """Return the state a command produces (unknown for untyped groups).
+
+        The aggregate state of an untyped group is never reported as
+        ON/OFF, so showing the command optimistically would only flicker.
+        """
+        return None if self.item.type_ is None else command
+
     async def async_turn_on(self, **kwargs: dict[str, Any]) -> None:
         """Turn on the switch."""
-        await self.hass.async_add_executor_job(self.item.on)
+        await self.coordinator.async_send_command(self._id, "ON", self._expected("ON"))
         # Don't request refresh - SSE will provide the update
 
     async def async_turn_off(self, **kwargs: dict[str, Any]) -> None:
         """Turn off the switch."""
-        await self.hass.async_add_executor_job(self.item.off)
+        await self.coordinator.async_send_command(
+            self._id, "OFF", self._expected("OFF")
+        )
         # Don't request refresh - SSE will provide the update
 
     async def async_toggle(self, **kwargs: dict[str, Any]) -> None:
         """Toggle the switch."""
-        await self.hass.async_add_executor_job(self.item.toggle)
+        command = "OFF" if self.is_on else "ON"
+        await self.coordinator.async_send_command(
+            self._id, command, self._expected(command)
+        )
         # Don't request refresh - SSE will provide the update
 
     @property
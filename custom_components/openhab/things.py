@@ -0,0 +1,66 @@
+"""Item availability derived from the status of linked openHAB things."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+THING_ONLINE = "ONLINE"
+
+
+def thing_uid_of_channel(channel_uid: str) -> str:
+    """Return the thing UID of a channel UID (binding:type:[bridge:]id:channel)."""
+    return channel_uid.rpartition(":")[0]
+
+
+class ThingStatusIndex:
+    """Map items to the things they are linked to and track thing status.
+
+    Built from /links and /things on a full refresh and then kept current
+    from ThingStatusInfoChangedEvent, so thing status is never polled.
+    Items without links (virtual, rules, groups) are always available.
+    """
+
+    def __init__(
+        self,
+        links: Iterable[dict[str, Any]] = (),
+        things: Iterable[dict[str, Any]] | bool | None = (),
+    ) -> None:
+        """Initialize the index."""
+        self.item_things: dict[str, set[str]] = {}
+        self.thing_items: dict[str, set[str]] = {}
+        self.status: dict[str, str] = {}
+        self._offline: set[str] = set()
+
+        for thing in things or ():
+            if status := thing.get("statusInfo", {}).get("status"):
+                self._set_status(thing["UID"], status)
+        for link in links:
+            item_name = link.get("itemName")
+            channel_uid = link.get("channelUID")
+            if not item_name or not channel_uid:
+                continue
+            thing_uid = thing_uid_of_channel(channel_uid)
+            self.item_things.setdefault(item_name, set()).add(thing_uid)
+            self.thing_items.setdefault(thing_uid, set()).add(item_name)
+
+    def _set_status(self, thing_uid: str, status: str) -> None:
+        self.status[thing_uid] = status
+        if status == THING_ONLINE:
+            self._offline.discard(thing_uid)
+        else:
+            self._offline.add(thing_uid)
+
+    def is_available(self, item_name: str) -> bool:
+        """Return False when any thing linked to the item is not online."""
+        if not self._offline:
+            return True
+        things = self.item_things.get(item_name)
+        return not things or self._offline.isdisjoint(things)
+
+    def update(self, thing_uid: str, status: str) -> set[str]:
+        """Record a new thing status; return the items whose availability flipped."""
+        was_online = thing_uid not in self._offline
+        self._set_status(thing_uid, status)
+        if was_online == (status == THING_ONLINE):
+            return set()
+        return set(self.thing_items.get(thing_uid, ()))
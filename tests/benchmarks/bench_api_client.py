@@ -0,0 +1,93 @@
+"""Benchmark the native REST client against the python-openhab path.
+
+Measures catalog fetch time and command throughput against a live openHAB
+server. Commands re-send the item's current state, so nothing changes.
+
+    python -m tests.benchmarks.bench_api_client --url http://openhab:8080 \\
+        --token oh.xxx --item Kitchen_Light --commands 200
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+import aiohttp
+from openhab import OpenHAB
+
+from custom_components.openhab.api import OpenHABRestClient, items_from_json
+
+# Size of Home Assistant's default executor pool for I/O bound jobs.
+EXECUTOR_WORKERS = 5
+
+
+async def _bench_legacy(args, loop) -> dict[str, float]:
+    """Time the executor-wrapped python-openhab calls."""
+    oh = OpenHAB(f"{args.url}/rest", args.username, args.password, timeout=10)
+    if args.token:
+        oh.session.headers["X-OPENHAB-TOKEN"] = args.token
+    executor = ThreadPoolExecutor(max_workers=EXECUTOR_WORKERS)
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        await loop.run_in_executor(executor, oh.fetch_all_items)
+    fetch = (time.perf_counter() - start) / args.rounds
+
+    state = (await loop.run_in_executor(executor, oh.get_item_raw, args.item))["state"]
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            loop.run_in_executor(executor, oh.req_post, f"/items/{args.item}", state)
+            for _ in range(args.commands)
+        )
+    )
+    commands = args.commands / (time.perf_counter() - start)
+    executor.shutdown()
+    return {"catalog_fetch_s": fetch, "commands_per_s": commands}
+
+
+async def _bench_native(args) -> dict[str, float]:
+    """Time the native aiohttp client."""
+    headers = {"X-OPENHAB-TOKEN": args.token} if args.token else {}
+    auth = aiohttp.BasicAuth(args.username, args.password) if args.username else None
+
+    async with aiohttp.ClientSession() as session:
+        client = OpenHABRestClient(session, f"{args.url}/rest", headers, auth)
+
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            items_from_json(await client.async_get_items())
+        fetch = (time.perf_counter() - start) / args.rounds
+
+        state = (await client.async_get_item(args.item))["state"]
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(client.async_send_command(args.item, state) for _ in range(args.commands))
+        )
+        commands = args.commands / (time.perf_counter() - start)
+    return {"catalog_fetch_s": fetch, "commands_per_s": commands}
+
+
+async def main() -> None:
+    """Run both benchmarks and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--token", default="")
+    parser.add_argument("--username")
+    parser.add_argument("--password")
+    parser.add_argument("--item", required=True)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--commands", type=int, default=100)
+    args = parser.parse_args()
+
+    legacy = await _bench_legacy(args, asyncio.get_running_loop())
+    native = await _bench_native(args)
+
+    print(f"{'metric':<18}{'python-openhab':>16}{'native':>12}")
+    for key in ("catalog_fetch_s", "commands_per_s"):
+        print(f"{key:<18}{legacy[key]:>16.3f}{native[key]:>12.3f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+"""Benchmark device class matching: per-class substring loop vs DeviceClassMatcher.
+
+Runs over a synthetic corpus of item names and labels built from room words
+and device class names (including overlapping ones such as garage_door /
+door and power_factor / power), against every platform's class map:
+
+- first match: the former loop, first list entry contained in name or label
+- longest (loop): the same loop checking every class and keeping the longest,
+  i.e. the new semantics without the compiled pattern
+- matcher: DeviceClassMatcher, one compiled pattern pass per item
+
+Also reports how many items the former loop classified differently.
+
+    python -m tests.benchmarks.bench_device_class [--names 20000]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from custom_components.openhab import device_classes_map
+from custom_components.openhab.device_classes_map import DeviceClassMatcher
+
+MAPS = {
+    name.removesuffix("_DEVICE_CLASS_MAP").lower(): classes
+    for name, classes in vars(device_classes_map).items()
+    if name.endswith("_DEVICE_CLASS_MAP")
+}
+WORDS = [
+    "living",
+    "kitchen",
+    "bath",
+    "garage",
+    "front",
+    "main",
+    "room",
+    "sensor",
+    "state",
+    "level",
+    "meter",
+    "contact",
+    "value",
+    "outdoor",
+    "floor",
+]
+
+
+def corpus(count: int, seed: int = 0) -> list[tuple[str, str]]:
+    """Return (name, label) pairs, about half naming a device class."""
+    rnd = random.Random(seed)
+    classes = sorted({c for classes in MAPS.values() for c in classes})
+    pairs = []
+    for _ in range(count):
+        words = rnd.choices(WORDS, k=rnd.randint(1, 3))
+        if rnd.random() < 0.5:
+            words.insert(rnd.randint(0, len(words)), rnd.choice(classes))
+        name = "_".join(word.title() for word in words)
+        label = " ".join(words).capitalize() if rnd.random() < 0.8 else ""
+        pairs.append((name, label))
+    return pairs
+
+
+def first_match(classes: list[str], name: str, label: str) -> str:
+    """The former OpenHABEntity.device_class."""
+    name = name.lower()
+    label = label.lower()
+    for device_class in classes:
+        if device_class in name or device_class in label:
+            return device_class
+    return ""
+
+
+def longest_loop(classes: list[str], name: str, label: str) -> str:
+    """Check every class with `in` and keep the longest."""
+    name = name.lower()
+    label = label.lower()
+    best = ""
+    for device_class in classes:
+        if len(device_class) > len(best) and (
+            device_class in name or device_class in label
+        ):
+            best = device_class
+    return best
+
+
+def _run(match, pairs: list[tuple[str, str]]) -> tuple[float, list[str]]:
+    start = time.perf_counter()
+    results = [match(name, label) for name, label in pairs]
+    return time.perf_counter() - start, results
+
+
+def main() -> None:
+    """Run all variants over every class map and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--names", type=int, default=20000)
+    args = parser.parse_args()
+
+    pairs = corpus(args.names)
+    print(f"corpus: {len(pairs)} names")
+    print(
+        f"{'map':<15}{'classes':>8}{'first_us':>10}{'longest_us':>12}"
+        f"{'matcher_us':>12}{'changed':>9}"
+    )
+    for map_name, classes in MAPS.items():
+        matcher = DeviceClassMatcher(classes)
+        first_s, first = _run(
+            lambda name, label: first_match(classes, name, label), pairs
+        )
+        loop_s, _ = _run(lambda name, label: longest_loop(classes, name, label), pairs)
+        matcher_s, matched = _run(matcher.match, pairs)
+        changed = sum(1 for a, b in zip(first, matched) if a != b)
+        per_name = 1e6 / len(pairs)
+        print(
+            f"{map_name:<15}{len(classes):>8}{first_s * per_name:>10.2f}"
+            f"{loop_s * per_name:>12.2f}{matcher_s * per_name:>12.2f}{changed:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
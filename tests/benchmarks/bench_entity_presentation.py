@@ -0,0 +1,128 @@
+"""Benchmark per-state-write CPU of openHAB entities: computed vs cached presentation.
+
+Builds the entities of every platform for a generated catalog and times
+Entity._async_generate_attributes (what HA runs on each state write, without
+the state machine). The legacy variant recomputes name, icon, device class
+and device info in properties on every read; the cached variant serves the
+_attr_* fields set when the entity was created.
+
+    python -m tests.benchmarks.bench_entity_presentation [--items 5000] [--profile]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import cProfile
+import importlib
+import pstats
+import tempfile
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.openhab.api import items_from_json
+from custom_components.openhab.catalog import ItemCatalog
+from custom_components.openhab.const import DOMAIN, PLATFORMS
+from custom_components.openhab.coordinator import OpenHABDataUpdateCoordinator
+from custom_components.openhab.entity import OpenHABEntity
+
+from ..fake_openhab import generate_catalog
+
+
+class LegacyPresentation:
+    """The former properties, recomputed on every read."""
+
+    @property
+    def name(self) -> str:
+        return self.item.label if len(self.item.label) > 0 else self.item.name
+
+    @property
+    def device_class(self) -> str:
+        return self._device_class()
+
+    @property
+    def icon(self) -> str:
+        return self._icon()
+
+    @property
+    def device_info(self):
+        return self._device_info()
+
+
+async def _entities(hass: HomeAssistant, count: int) -> list:
+    """Create the entities of every platform (devireg units excluded)."""
+    api = MagicMock()
+    api._base_url = "http://openhab:8080"
+    coordinator = OpenHABDataUpdateCoordinator(hass, api=api)
+    coordinator.is_online = True
+    coordinator.data = items_from_json(generate_catalog(count, devireg_units=0).items)
+    coordinator.catalog = ItemCatalog(coordinator.data.values())
+    entry = SimpleNamespace(entry_id="bench", options={})
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    entities: list = []
+    for platform in PLATFORMS:
+        module = importlib.import_module(f"custom_components.openhab.{platform}")
+        await module.async_setup_entry(hass, entry, entities.extend)
+    return [entity for entity in entities if isinstance(entity, OpenHABEntity)]
+
+
+_LEGACY_CLASSES: dict[type, type] = {}
+
+
+def _legacy(entity):
+    """Return a copy of an entity with the recomputing properties."""
+    cls = type(entity)
+    if cls not in _LEGACY_CLASSES:
+        _LEGACY_CLASSES[cls] = type(
+            f"Legacy{cls.__name__}", (LegacyPresentation, cls), {}
+        )
+    legacy = object.__new__(_LEGACY_CLASSES[cls])
+    legacy.__dict__.update(entity.__dict__)
+    return legacy
+
+
+def _time_writes(entities: list, rounds: int) -> float:
+    """Return the mean seconds per state write."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for entity in entities:
+            entity._async_generate_attributes()
+    return (time.perf_counter() - start) / (rounds * len(entities))
+
+
+async def _main(args) -> None:
+    """Build the entities and time both variants."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        cached = await _entities(hass, args.items)
+        legacy = [_legacy(entity) for entity in await _entities(hass, args.items)]
+
+    print(f"entities: {len(cached)}")
+    print(f"{'variant':<10}{'us/write':>10}")
+    results = {}
+    for name, entities in (("legacy", legacy), ("cached", cached)):
+        results[name] = _time_writes(entities, args.rounds)
+        print(f"{name:<10}{results[name] * 1e6:>10.2f}")
+    print(f"speedup: {results['legacy'] / results['cached']:.2f}x")
+
+    if args.profile:
+        for name, entities in (("legacy", legacy), ("cached", cached)):
+            print(f"\n--- {name} ---")
+            profiler = cProfile.Profile()
+            profiler.runcall(_time_writes, entities, 1)
+            pstats.Stats(profiler).sort_stats("tottime").print_stats(12)
+
+
+def main() -> None:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--profile", action="store_true")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
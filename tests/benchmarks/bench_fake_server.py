@@ -0,0 +1,147 @@
+"""Benchmark the integration end to end against the in-process openHAB stand-in.
+
+For each catalog size the fake server (tests/fake_openhab.py) serves a
+generated catalog and measures:
+
+- catalog fetch: OpenHABApiClient.async_get_items (HTTP, decode, classify)
+- platform setup: ItemCatalog plus every platform's async_setup_entry
+  (entity construction; registration with Home Assistant is not included)
+- SSE throughput: unthrottled state updates until all their events (an
+  updated+changed pair per change) are processed
+- event -> state latency: state changes at --rate events/s, timed from
+  publishing to the item listener call (includes the coalescing window)
+
+Server and integration share one event loop, so throughput includes the
+cost of producing the stream.
+
+    python -m tests.benchmarks.bench_fake_server [--items 1000 10000 50000]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import statistics
+import tempfile
+import time
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.openhab.api import OpenHABApiClient
+from custom_components.openhab.catalog import ItemCatalog
+from custom_components.openhab.connection import OpenHABConnectionPool
+from custom_components.openhab.const import CONF_AUTH_TYPE_TOKEN, DOMAIN, PLATFORMS
+from custom_components.openhab.coordinator import OpenHABDataUpdateCoordinator
+
+from ..fake_openhab import FakeOpenHAB, generate_catalog
+
+
+async def _processed(coordinator: OpenHABDataUpdateCoordinator, count: int) -> None:
+    """Wait until count SSE events were received and written."""
+    counters = coordinator.metrics.counters
+    while (
+        counters["sse_events"] < count
+        or coordinator._pending_states
+        or coordinator._flush_handle is not None
+    ):
+        await asyncio.sleep(0.001)
+
+
+async def _bench_size(hass: HomeAssistant, args, count: int) -> dict[str, float]:
+    """Run all measurements for one catalog size."""
+    async with FakeOpenHAB(generate_catalog(count)) as server:
+        api = OpenHABApiClient(
+            hass,
+            base_url=server.url,
+            auth_type=CONF_AUTH_TYPE_TOKEN,
+            auth_token="",
+            username="",
+            password="",
+            pool=OpenHABConnectionPool(hass),
+        )
+        coordinator = OpenHABDataUpdateCoordinator(hass, api=api)
+        coordinator.coalesce_window = args.coalesce_ms / 1000
+        result: dict[str, float] = {}
+
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            items = await api.async_get_items()
+        result["fetch_s"] = (time.perf_counter() - start) / args.rounds
+
+        entry = SimpleNamespace(entry_id="bench", options={})
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+        modules = [
+            importlib.import_module(f"custom_components.openhab.{platform}")
+            for platform in PLATFORMS
+        ]
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            coordinator.data = items
+            coordinator.catalog = ItemCatalog(items.values())
+            for module in modules:
+                await module.async_setup_entry(hass, entry, lambda entities: None)
+        result["setup_s"] = (time.perf_counter() - start) / args.rounds
+
+        task = asyncio.create_task(coordinator._listen_sse_events())
+        while not coordinator.sse_connected:
+            await asyncio.sleep(0.01)
+
+        start = time.perf_counter()
+        await server.async_emit_states(args.events)
+        await _processed(coordinator, server.published.total())
+        result["events_per_s"] = args.events / (time.perf_counter() - start)
+
+        latencies: list[float] = []
+        for name in server.catalog.mutators:
+            coordinator.async_add_item_listener(
+                name,
+                lambda name=name: latencies.append(
+                    time.monotonic() - server.sent_at[name]
+                ),
+            )
+        await server.async_emit_states(args.latency_events, args.rate)
+        await _processed(coordinator, server.published.total())
+        quantiles = statistics.quantiles(latencies, n=100)
+        result["latency_p50_ms"] = quantiles[49] * 1000
+        result["latency_p95_ms"] = quantiles[94] * 1000
+        result["latency_p99_ms"] = quantiles[98] * 1000
+
+        coordinator._stop_sse = True
+        task.cancel()
+        await api.pool.async_close()
+        hass.data[DOMAIN].clear()
+        return result
+
+
+async def _main(args) -> None:
+    """Run the benchmark for every requested size."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        print(
+            f"{'items':>8}{'fetch_s':>10}{'setup_s':>10}{'events/s':>10}"
+            f"{'p50_ms':>9}{'p95_ms':>9}{'p99_ms':>9}"
+        )
+        for count in args.items:
+            r = await _bench_size(hass, args, count)
+            print(
+                f"{count:>8}{r['fetch_s']:>10.3f}{r['setup_s']:>10.3f}"
+                f"{r['events_per_s']:>10.0f}{r['latency_p50_ms']:>9.1f}"
+                f"{r['latency_p95_ms']:>9.1f}{r['latency_p99_ms']:>9.1f}"
+            )
+
+
+def main() -> None:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--latency-events", type=int, default=1000)
+    parser.add_argument("--rate", type=float, default=200)
+    parser.add_argument("--coalesce-ms", type=float, default=50)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
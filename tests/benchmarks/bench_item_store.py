@@ -0,0 +1,86 @@
+"""Benchmark memory of coordinator.data: python-openhab items vs StoredItem.
+
+Uses tracemalloc to measure, per item,
+- resident: what coordinator.data keeps alive between refreshes
+- refresh peak: the extra memory while a full refresh builds the new set
+  next to the current one (python-openhab: both sets until entities swap;
+  StoredItem: the new set until merge_items reuses the unchanged items)
+
+The python-openhab variant is the former fetch_all_items result (items
+with the type_ex / parent_device_name attributes set on them).
+
+    python -m tests.benchmarks.bench_item_store [--items 20000]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+
+from openhab import OpenHAB
+
+from custom_components.openhab.api import items_from_json
+from custom_components.openhab.store import merge_items
+
+from ..fake_openhab import generate_catalog
+
+
+def legacy_items(oh: OpenHAB, items_json: list[dict]) -> dict:
+    """The former coordinator.data."""
+    items = {}
+    for data in items_json:
+        item = items[data["name"]] = oh.json_to_item(data)
+        item.type_ex = False
+        item.parent_device_name = False
+    return items
+
+
+def compact_items(oh: OpenHAB, items_json: list[dict]) -> dict:
+    """coordinator.data built by fetch_all_items now."""
+    return items_from_json(items_json)
+
+
+def _measure(build, merge, oh: OpenHAB, items_json: list[dict]) -> tuple[int, int]:
+    """Return (resident, refresh peak) bytes."""
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    current = build(oh, items_json)
+    gc.collect()
+    resident = tracemalloc.get_traced_memory()[0] - base
+
+    tracemalloc.reset_peak()
+    current = merge(current, build(oh, items_json))
+    gc.collect()
+    peak = tracemalloc.get_traced_memory()[1] - base - resident
+    tracemalloc.stop()
+    del current
+    return resident, peak
+
+
+def main() -> None:
+    """Run both variants and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=20000)
+    args = parser.parse_args()
+
+    oh = OpenHAB("http://openhab:8080/rest")
+    items_json = generate_catalog(args.items).items
+    count = len(items_json)
+
+    variants = (
+        ("python-openhab", legacy_items, lambda current, fresh: fresh),
+        ("StoredItem", compact_items, merge_items),
+    )
+    print(f"catalog: {count} items")
+    print(f"{'variant':<16}{'resident_MiB':>14}{'B/item':>9}{'refresh_peak_MiB':>18}")
+    for name, build, merge in variants:
+        resident, peak = _measure(build, merge, oh, items_json)
+        print(
+            f"{name:<16}{resident / 2**20:>14.1f}{resident / count:>9.0f}"
+            f"{peak / 2**20:>18.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark platform item selection with per-platform scans vs ItemCatalog.
+
+The legacy variant replays the scans the platform setups used to do over
+coordinator.data (four in switch, two in light, one in each other
+platform). The catalog variant builds ItemCatalog once and reads the
+pre-partitioned lists. Entity construction is excluded from both.
+
+    python -m tests.benchmarks.bench_platform_setup [--items 10000]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from openhab import OpenHAB
+
+from custom_components.openhab.catalog import ItemCatalog
+from custom_components.openhab.const import ITEMS_MAP, PLATFORMS
+
+from .bench_startup import synthetic_catalog
+
+
+def _untyped_group(item) -> bool:
+    return (
+        type(item).__name__ == "GroupItem"
+        and item.type_ is None
+        and (not hasattr(item, "groupType") or item.groupType is None)
+    )
+
+
+def legacy_select(data: dict) -> int:
+    """The previous per-platform scans."""
+    selected = 0
+    values = data.values()
+    # switch: three debug scans plus the selection scan
+    [i for i in values if i.type_ == "Group"]
+    [i for i in values if i.type_ == "Group" and hasattr(i, "groupType")]
+    [i for i in values if i.type_ == "Switch"]
+    for i in values:
+        if (
+            i.type_ex == "devireg_attr_ui_switch"
+            or (i.type_ex is False and i.type_ in ITEMS_MAP["switch"])
+            or _untyped_group(i)
+        ):
+            selected += 1
+    # light: one scan per light type
+    selected += sum(1 for i in values if i.type_ == "Color")
+    selected += sum(1 for i in values if i.type_ == "Dimmer")
+    for i in values:  # sensor
+        if _untyped_group(i):
+            continue
+        if i.type_ex == "devireg_attr_ui_sensor" or (
+            i.type_ex is False and i.type_ in ITEMS_MAP["sensor"]
+        ):
+            selected += 1
+    selected += sum(1 for i in values if i.type_ in ITEMS_MAP["cover"])
+    selected += sum(
+        1
+        for i in values
+        if i.type_ex == "devireg_attr_ui_binary_sensor"
+        or (i.type_ex is False and i.type_ in ITEMS_MAP["binary_sensor"])
+    )
+    selected += sum(1 for i in values if i.type_ex == "devireg_unit")
+    selected += sum(1 for i in values if i.type_ in ITEMS_MAP["device_tracker"])
+    selected += sum(1 for i in values if i.type_ == ITEMS_MAP["media_player"])
+    return selected
+
+
+def catalog_select(data: dict) -> int:
+    """Build the catalog once and read every platform's list."""
+    catalog = ItemCatalog(data.values())
+    return sum(len(catalog.platform_items(platform)) for platform in PLATFORMS)
+
+
+def main() -> None:
+    """Run both variants and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    oh = OpenHAB("http://openhab:8080/rest")
+    data = {}
+    for item_json in synthetic_catalog(args.items):
+        item = data[item_json["name"]] = oh.json_to_item(item_json)
+        item.type_ex = False
+        item.parent_device_name = False
+
+    print(f"{'variant':<10}{'ms/setup':>10}{'selected':>10}")
+    for name, select in (("legacy", legacy_select), ("catalog", catalog_select)):
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            selected = select(data)
+        elapsed = (time.perf_counter() - start) / args.rounds * 1000
+        print(f"{name:<10}{elapsed:>10.2f}{selected:>10}")
+
+
+if __name__ == "__main__":
+    main()
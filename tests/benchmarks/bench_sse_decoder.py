@@ -0,0 +1,116 @@
+"""Micro-benchmark for the SSE frame decoder.
+
+Decodes a recorded openHAB event stream (or a synthetic one shaped like it)
+with the previous line-based reader loop and with SSEDecoder. Both variants
+include the JSON decode of each frame, as the coordinator does.
+
+    python -m tests.benchmarks.bench_sse_decoder [--file stream.txt]
+        [--events 100000] [--chunk 4096]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+from custom_components.openhab.sse import SSEDecoder
+
+
+def synthetic_stream(count: int) -> bytes:
+    """Build an openHAB-like stream of state events with keepalives."""
+    rnd = random.Random(0)
+    frames = []
+    for i in range(count):
+        if i % 500 == 0:
+            frames.append(b'event: alive\ndata: {"type":"ALIVE","interval":10}\n\n')
+            continue
+        name = f"Meter_{rnd.randrange(2000)}_Power"
+        value = f"{rnd.uniform(0, 5000):.1f} W"
+        payload = json.dumps({"type": "Quantity", "value": value})
+        data = json.dumps(
+            {
+                "topic": f"openhab/items/{name}/stateupdated",
+                "payload": payload,
+                "type": "ItemStateUpdatedEvent",
+            }
+        )
+        frames.append(f"event: message\ndata: {data}\n\n".encode())
+    return b"".join(frames)
+
+
+def chunked(stream: bytes, size: int) -> list[bytes]:
+    """Split the stream the way socket reads would."""
+    return [stream[i : i + size] for i in range(0, len(stream), size)]
+
+
+def legacy_decode(chunks: list[bytes]) -> int:
+    """The previous reader: split lines, decode and strip, merge dicts."""
+    count = 0
+    pending = b""
+    event_data: dict = {}
+    for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            decoded = line.decode("utf-8").strip()
+            if not decoded:
+                if event_data:
+                    count += 1
+                    event_data = {}
+                continue
+            if ":" in decoded:
+                field, _, value = decoded.partition(":")
+                field = field.strip()
+                value = value.strip()
+                if field == "data":
+                    try:
+                        event_data.update(json.loads(value))
+                    except json.JSONDecodeError:
+                        pass
+                elif field in ("event", "id"):
+                    event_data[field] = value
+    return count
+
+
+def decoder_decode(chunks: list[bytes]) -> int:
+    """SSEDecoder followed by one json.loads per frame."""
+    count = 0
+    decoder = SSEDecoder()
+    for chunk in chunks:
+        for frame in decoder.feed(chunk):
+            json.loads(frame.data.decode())
+            count += 1
+    return count
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--file", help="recorded raw SSE stream")
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--chunk", type=int, default=4096)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, "rb") as fhdl:
+            stream = fhdl.read()
+    else:
+        stream = synthetic_stream(args.events)
+    chunks = chunked(stream, args.chunk)
+
+    for name, func in (("legacy", legacy_decode), ("SSEDecoder", decoder_decode)):
+        elapsed = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            count = func(chunks)
+            elapsed = min(elapsed, time.perf_counter() - start)
+        print(
+            f"{name:<12}{count:>9} events {elapsed:8.3f}s "
+            f"{count / elapsed:>12,.0f} events/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
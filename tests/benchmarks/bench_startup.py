@@ -0,0 +1,88 @@
+"""Benchmark cold-start catalog setup with and without the catalog snapshot.
+
+Without a snapshot, setup waits for openHAB to answer /items (simulated by
+--latency), decodes the response and classifies the catalog. With a
+snapshot, setup only decodes the stored file and rebuilds the items; the
+live fetch happens in the background afterwards.
+
+    python -m tests.benchmarks.bench_startup [--items 5000] [--latency 0.5]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+from openhab import OpenHAB
+
+from custom_components.openhab.api import fetch_all_items
+from custom_components.openhab.snapshot import _to_data, item_from_json
+
+TYPES = (
+    ("Switch", "ON"),
+    ("Number:Power", "1250.5 W"),
+    ("Number:Temperature", "21.5 °C"),
+    ("Contact", "CLOSED"),
+    ("Dimmer", "40"),
+    ("String", "auto"),
+    ("Rollershutter", "0"),
+)
+
+
+def synthetic_catalog(count: int) -> list[dict]:
+    """Build an /items response with groups and typed members."""
+    rnd = random.Random(0)
+    groups = [f"Room_{i}" for i in range(max(count // 50, 1))]
+    items = [
+        {"name": name, "type": "Group", "state": "NULL", "label": name, "members": []}
+        for name in groups
+    ]
+    for i in range(count - len(groups)):
+        type_, state = TYPES[i % len(TYPES)]
+        items.append(
+            {
+                "name": f"Item_{i}",
+                "type": type_,
+                "state": state,
+                "label": f"Item {i}",
+                "groupNames": [rnd.choice(groups)],
+                "tags": [],
+                "editable": True,
+            }
+        )
+    return items
+
+
+def main() -> None:
+    """Run both variants and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    oh = OpenHAB("http://openhab:8080/rest")
+    response = json.dumps(synthetic_catalog(args.items))
+    items = fetch_all_items(oh, json.loads(response), [])
+    stored = json.dumps({"version": 1, "data": _to_data("4.1.0", items)})
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        fetch_all_items(oh, json.loads(response), [])
+    cold = (time.perf_counter() - start) / args.rounds
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        data = json.loads(stored)["data"]
+        {item["name"]: item_from_json(item) for item in data["items"]}
+    warm = (time.perf_counter() - start) / args.rounds
+
+    print(f"catalog: {args.items} items, snapshot {len(stored) / 1024:.0f} KiB")
+    print(f"{'variant':<22}{'setup_s':>10}")
+    print(f"{'fetch + classify':<22}{cold + args.latency:>10.3f}")
+    print(f"{'snapshot':<22}{warm:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Replay a recorded openHAB SSE capture through the coordinator.
+
+Captures are written by the openhab.save_sse_recording service (enable the
+"record the last N raw event stream chunks" option first). The recorded
+chunks are fed to OpenHABDataUpdateCoordinator exactly as they came off the
+socket, at the recorded pace times --speed, or as fast as possible with
+"max". No network is involved; fallback refreshes hit an offline API.
+
+    python -m tests.benchmarks.replay_sse capture.sse.gz [--speed 1 10 max]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.openhab.catalog import ItemCatalog
+from custom_components.openhab.coordinator import OpenHABDataUpdateCoordinator
+from custom_components.openhab.recorder import Recording, load_recording
+from custom_components.openhab.sse import SSEDecoder
+
+LAG_INTERVAL = 0.01
+# Chunks processed between yields to the loop at max speed.
+MAX_SPEED_BATCH = 100
+
+
+class OfflineApi:
+    """API stand-in: the catalog is known, there is no server."""
+
+    _base_url = ""
+    _rest_url = ""
+    pool = None
+    things = None
+
+    def __init__(self, items: dict[str, Any]) -> None:
+        self.items = items
+
+    async def async_get_version(self) -> str:
+        return "replay"
+
+    async def async_get_items(self, timer=None) -> dict[str, Any]:
+        return self.items
+
+    async def async_get_things(self) -> list:
+        return []
+
+    async def async_get_links(self) -> list:
+        return []
+
+    async def async_get_item_states(self) -> dict[str, str]:
+        return {name: item._raw_state for name, item in self.items.items()}
+
+    async def async_send_command(self, item_name: str, command: str) -> None:
+        """Commands are dropped; a replay has no server to act on them."""
+
+
+async def _measure_lag(samples: list[float]) -> None:
+    """Record how late a periodic timer fires (event loop lag)."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + LAG_INTERVAL
+        await asyncio.sleep(LAG_INTERVAL)
+        samples.append(max(loop.time() - expected, 0.0))
+
+
+async def async_replay(
+    hass: HomeAssistant, recording: Recording, speed: float | None
+) -> dict[str, float]:
+    """Replay a capture; speed None replays as fast as possible."""
+    items = recording.build_items()
+    # The catalog holds the states at save time, i.e. after the recorded
+    # events; clear them so the first event per item is not deduplicated.
+    for item in items.values():
+        item._raw_state = None
+    coordinator = OpenHABDataUpdateCoordinator(hass, api=OfflineApi(items))
+    coordinator.data = items
+    coordinator.catalog = ItemCatalog(items.values())
+
+    writes = 0
+
+    def count_write() -> None:
+        nonlocal writes
+        writes += 1
+
+    for name in items:
+        coordinator.async_add_item_listener(name, count_write)
+
+    lag: list[float] = []
+    lag_task = asyncio.create_task(_measure_lag(lag))
+    decoder = SSEDecoder()
+    chunks = recording.chunks
+    first = chunks[0].offset if chunks else 0.0
+    start = time.monotonic()
+    for index, (offset, data) in enumerate(chunks):
+        if speed is not None:
+            ahead = start + (offset - first) / speed - time.monotonic()
+            if ahead > 0:
+                await asyncio.sleep(ahead)
+        elif index % MAX_SPEED_BATCH == MAX_SPEED_BATCH - 1:
+            await asyncio.sleep(0)
+        await coordinator._process_sse_chunk(decoder, data)
+    while coordinator._flush_handle is not None:
+        await asyncio.sleep(0.001)
+    elapsed = time.monotonic() - start
+    lag_task.cancel()
+    await coordinator.async_shutdown()
+
+    counters = coordinator.metrics.counters
+    lag = lag or [0.0]
+    return {
+        "duration_s": elapsed,
+        "events": counters["sse_events"],
+        "events_per_s": counters["sse_events"] / elapsed if elapsed else 0.0,
+        "state_writes": writes,
+        "fallback_refreshes": counters["fallback_refreshes"],
+        "lag_p50_ms": statistics.median(lag) * 1000,
+        "lag_max_ms": max(lag) * 1000,
+    }
+
+
+async def _main(args) -> None:
+    """Replay the capture at every requested speed."""
+    recording = load_recording(args.path)
+    print(
+        f"capture: {len(recording.chunks)} chunks, {len(recording.items)} items, "
+        f"recorded {recording.header.get('recorded')}"
+    )
+    print(
+        f"{'speed':>6}{'duration_s':>12}{'events':>9}{'events/s':>10}"
+        f"{'writes':>9}{'fallbacks':>11}{'lag_p50_ms':>12}{'lag_max_ms':>12}"
+    )
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        for speed in args.speed:
+            r = await async_replay(
+                hass, recording, None if speed == "max" else float(speed)
+            )
+            print(
+                f"{speed:>6}{r['duration_s']:>12.3f}{r['events']:>9}"
+                f"{r['events_per_s']:>10.0f}{r['state_writes']:>9}"
+                f"{r['fallback_refreshes']:>11}{r['lag_p50_ms']:>12.2f}"
+                f"{r['lag_max_ms']:>12.2f}"
+            )
+
+
+def main() -> None:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path")
+    parser.add_argument("--speed", nargs="+", default=["1", "10", "max"])
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,431 @@
+"""In-process stand-in for the openHAB REST API and SSE event stream.
+
+Serves a generated catalog (plain items, groups, devireg-style units and
+their things/links), streams state events at a configurable rate and
+records the commands it receives. Like openHAB, every state change is
+published as an ItemStateUpdatedEvent + ItemStateChangedEvent pair, frames
+carry no ``id:`` and the ``topics`` query of /rest/events is honoured.
+Used by tests and by the benchmarks in tests/benchmarks/.
+
+    async with FakeOpenHAB(generate_catalog(1000)) as server:
+        client = OpenHABApiClient(hass, server.url, ...)
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+import itertools
+import json
+import random
+import time
+from typing import Any
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+VERSION = "4.1.0"
+ALIVE_INTERVAL = 10.0
+
+# Plain item types with a state and a function producing the next state.
+ITEM_TYPES = (
+    ("Switch", "OFF", lambda rnd, old: "ON" if old == "OFF" else "OFF"),
+    ("Number:Temperature", "21.5 °C", lambda rnd, old: f"{rnd.uniform(15, 25):.1f} °C"),
+    ("Number:Power", "100 W", lambda rnd, old: f"{rnd.randint(0, 3000)} W"),
+    ("Contact", "CLOSED", lambda rnd, old: "OPEN" if old == "CLOSED" else "CLOSED"),
+    ("Dimmer", "0", lambda rnd, old: str(rnd.randint(0, 100))),
+    ("String", "idle", lambda rnd, old: rnd.choice(("idle", "busy", "away"))),
+    ("Rollershutter", "0", lambda rnd, old: str(rnd.randint(0, 100))),
+)
+
+# Members of a devireg unit: (suffix, type, state, label).
+DEVIREG_MEMBERS = (
+    ("Mode", "String", "AtHome", "Mode"),
+    ("State", "String", "Heating", "State"),
+    ("RoomTemperature", "Number:Temperature", "21.0 °C", "Room temperature"),
+    ("FloorTemperature", "Number:Temperature", "24.0 °C", "Floor temperature"),
+    ("WindowOpen", "Contact", "CLOSED", "Window open"),
+    ("ScreenLock", "Switch", "OFF", "Screen lock"),
+    ("Setpoint", "Number:Temperature", "22.0 °C", "Setpoint"),
+)
+
+
+@dataclass
+class FakeCatalog:
+    """Raw /items, /things and /links responses."""
+
+    items: list[dict[str, Any]]
+    things: list[dict[str, Any]]
+    links: list[dict[str, Any]]
+    # Non-group item name -> function producing its next state.
+    mutators: dict[str, Any] = field(default_factory=dict)
+
+
+def generate_catalog(
+    count: int,
+    *,
+    groups: int | None = None,
+    devireg_units: int | None = None,
+    seed: int = 0,
+) -> FakeCatalog:
+    """Generate a catalog of about count items.
+
+    One group per 50 items and one devireg unit per 500 items unless given.
+    Every plain item is linked to one of a pool of things (10 items each).
+    """
+    rnd = random.Random(seed)
+    groups = max(count // 50, 1) if groups is None else groups
+    devireg_units = count // 500 if devireg_units is None else devireg_units
+    items: list[dict[str, Any]] = []
+    things: list[dict[str, Any]] = []
+    links: list[dict[str, Any]] = []
+    mutators: dict[str, Any] = {}
+
+    group_names = [f"Room_{i}" for i in range(groups)]
+    for name in group_names:
+        items.append(
+            {
+                "name": name,
+                "type": "Group",
+                "state": "NULL",
+                "label": name.replace("_", " "),
+                "members": [],
+                "groupNames": [],
+                "tags": ["Location"],
+                "editable": True,
+            }
+        )
+
+    for unit in range(devireg_units):
+        name = f"DeviReg_{unit}"
+        thing_uid = f"danfoss:devismart:{unit}"
+        items.append(
+            {
+                "name": name,
+                "type": "Group",
+                "state": "NULL",
+                "label": f"Thermostat {unit}",
+                "members": [],
+                "groupNames": [],
+                "tags": [],
+                "editable": True,
+            }
+        )
+        for suffix, type_, state, label in DEVIREG_MEMBERS:
+            member = f"{name}_{suffix}"
+            items.append(
+                {
+                    "name": member,
+                    "type": type_,
+                    "state": state,
+                    "label": label,
+                    "groupNames": [name],
+                    "tags": [],
+                    "editable": True,
+                }
+            )
+            links.append(
+                {"itemName": member, "channelUID": f"{thing_uid}:{suffix.lower()}"}
+            )
+        things.append(
+            {
+                "UID": thing_uid,
+                "thingTypeUID": "danfoss:devismart",
+                "label": f"DeviSmart {unit}",
+                "properties": {
+                    "serialNumber": f"SN{unit:06d}",
+                    "firmwareVersion": "1.11",
+                    "regulationType": "Room",
+                },
+                "statusInfo": {"status": "ONLINE", "statusDetail": "NONE"},
+                "channels": [
+                    {
+                        "uid": f"{thing_uid}:mode",
+                        "channelTypeUID": "danfoss:control_mode",
+                        "linkedItems": [f"{name}_Mode"],
+                    },
+                    {
+                        "uid": f"{thing_uid}:state",
+                        "channelTypeUID": "danfoss:control_state",
+                        "linkedItems": [f"{name}_State"],
+                    },
+                ],
+            }
+        )
+
+    plain = max(count - len(items), 0)
+    for i in range(plain):
+        type_, state, mutate = ITEM_TYPES[i % len(ITEM_TYPES)]
+        name = f"Item_{i}"
+        items.append(
+            {
+                "name": name,
+                "type": type_,
+                "state": state,
+                "label": f"Item {i}",
+                "groupNames": [rnd.choice(group_names)],
+                "tags": [],
+                "editable": True,
+            }
+        )
+        mutators[name] = mutate
+        thing_uid = f"mqtt:topic:thing{i // 10}"
+        if i % 10 == 0:
+            things.append(
+                {
+                    "UID": thing_uid,
+                    "thingTypeUID": "mqtt:topic",
+                    "label": f"Thing {i // 10}",
+                    "properties": {},
+                    "statusInfo": {"status": "ONLINE", "statusDetail": "NONE"},
+                    "channels": [],
+                }
+            )
+        links.append({"itemName": name, "channelUID": f"{thing_uid}:{name.lower()}"})
+
+    return FakeCatalog(items, things, links, mutators)
+
+
+def _frame(event: str, data: Any, event_id: int | None = None) -> bytes:
+    """Encode one SSE frame the way openHAB does."""
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+class FakeOpenHAB:
+    """aiohttp application serving a FakeCatalog under /rest."""
+
+    def __init__(
+        self,
+        catalog: FakeCatalog,
+        *,
+        echo_commands: bool = True,
+        alive_interval: float = ALIVE_INTERVAL,
+        event_ids: bool = False,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the server (call async_start or use async with).
+
+        event_ids adds ``id:`` lines to the frames but, like a proxy in
+        front of openHAB, still ignores Last-Event-ID on reconnect.
+        """
+        self.catalog = catalog
+        self.items = {item["name"]: item for item in catalog.items}
+        self.echo_commands = echo_commands
+        self.alive_interval = alive_interval
+        self.event_ids = event_ids
+        # (item name, command, monotonic time) of every received command.
+        self.commands: list[tuple[str, str, float]] = []
+        # Item name -> monotonic time its last state event was published.
+        self.sent_at: dict[str, float] = {}
+        self.requests: list[tuple[str, str]] = []
+        # Event type -> number of events published.
+        self.published: Counter[str] = Counter()
+        self._rnd = random.Random(seed)
+        self._ids = itertools.count(1)
+        # Queue and topic patterns (None: unfiltered) of every SSE client.
+        self._streams: list[tuple[asyncio.Queue[bytes | None], list[str] | None]] = []
+        self._server: TestServer | None = None
+
+        app = web.Application()
+        app.router.add_get("/rest/", self._handle_root)
+        app.router.add_get("/rest/items", self._handle_items)
+        app.router.add_get("/rest/items/{name}", self._handle_item)
+        app.router.add_post("/rest/items/{name}", self._handle_command)
+        app.router.add_put("/rest/items/{name}/state", self._handle_update)
+        app.router.add_get("/rest/things", self._handle_things)
+        app.router.add_get("/rest/links", self._handle_links)
+        app.router.add_get("/rest/events", self._handle_events)
+        self.app = app
+
+    async def __aenter__(self) -> FakeOpenHAB:
+        await self.async_start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.async_stop()
+
+    @property
+    def url(self) -> str:
+        """Base URL (without /rest), as entered in the config flow."""
+        assert self._server is not None
+        return str(self._server.make_url("")).rstrip("/")
+
+    @property
+    def stream_count(self) -> int:
+        """Number of connected SSE clients."""
+        return len(self._streams)
+
+    async def async_start(self) -> None:
+        """Start listening on a free localhost port."""
+        self._server = TestServer(self.app, host="127.0.0.1")
+        await self._server.start_server()
+
+    async def async_stop(self) -> None:
+        """Close all streams and stop the server."""
+        self.disconnect_streams()
+        if self._server is not None:
+            await self._server.close()
+            self._server = None
+
+    def disconnect_streams(self) -> None:
+        """End every SSE stream; clients are expected to reconnect."""
+        for queue, _ in self._streams:
+            queue.put_nowait(None)
+
+    # ------------------------------------------------------------------
+    # Event publishing
+    # ------------------------------------------------------------------
+
+    def publish(self, event_type: str, topic: str, payload: Any) -> None:
+        """Send an event to every SSE client whose topic filter matches."""
+        self.published[event_type] += 1
+        frame = _frame(
+            "message",
+            {"topic": topic, "payload": json.dumps(payload), "type": event_type},
+            next(self._ids) if self.event_ids else None,
+        )
+        for queue, topics in self._streams:
+            if topics is None or any(fnmatchcase(topic, t) for t in topics):
+                queue.put_nowait(frame)
+
+    def set_state(self, item_name: str, state: str) -> None:
+        """Update an item state and publish its state events.
+
+        ItemStateUpdatedEvent is sent for every update, followed by an
+        ItemStateChangedEvent when the value changed.
+        """
+        item = self.items[item_name]
+        old, item["state"] = item["state"], state
+        self.sent_at[item_name] = time.monotonic()
+        self.publish(
+            "ItemStateUpdatedEvent",
+            f"openhab/items/{item_name}/stateupdated",
+            {"type": "String", "value": state},
+        )
+        if state != old:
+            self.publish(
+                "ItemStateChangedEvent",
+                f"openhab/items/{item_name}/statechanged",
+                {
+                    "type": "String",
+                    "value": state,
+                    "oldType": "String",
+                    "oldValue": old,
+                },
+            )
+
+    async def async_emit_states(
+        self, count: int, rate: float = 0, items: list[str] | None = None
+    ) -> float:
+        """Publish count state changes at rate events/s (0: unthrottled).
+
+        Events rotate over items (default: every plain item). Returns the
+        time it took to publish them.
+        """
+        names = items or list(self.catalog.mutators)
+        mutators = self.catalog.mutators
+        start = time.monotonic()
+        for index in range(count):
+            name = names[index % len(names)]
+            self.set_state(name, mutators[name](self._rnd, self.items[name]["state"]))
+            if rate:
+                ahead = start + (index + 1) / rate - time.monotonic()
+                if ahead > 0:
+                    await asyncio.sleep(ahead)
+            elif index % 500 == 499:
+                # Let the stream writers drain.
+                await asyncio.sleep(0)
+        return time.monotonic() - start
+
+    # ------------------------------------------------------------------
+    # REST handlers
+    # ------------------------------------------------------------------
+
+    async def _handle_root(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"runtimeInfo": {"version": VERSION, "buildString": "Release Build"}}
+        )
+
+    async def _handle_items(self, request: web.Request) -> web.Response:
+        self.requests.append(("GET", "/items"))
+        if fields := request.query.get("fields"):
+            keys = fields.split(",")
+            return web.json_response(
+                [
+                    {key: item[key] for key in keys if key in item}
+                    for item in self.items.values()
+                ]
+            )
+        return web.json_response(list(self.items.values()))
+
+    async def _handle_item(self, request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        self.requests.append(("GET", f"/items/{name}"))
+        if name not in self.items:
+            raise web.HTTPNotFound
+        return web.json_response(self.items[name])
+
+    async def _handle_command(self, request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        command = await request.text()
+        if name not in self.items:
+            raise web.HTTPNotFound
+        self.commands.append((name, command, time.monotonic()))
+        self.publish(
+            "ItemCommandEvent",
+            f"openhab/items/{name}/command",
+            {"type": "String", "value": command},
+        )
+        if self.echo_commands:
+            self.set_state(name, command)
+        return web.Response()
+
+    async def _handle_update(self, request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        if name not in self.items:
+            raise web.HTTPNotFound
+        self.set_state(name, await request.text())
+        return web.Response(status=202)
+
+    async def _handle_things(self, request: web.Request) -> web.Response:
+        self.requests.append(("GET", "/things"))
+        return web.json_response(self.catalog.things)
+
+    async def _handle_links(self, request: web.Request) -> web.Response:
+        self.requests.append(("GET", "/links"))
+        return web.json_response(self.catalog.links)
+
+    async def _handle_events(self, request: web.Request) -> web.StreamResponse:
+        self.requests.append(("GET", "/events"))
+        response = web.StreamResponse(
+            headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+        )
+        await response.prepare(request)
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        topics = request.query.get("topics")
+        stream = (queue, topics.split(",") if topics else None)
+        self._streams.append(stream)
+        alive = _frame("alive", {"type": "ALIVE", "interval": self.alive_interval})
+        try:
+            await response.write(alive)
+            while True:
+                try:
+                    frame = await asyncio.wait_for(queue.get(), self.alive_interval)
+                except TimeoutError:
+                    frame = alive
+                if frame is None:
+                    break
+                # Send whatever queued up behind this frame in one write.
+                frames = [frame]
+                while not queue.empty() and (frame := queue.get_nowait()) is not None:
+                    frames.append(frame)
+                await response.write(b"".join(frames))
+                if frame is None:
+                    break
+        except ConnectionResetError:
+            pass
+        finally:
+            self._streams.remove(stream)
+        return response
@@ -1,12 +1,20 @@
 """Tests for openHAB api."""
 import asyncio
+from unittest.mock import MagicMock
 
 import aiohttp
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import pytest
 from pytest_homeassistant_custom_component.common import load_fixture
+from openhab import OpenHAB
 
-from custom_components.openhab.api import ApiClientException, OpenHABApiClient
+from custom_components.openhab.api import (
+    ApiClientAuthException,
+    ApiClientException,
+    OpenHABApiClient,
+    OpenHABRestClient,
+    fetch_all_items,
+)
 
 
 async def test_api(hass, aioclient_mock):
@@ -32,3 +40,68 @@ async def test_api(hass, aioclient_mock):
         "http://openhab:8080/rest/items/Wifi_Level", json=load_fixture("item.json")
     )
     assert await api.async_get_item("Wifi_Level") is None
+
+
+async def test_rest_client(hass, aioclient_mock):
+    """Test the native REST client."""
+    client = OpenHABRestClient(
+        async_get_clientsession(hass),
+        "http://openhab:8080/rest",
+        headers={"X-OPENHAB-TOKEN": "token"},
+    )
+
+    aioclient_mock.get(
+        "http://openhab:8080/rest/items?recursive=false",
+        text=load_fixture("items.json"),
+    )
+    items = await client.async_get_items()
+    assert items[0]["name"] == "Shutter_GF_Living"
+
+    aioclient_mock.post("http://openhab:8080/rest/items/Shutter_GF_Living")
+    await client.async_send_command("Shutter_GF_Living", "UP")
+    assert aioclient_mock.mock_calls[-1][2] == "UP"
+
+    aioclient_mock.put("http://openhab:8080/rest/items/Wifi_Level/state", status=401)
+    with pytest.raises(ApiClientAuthException):
+        await client.async_update_state("Wifi_Level", "3")
+
+    aioclient_mock.get("http://openhab:8080/rest/things", status=500)
+    with pytest.raises(ApiClientException):
+        await client.async_get_things()
+
+
+def test_fetch_all_items_devireg_without_extra_requests():
+    """Test that devireg units are built from the items response alone."""
+    oh = MagicMock(wraps=OpenHAB("http://openhab:8080/rest"))
+    items_json = [
+        {"name": "DeviReg_Bath", "type": "Group", "state": "NULL", "members": []},
+        {
+            "name": "DeviReg_Bath_Mode",
+            "type": "String",
+            "state": "Home",
+            "label": "Mode",
+            "groupNames": ["DeviReg_Bath"],
+            "stateDescription": {"readOnly": False, "options": [{"value": "Home"}]},
+        },
+        {
+            "name": "DeviReg_Bath_Room_temperature",
+            "type": "Number:Temperature",
+            "state": "22.5 °C",
+            "label": "Room temperature",
+            "groupNames": ["DeviReg_Bath"],
+            "stateDescription": {"readOnly": True, "step": 0.5},
+        },
+    ]
+
+    items = fetch_all_items(oh, items_json, [])
+
+    oh.get_item.assert_not_called()
+    oh.req_get.assert_not_called()
+    unit = items["DeviReg_Bath"]
+    assert unit.type_ex == "devireg_unit"
+    attrs = unit.devireg["attrs"]
+    assert attrs["Mode"]["options"] == [{"value": "Home"}]
+    assert attrs["Room_temperature"]["value"] == 22.5
+    assert attrs["Room_temperature"]["unit"] == "°C"
+    assert attrs["Room_temperature"]["step"] == 0.5
+    assert items["DeviReg_Bath_Mode"].parent_device_name == "DeviReg_Bath"
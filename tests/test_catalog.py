@@ -0,0 +1,75 @@
+"""Tests for the indexed openHAB item catalog."""
+
+from custom_components.openhab.catalog import ItemCatalog
+from custom_components.openhab.const import (
+    BINARY_SENSOR,
+    CLIMATE,
+    COVER,
+    LIGHT,
+    MEDIA_PLAYER,
+    SENSOR,
+    SWITCH,
+)
+from custom_components.openhab.store import StoredItem
+
+ITEMS = [
+    {"name": "Hall_Light", "type": "Switch", "state": "ON", "tags": ["Lighting"]},
+    {
+        "name": "Lights",
+        "type": "Group",
+        "groupType": "Switch",
+        "state": "ON",
+        "members": [],
+    },
+    {"name": "Room", "type": "Group", "state": "NULL", "members": []},
+    {"name": "Shutter", "type": "Rollershutter", "state": "0", "groupNames": ["Room"]},
+    {"name": "Lamp", "type": "Color", "state": "0,0,0", "groupNames": ["Room"]},
+    {"name": "Door", "type": "Contact", "state": "CLOSED"},
+    {"name": "Temp", "type": "Number:Temperature", "state": "20 °C"},
+    {"name": "Tv", "type": "Player", "state": "PLAY"},
+    {"name": "Power", "type": "Number:Power", "state": "5 W"},
+    {"name": "DeviReg_Bath", "type": "Group", "state": "NULL", "members": []},
+    {"name": "DeviReg_Bath_Mode", "type": "String", "state": "Home"},
+    {"name": "DeviReg_Bath_Floor", "type": "Number:Temperature", "state": "20 °C"},
+]
+
+
+def _catalog():
+    """Build a catalog with devireg classification applied."""
+    items = {item["name"]: StoredItem.from_json(item) for item in ITEMS}
+    items["DeviReg_Bath"].type_ex = "devireg_unit"
+    items["DeviReg_Bath_Mode"].type_ex = "devireg_attr_ui_sensor"
+    items["DeviReg_Bath_Floor"].type_ex = "devireg_attr"
+    return ItemCatalog(items.values())
+
+
+def test_every_item_gets_at_most_one_platform():
+    """Test the single-pass classifier."""
+    catalog = _catalog()
+
+    def names(platform):
+        return [item.name for item in catalog.platform_items(platform)]
+
+    assert names(SWITCH) == ["Hall_Light", "Lights", "Room"]
+    assert names(CLIMATE) == ["DeviReg_Bath"]
+    assert names(SENSOR) == ["Temp", "DeviReg_Bath_Mode"]
+    assert names(COVER) == ["Shutter"]
+    assert names(LIGHT) == ["Lamp"]
+    assert names(BINARY_SENSOR) == ["Door"]
+    assert names(MEDIA_PLAYER) == ["Tv"]
+    assert catalog.platform_of["Power"] is None
+    assert catalog.platform_of["DeviReg_Bath_Floor"] is None
+    assert sum(len(items) for items in catalog.by_platform.values()) == 10
+
+
+def test_indexes():
+    """Test lookups by type, group membership and tag."""
+    catalog = _catalog()
+
+    assert len(catalog) == len(ITEMS)
+    assert [item.name for item in catalog.by_type["Switch"]] == ["Hall_Light", "Lights"]
+    assert [item.name for item in catalog.members["Room"]] == ["Shutter", "Lamp"]
+    assert [item.name for item in catalog.by_tag["Lighting"]] == ["Hall_Light"]
+    assert set(catalog.groups) == {"Lights", "Room", "DeviReg_Bath"}
+    assert catalog.by_type_ex["devireg_unit"][0].name == "DeviReg_Bath"
+    assert catalog.platform_items("camera") == []
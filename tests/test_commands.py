@@ -0,0 +1,78 @@
+"""Tests for the openHAB command pipeline."""
+import asyncio
+
+import pytest
+
+from custom_components.openhab.commands import CommandPipeline
+from custom_components.openhab.metrics import OpenHABMetrics
+
+
+async def test_last_write_wins_per_item(hass):
+    """Test that queued commands for a busy item are replaced."""
+    release = asyncio.Event()
+    sent = []
+
+    async def send(item_name, command):
+        sent.append((item_name, command))
+        await release.wait()
+
+    tracked = []
+    metrics = OpenHABMetrics()
+    pipeline = CommandPipeline(
+        hass, send, metrics, on_send=lambda item, expected: tracked.append(expected)
+    )
+
+    first = asyncio.create_task(pipeline.async_send("Dimmer", "10", "10"))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert sent == [("Dimmer", "10")]
+
+    # While 10 is in flight, a slider drag keeps replacing the queued value.
+    calls = [
+        asyncio.create_task(pipeline.async_send("Dimmer", str(value), str(value)))
+        for value in range(20, 60, 10)
+    ]
+    await asyncio.sleep(0)
+    assert pipeline.stats()["queue_depth"] == 1
+
+    release.set()
+    await asyncio.gather(first, *calls)
+    assert sent == [("Dimmer", "10"), ("Dimmer", "50")]
+    assert tracked == ["10", "50"]
+    stats = pipeline.stats()
+    assert stats["coalesced"] == 3
+    assert stats["sent"] == 2
+    assert stats["queue_depth"] == 0
+    assert stats["latency"]["p50"] is not None
+
+
+async def test_items_are_sent_concurrently_with_a_bound(hass):
+    """Test bounded parallelism across items."""
+    active = 0
+    peak = 0
+
+    async def send(item_name, command):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    pipeline = CommandPipeline(hass, send, OpenHABMetrics(), concurrency=3)
+    await asyncio.gather(
+        *(pipeline.async_send(f"Item_{index}", "ON") for index in range(9))
+    )
+    assert peak == 3
+
+
+async def test_failure_reaches_every_coalesced_caller(hass):
+    """Test that errors are raised to the callers of the sent command."""
+
+    async def send(item_name, command):
+        await asyncio.sleep(0)
+        raise RuntimeError(command)
+
+    pipeline = CommandPipeline(hass, send, OpenHABMetrics())
+    with pytest.raises(RuntimeError, match="OFF"):
+        await pipeline.async_send("Light", "OFF")
+    assert pipeline.stats()["failed"] == 1
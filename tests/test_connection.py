@@ -0,0 +1,21 @@
+"""Tests for the openHAB connection pool."""
+from custom_components.openhab.connection import OpenHABConnectionPool
+
+
+async def test_pool_stats_and_close(hass):
+    """Test pool statistics and cleanup."""
+    pool = OpenHABConnectionPool(hass, limit=1, keepalive_timeout=15, dns_cache_ttl=60)
+
+    # The SSE stream needs its own connection, so the limit is raised to 2.
+    assert pool.stats() == {
+        "limit": 2,
+        "open": 0,
+        "idle": 0,
+        "in_use": 0,
+        "waiting": 0,
+        "closed": False,
+    }
+
+    await pool.async_close()
+    assert pool.session.closed
+    assert pool.stats()["closed"]
@@ -0,0 +1,476 @@
+"""Tests for the openHAB data update coordinator."""
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from openhab import OpenHAB
+
+from custom_components.openhab.api import items_from_json
+from custom_components.openhab.catalog import ItemCatalog
+from custom_components.openhab.const import SENSOR, SWITCH
+from custom_components.openhab.coordinator import OpenHABDataUpdateCoordinator
+from custom_components.openhab.snapshot import catalog_signature
+from custom_components.openhab.sse import SSEDecoder
+from custom_components.openhab.store import StoredItem
+from custom_components.openhab.things import ThingStatusIndex
+
+
+def _make_coordinator(hass, *items):
+    """Create a coordinator holding the given item JSON definitions."""
+    coordinator = OpenHABDataUpdateCoordinator(hass, api=MagicMock())
+    coordinator.data = {item["name"]: StoredItem.from_json(item) for item in items}
+    return coordinator
+
+
+def _state_event(item_name, value, event_type="ItemStateChangedEvent"):
+    """Build a parsed SSE state event."""
+    suffix = "statechanged" if event_type == "ItemStateChangedEvent" else "stateupdated"
+    return {
+        "type": event_type,
+        "topic": f"openhab/items/{item_name}/{suffix}",
+        "payload": json.dumps({"type": "String", "value": value}),
+    }
+
+
+async def test_item_listener_dispatch(hass):
+    """Test that item listeners only fire for their own item."""
+    coordinator = OpenHABDataUpdateCoordinator(hass, api=MagicMock())
+
+    calls = []
+    remove_kitchen = coordinator.async_add_item_listener(
+        "Kitchen_Light", lambda: calls.append("Kitchen_Light")
+    )
+    coordinator.async_add_item_listener(
+        "Garage_Door", lambda: calls.append("Garage_Door")
+    )
+
+    coordinator.async_notify_item("Kitchen_Light")
+    assert calls == ["Kitchen_Light"]
+
+    coordinator.async_notify_item("Unknown_Item")
+    assert calls == ["Kitchen_Light"]
+
+    remove_kitchen()
+    coordinator.async_notify_item("Kitchen_Light")
+    coordinator.async_notify_item("Garage_Door")
+    assert calls == ["Kitchen_Light", "Garage_Door"]
+
+
+async def test_unconsumed_events_are_reported(hass):
+    """Test that events outside the consumed types are not processed."""
+    coordinator = OpenHABDataUpdateCoordinator(hass, api=MagicMock())
+
+    assert not await coordinator._process_sse_event(
+        {"type": "ItemCommandEvent", "topic": "openhab/items/Light/command"}
+    )
+    assert not await coordinator._process_sse_event(
+        {"type": "ThingUpdatedEvent", "topic": "openhab/things/zwave:1/updated"}
+    )
+    assert not await coordinator._process_sse_event(
+        {"type": "ItemChannelLinkAddedEvent", "topic": "openhab/links/x/added"}
+    )
+
+
+async def test_state_events_are_coalesced(hass):
+    """Test that a burst collapses into one notification per item."""
+    coordinator = _make_coordinator(
+        hass,
+        {"name": "Meter", "type": "String", "state": "0"},
+        {"name": "Mode", "type": "String", "state": "auto"},
+    )
+    coordinator.coalesce_window = 0.01
+
+    calls = []
+    coordinator.async_add_item_listener("Meter", lambda: calls.append("Meter"))
+    coordinator.async_add_item_listener("Mode", lambda: calls.append("Mode"))
+
+    for value in ("1", "2", "3"):
+        assert await coordinator._process_sse_event(_state_event("Meter", value))
+    await coordinator._process_sse_event(_state_event("Mode", "eco"))
+    assert calls == []
+
+    await asyncio.sleep(0.05)
+    assert sorted(calls) == ["Meter", "Mode"]
+    assert coordinator.data["Meter"]._raw_state == "3"
+    assert coordinator.coalesce_ratio() == 2.0
+
+
+async def test_state_write_lag_measured_from_frame_receipt(hass):
+    """Test that the lag includes the time before the state was queued."""
+    coordinator = _make_coordinator(
+        hass, {"name": "Meter", "type": "String", "state": "0"}
+    )
+    coordinator.coalesce_window = 0
+    received = time.monotonic() - 0.5
+    assert await coordinator._process_sse_event(_state_event("Meter", "1"), received)
+    lag = coordinator.metrics.percentiles("state_write_lag", (50,))["p50"]
+    assert lag >= 0.5
+
+    coordinator.coalesce_window = 0.01
+    assert await coordinator._process_sse_event(_state_event("Meter", "2"), received)
+    await asyncio.sleep(0.05)
+    lag = coordinator.metrics.percentiles("state_write_lag", (0,))["p0"]
+    assert lag >= 0.5
+
+
+async def test_unchanged_and_paired_events_are_skipped(hass):
+    """Test that only real changes are applied."""
+    coordinator = _make_coordinator(
+        hass, {"name": "Temp", "type": "Number:Temperature", "state": "20 °C"}
+    )
+    coordinator.coalesce_window = 0
+
+    calls = []
+    coordinator.async_add_item_listener("Temp", lambda: calls.append("Temp"))
+
+    await coordinator._process_sse_event(
+        _state_event("Temp", "20 °C", "ItemStateUpdatedEvent")
+    )
+    assert calls == []
+
+    await coordinator._process_sse_event(
+        _state_event("Temp", "21.5 °C", "ItemStateUpdatedEvent")
+    )
+    await coordinator._process_sse_event(_state_event("Temp", "21.5 °C"))
+    assert calls == ["Temp"]
+
+    item = coordinator.data["Temp"]
+    assert item._state == 21.5
+    assert item.unit_of_measure == "°C"
+    assert coordinator.metrics.counters["sse_events_skipped"] == 2
+    assert coordinator.metrics.counters["sse_events_applied"] == 1
+
+
+async def test_reconnect_resync_applies_only_changed_states(hass):
+    """Test that a reconnect diff only touches items that changed."""
+    coordinator = _make_coordinator(
+        hass,
+        {"name": "Meter", "type": "String", "state": "1"},
+        {"name": "Mode", "type": "String", "state": "auto"},
+    )
+    coordinator.coalesce_window = 0
+    coordinator.api.async_get_item_states = AsyncMock(
+        return_value={"Meter": "2", "Mode": "auto"}
+    )
+    coordinator._refresh_debouncer.async_call = AsyncMock()
+
+    calls = []
+    coordinator.async_add_item_listener("Meter", lambda: calls.append("Meter"))
+    coordinator.async_add_item_listener("Mode", lambda: calls.append("Mode"))
+
+    await coordinator._async_resync_states()
+    assert calls == ["Meter"]
+    assert coordinator.data["Meter"]._raw_state == "2"
+    assert coordinator.metrics.counters["sse_resync_items_changed"] == 1
+    coordinator._refresh_debouncer.async_call.assert_not_called()
+
+    # A new item means the catalog changed: fall back to a full refresh.
+    coordinator.api.async_get_item_states.return_value = {
+        "Meter": "2",
+        "Mode": "auto",
+        "New": "x",
+    }
+    await coordinator._async_resync_states()
+    coordinator._refresh_debouncer.async_call.assert_awaited_once()
+
+
+async def test_optimistic_state_confirmed_and_rolled_back(hass):
+    """Test optimistic command states."""
+    coordinator = _make_coordinator(
+        hass, {"name": "Light", "type": "Switch", "state": "OFF"}
+    )
+    coordinator.coalesce_window = 0
+    coordinator.api.async_send_command = AsyncMock()
+    coordinator.commands._send = coordinator.api.async_send_command
+
+    calls = []
+    coordinator.async_add_item_listener("Light", lambda: calls.append("Light"))
+
+    await coordinator.async_send_command("Light", "ON", "ON")
+    assert calls == ["Light"]
+    assert coordinator.data["Light"]._raw_state == "ON"
+
+    # The matching event confirms without another state write.
+    assert await coordinator._process_sse_event(_state_event("Light", "ON"))
+    assert calls == ["Light"]
+    assert coordinator.metrics.counters["optimistic_confirmed"] == 1
+
+    with patch("custom_components.openhab.coordinator.OPTIMISTIC_TIMEOUT", 0.01):
+        coordinator.echo.window = 0
+        await coordinator.async_send_command("Light", "OFF", "OFF")
+        await asyncio.sleep(0.05)
+    assert coordinator.data["Light"]._raw_state == "ON"
+    assert coordinator.metrics.counters["optimistic_rollbacks"] == 1
+    assert calls == ["Light"] * 3
+
+
+async def test_optimistic_timeout_starts_when_the_command_was_sent(hass):
+    """Test that queued and slow commands are not rolled back early."""
+    coordinator = _make_coordinator(
+        hass, {"name": "Light", "type": "Switch", "state": "OFF"}
+    )
+
+    async def slow_send(item_name, command):
+        await asyncio.sleep(0.05)
+
+    coordinator.commands._send = slow_send
+    coordinator.echo.window = 0
+    with patch("custom_components.openhab.coordinator.OPTIMISTIC_TIMEOUT", 0.02):
+        await coordinator.async_send_command("Light", "ON", "ON")
+        assert coordinator.data["Light"]._raw_state == "ON"
+        assert coordinator.metrics.counters["optimistic_rollbacks"] == 0
+
+        await asyncio.sleep(0.05)
+    assert coordinator.data["Light"]._raw_state == "OFF"
+    assert coordinator.metrics.counters["optimistic_rollbacks"] == 1
+
+
+async def test_paired_stale_echoes_keep_the_optimistic_state(hass):
+    """Test a slider drag whose echoes arrive as updated+changed pairs."""
+    coordinator = _make_coordinator(
+        hass, {"name": "Dimmer", "type": "Dimmer", "state": "0"}
+    )
+    coordinator.coalesce_window = 0
+    coordinator.api.async_send_command = AsyncMock()
+    coordinator.commands._send = coordinator.api.async_send_command
+
+    states = []
+    coordinator.async_add_item_listener(
+        "Dimmer", lambda: states.append(coordinator.data["Dimmer"]._raw_state)
+    )
+    await coordinator.async_send_command("Dimmer", "30", "30")
+    await coordinator.async_send_command("Dimmer", "60", "60")
+    for value in ("30", "60"):
+        for event_type in ("ItemStateUpdatedEvent", "ItemStateChangedEvent"):
+            await coordinator._process_sse_event(
+                _state_event("Dimmer", value, event_type)
+            )
+
+    assert states == ["30", "60"]
+    assert coordinator.metrics.counters["optimistic_confirmed"] == 1
+    assert "Dimmer" not in coordinator._optimistic
+
+
+async def test_failed_command_only_rolls_back_its_own_state(hass):
+    """Test that a superseded command's failure keeps the newer optimistic state."""
+    coordinator = _make_coordinator(
+        hass, {"name": "Mode", "type": "String", "state": "auto"}
+    )
+    first = coordinator._apply_optimistic("Mode", "eco")
+    second = coordinator._apply_optimistic("Mode", "comfort")
+
+    coordinator._rollback_optimistic("Mode", first)
+    assert coordinator.data["Mode"]._raw_state == "comfort"
+    assert coordinator._optimistic["Mode"] is second
+
+    coordinator._rollback_optimistic("Mode", second)
+    assert coordinator.data["Mode"]._raw_state == "auto"
+    assert "Mode" not in coordinator._optimistic
+
+
+async def test_catalog_events_update_single_entities(hass):
+    """Test that added, updated and removed items only touch their entity."""
+    oh = OpenHAB("http://openhab:8080/rest")
+    coordinator = _make_coordinator(
+        hass, {"name": "Light", "type": "Switch", "state": "OFF"}
+    )
+    coordinator.catalog = ItemCatalog(coordinator.data.values())
+
+    added = {SWITCH: [], SENSOR: []}
+    for platform in added:
+        coordinator.async_setup_platform(
+            platform,
+            lambda item, platform=platform: MagicMock(item=item, registry_entry=None),
+            lambda entities, platform=platform: added[platform].extend(entities),
+        )
+    assert [entity.item.name for entity in added[SWITCH]] == ["Light"]
+    coordinator.ha_items["Light"] = added[SWITCH][0]
+
+    coordinator.api.async_get_item = AsyncMock(
+        return_value=oh.json_to_item({"name": "Temp", "type": "String", "state": "x"})
+    )
+    event = {"type": "ItemAddedEvent", "topic": "openhab/items/Temp/added"}
+    assert await coordinator._process_sse_event(event)
+    await hass.async_block_till_done()
+    assert [entity.item.name for entity in added[SENSOR]] == ["Temp"]
+    assert coordinator.catalog.platform_of["Temp"] == SENSOR
+
+    # Re-described without changing platform: only a notification.
+    calls = []
+    coordinator.async_add_item_listener("Light", lambda: calls.append("Light"))
+    coordinator.api.async_get_item.return_value = oh.json_to_item(
+        {"name": "Light", "type": "Switch", "state": "OFF", "label": "Hall"}
+    )
+    await coordinator._async_apply_catalog_event("ItemUpdatedEvent", "Light")
+    assert calls == ["Light"]
+    assert coordinator.data["Light"].label == "Hall"
+    assert len(added[SWITCH]) == 1
+
+    entity = added[SWITCH][0]
+    entity.async_remove = AsyncMock()
+    await coordinator._async_apply_catalog_event("ItemRemovedEvent", "Light")
+    entity.async_remove.assert_awaited_once()
+    assert "Light" not in coordinator.data
+    assert coordinator.catalog.platform_items(SWITCH) == []
+
+
+async def test_devireg_change_writes_snapshot_before_reload(hass):
+    """Test that a devireg reload starts from an up-to-date snapshot."""
+    coordinator = _make_coordinator(
+        hass, {"name": "DeviReg_Living", "type": "Group", "state": "NULL"}
+    )
+    coordinator.catalog = ItemCatalog(coordinator.data.values())
+    coordinator.config_entry = MagicMock(entry_id="entry")
+    coordinator.snapshot = MagicMock(async_write=AsyncMock())
+    coordinator.api.async_get_item = AsyncMock(
+        return_value=OpenHAB.json_to_item(
+            None, {"name": "DeviReg_Living_Mode", "type": "String", "state": "x"}
+        )
+    )
+    calls = []
+    coordinator.snapshot.async_write.side_effect = lambda *args: calls.append("write")
+    with patch.object(
+        hass.config_entries,
+        "async_reload",
+        AsyncMock(side_effect=lambda entry_id: calls.append("reload")),
+    ):
+        await coordinator._async_apply_catalog_event(
+            "ItemAddedEvent", "DeviReg_Living_Mode"
+        )
+        await hass.async_block_till_done()
+
+    assert calls == ["write", "reload"]
+    coordinator.snapshot.async_write.assert_awaited_once_with(
+        coordinator.version, coordinator.data
+    )
+    coordinator.snapshot.async_save.assert_not_called()
+
+
+async def test_snapshot_reconcile_applies_catalog_diff(hass):
+    """Test that a changed catalog adds and removes entities without a reload."""
+    coordinator = _make_coordinator(
+        hass,
+        {"name": "Light", "type": "Switch", "state": "OFF"},
+        {"name": "Old", "type": "String", "state": "x"},
+    )
+    coordinator.catalog = ItemCatalog(coordinator.data.values())
+    coordinator.version = "4.1.0"
+    coordinator.snapshot = MagicMock()
+    coordinator._snapshot_signature = catalog_signature(coordinator.data)
+    coordinator._sse_started = True
+
+    added = {SWITCH: [], SENSOR: []}
+    for platform in added:
+        coordinator.async_setup_platform(
+            platform,
+            lambda item: MagicMock(item=item, registry_entry=None),
+            lambda entities, platform=platform: added[platform].extend(entities),
+        )
+    for entity in added[SWITCH] + added[SENSOR]:
+        entity.async_remove = AsyncMock()
+        coordinator.ha_items[entity.item.name] = entity
+    old_entity = added[SENSOR][0]
+    snapshot_catalog = coordinator.catalog
+
+    # openHAB still down: the snapshot stays in place for the next attempt.
+    coordinator.api.async_get_items = AsyncMock(return_value={})
+    assert await coordinator._async_update_data() is coordinator.data
+    assert coordinator.catalog is snapshot_catalog
+    assert coordinator._snapshot_signature is not None
+    assert not coordinator.is_online
+    coordinator.snapshot.async_save.assert_not_called()
+
+    coordinator.api.async_get_items = AsyncMock(
+        return_value=items_from_json(
+            [
+                {"name": "Light", "type": "Switch", "state": "ON"},
+                {"name": "Temp", "type": "String", "state": "y"},
+            ]
+        )
+    )
+    coordinator.api.async_get_links = AsyncMock(return_value=[])
+    coordinator.api.things = []
+    items = await coordinator._async_update_data()
+
+    old_entity.async_remove.assert_awaited_once()
+    assert "Old" not in coordinator.ha_items
+    assert [entity.item.name for entity in added[SWITCH]] == ["Light"]
+    assert [entity.item.name for entity in added[SENSOR]] == ["Old", "Temp"]
+    assert coordinator._snapshot_signature is None
+    coordinator.snapshot.async_save.assert_called_once_with("4.1.0", items)
+
+
+async def test_thing_status_flips_linked_items_only(hass):
+    """Test that a thing status change only notifies its linked items."""
+    coordinator = OpenHABDataUpdateCoordinator(hass, api=MagicMock())
+    coordinator.things = ThingStatusIndex(
+        [
+            {"itemName": "Node5_Power", "channelUID": "zwave:device:ctrl:node5:meter"},
+            {"itemName": "Node5_Switch", "channelUID": "zwave:device:ctrl:node5:sw"},
+            {"itemName": "Hue_Light", "channelUID": "hue:0210:bridge:1:color"},
+        ],
+        [
+            {"UID": "zwave:device:ctrl:node5", "statusInfo": {"status": "ONLINE"}},
+            {"UID": "hue:0210:bridge:1", "statusInfo": {"status": "OFFLINE"}},
+        ],
+    )
+    assert not coordinator.things.is_available("Hue_Light")
+    assert coordinator.things.is_available("Virtual_Item")
+
+    calls = []
+    for name in ("Node5_Power", "Node5_Switch", "Hue_Light"):
+        coordinator.async_add_item_listener(name, lambda name=name: calls.append(name))
+
+    event = {
+        "type": "ThingStatusInfoChangedEvent",
+        "topic": "openhab/things/zwave:device:ctrl:node5/statuschanged",
+        "payload": json.dumps([{"status": "OFFLINE"}, {"status": "ONLINE"}]),
+    }
+    assert await coordinator._process_sse_event(event)
+    assert sorted(calls) == ["Node5_Power", "Node5_Switch"]
+    assert not coordinator.things.is_available("Node5_Power")
+
+    # Offline -> offline with a new detail does not flip availability.
+    event["payload"] = json.dumps([{"status": "UNKNOWN"}, {"status": "OFFLINE"}])
+    await coordinator._process_sse_event(event)
+    assert len(calls) == 2
+
+
+async def test_sse_backoff_and_downtime(hass):
+    """Test jittered exponential backoff and disconnected time tracking."""
+    coordinator = OpenHABDataUpdateCoordinator(hass, api=MagicMock())
+
+    delays = [coordinator._sse_backoff(None) for _ in range(10)]
+    for attempt, delay in enumerate(delays):
+        cap = min(120.0, 2**attempt)
+        assert cap / 2 <= delay <= cap
+    # A server-requested retry raises the base but the cap still applies.
+    assert 60.0 <= coordinator._sse_backoff(5.0) <= 120.0
+
+    coordinator._sse_connected()
+    assert coordinator.disconnected_for() == 0
+    coordinator._sse_disconnected()
+    await asyncio.sleep(0.01)
+    assert coordinator.disconnected_for() > 0
+    coordinator._sse_connected()
+    stats = coordinator.sse_stats()
+    assert stats["connected"]
+    assert stats["disconnects"] == 1
+    assert stats["disconnected_total_s"] >= 0
+    assert stats["downtime"]["p50"] > 0
+
+
+async def test_keepalive_frames_are_not_events(hass):
+    """Test that ALIVE frames only feed the watchdog."""
+    coordinator = OpenHABDataUpdateCoordinator(hass, api=MagicMock())
+    coordinator._backoff_attempt = 4
+
+    decoder = SSEDecoder()
+    alive = await coordinator._process_sse_chunk(
+        decoder, b'event: alive\ndata: {"type":"ALIVE","interval":10}\n\n'
+    )
+    assert alive
+    assert coordinator._backoff_attempt == 0
+    assert coordinator.metrics.counters["sse_keepalives"] == 1
+    assert coordinator.metrics.counters["sse_events"] == 0
@@ -0,0 +1,36 @@
+"""Test the device class matcher."""
+from custom_components.openhab.device_classes_map import (
+    BINARY_SENSOR_DEVICE_CLASS_MAP,
+    COVER_DEVICE_CLASS_MAP,
+    SENSOR_DEVICE_CLASS_MAP,
+    DeviceClassMatcher,
+    device_class_matcher,
+)
+
+
+def test_most_specific_class_wins():
+    """Test that the longest candidate wins regardless of list order."""
+    binary = DeviceClassMatcher(BINARY_SENSOR_DEVICE_CLASS_MAP)
+    assert binary.match("Garage_Door_Contact", "") == "garage_door"
+    assert binary.match("Front_Door", "") == "door"
+    assert binary.match("Phone", "Battery charging") == "battery_charging"
+
+    sensor = DeviceClassMatcher(reversed(SENSOR_DEVICE_CLASS_MAP))
+    assert sensor.match("Air_PM10", "") == "pm10"
+    assert sensor.match("Meter", "Power factor") == "power_factor"
+
+
+def test_ties_and_misses():
+    """Test first occurrence on ties (name before label) and no match."""
+    cover = DeviceClassMatcher(COVER_DEVICE_CLASS_MAP)
+    assert cover.match("Kitchen_Blind", "Kitchen shade") == "blind"
+    assert cover.match("Kitchen_Light", "Ceiling") == ""
+    assert DeviceClassMatcher([]).match("Window", "Door") == ""
+
+
+def test_matchers_are_shared():
+    """Test that each class map is compiled once."""
+    assert device_class_matcher(COVER_DEVICE_CLASS_MAP) is device_class_matcher(
+        list(COVER_DEVICE_CLASS_MAP)
+    )
+    assert device_class_matcher(None).match("Door") == ""
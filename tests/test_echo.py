@@ -0,0 +1,89 @@
+"""Tests for value-aware echo suppression."""
+from unittest.mock import patch
+
+from custom_components.openhab.echo import MIN_WINDOW, EchoSuppressor
+from custom_components.openhab.metrics import OpenHABMetrics
+
+
+def test_latest_command_confirms_and_older_echo_is_suppressed():
+    """Test that only stale echoes are dropped."""
+    metrics = OpenHABMetrics()
+    echo = EchoSuppressor(metrics)
+    echo.track("Light", "ON")
+    echo.track("Light", "OFF")
+
+    # Echo of the superseded ON must not flip the entity back.
+    assert echo.is_stale_echo("Light", "ON")
+    # Echo of the latest command confirms it and is applied.
+    assert not echo.is_stale_echo("Light", "OFF")
+    assert len(echo) == 0
+    assert metrics.counters["echo_suppressed"] == 1
+    assert metrics.counters["echo_confirmed"] == 1
+
+
+def test_paired_events_of_a_stale_echo_are_suppressed():
+    """Test the updated+changed pair openHAB sends for every change."""
+    metrics = OpenHABMetrics()
+    echo = EchoSuppressor(metrics)
+    echo.track("Dimmer", "30")
+    echo.track("Dimmer", "60")
+
+    assert echo.is_stale_echo("Dimmer", "30")  # ItemStateUpdatedEvent
+    assert echo.is_stale_echo("Dimmer", "30")  # ItemStateChangedEvent
+    assert not echo.is_stale_echo("Dimmer", "60")
+    assert not echo.is_stale_echo("Dimmer", "60")
+    assert metrics.counters["echo_suppressed"] == 2
+    assert metrics.counters["echo_confirmed"] == 1
+
+    # Once the newer command is confirmed the old value is a real change.
+    assert not echo.is_stale_echo("Dimmer", "30")
+
+
+def test_external_change_inside_window_is_applied():
+    """Test that a value no command produces is never suppressed."""
+    echo = EchoSuppressor(OpenHABMetrics())
+    echo.track("Dimmer", "40")
+    echo.track("Dimmer", "60")
+
+    assert not echo.is_stale_echo("Dimmer", "10")
+    assert not echo.is_stale_echo("Other", "40")
+    assert len(echo) == 2
+
+
+def test_unknown_expected_values_never_suppress():
+    """Test that commands without an expected value do not drop changes."""
+    metrics = OpenHABMetrics()
+    echo = EchoSuppressor(metrics)
+    echo.track("Shutter")  # UP
+    echo.track("Shutter")  # STOP
+
+    assert not echo.is_stale_echo("Shutter", "80")
+    assert not echo.is_stale_echo("Shutter", "65")
+    assert len(echo) == 0
+
+    # A known value of an older command is still a stale echo.
+    echo.track("Dimmer", "100")
+    echo.track("Dimmer")
+    assert echo.is_stale_echo("Dimmer", "100")
+    assert not echo.is_stale_echo("Dimmer", "40")
+    assert metrics.counters["echo_suppressed"] == 1
+
+
+def test_expiry_and_adaptive_window():
+    """Test heap expiry and the RTT based window."""
+    metrics = OpenHABMetrics()
+    echo = EchoSuppressor(metrics)
+    with patch("custom_components.openhab.echo.time.monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        echo.track("Light", "ON")
+        monotonic.return_value = 103.0
+        echo.prune()
+        assert len(echo) == 0
+        assert metrics.counters["echo_expired"] == 1
+
+        for _ in range(8):
+            monotonic.return_value = 200.0
+            echo.track("Light", "ON")
+            monotonic.return_value = 200.01
+            assert not echo.is_stale_echo("Light", "ON")
+    assert echo.window == MIN_WINDOW
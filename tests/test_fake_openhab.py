@@ -0,0 +1,164 @@
+"""End-to-end tests against the in-process openHAB stand-in."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.openhab.api import OpenHABApiClient
+from custom_components.openhab.connection import OpenHABConnectionPool
+from custom_components.openhab.const import CONF_AUTH_TYPE_TOKEN
+from custom_components.openhab.coordinator import OpenHABDataUpdateCoordinator
+
+from .fake_openhab import FakeOpenHAB, generate_catalog
+
+# The stand-in listens on a real localhost socket.
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+def _make_client(hass, server):
+    """Create an API client with its own pool for the fake server."""
+    return OpenHABApiClient(
+        hass,
+        base_url=server.url,
+        auth_type=CONF_AUTH_TYPE_TOKEN,
+        auth_token="",
+        username="",
+        password="",
+        pool=OpenHABConnectionPool(hass),
+    )
+
+
+async def _wait_for(condition, timeout=5):
+    """Poll until condition() is true."""
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+async def test_fetch_catalog_and_send_command(hass):
+    """Test catalog fetch, devireg classification and command recording."""
+    async with FakeOpenHAB(generate_catalog(600)) as server:
+        api = _make_client(hass, server)
+        try:
+            items = await api.async_get_items()
+            assert len(items) == 600
+            assert items["DeviReg_0"].type_ex == "devireg_unit"
+            assert items["DeviReg_0"].devireg["thing"]["label"] == "DeviSmart 0"
+            assert (
+                items["DeviReg_0_RoomTemperature"].type_ex == "devireg_attr_ui_sensor"
+            )
+            assert len(await api.async_get_links()) == len(server.catalog.links)
+
+            await api.async_send_command("Item_0", "ON")
+            assert [command[:2] for command in server.commands] == [("Item_0", "ON")]
+            assert server.items["Item_0"]["state"] == "ON"
+        finally:
+            await api.pool.async_close()
+
+
+async def test_sse_stream_updates_states(hass):
+    """Test that published state changes reach coordinator.data."""
+    async with FakeOpenHAB(generate_catalog(100)) as server:
+        api = _make_client(hass, server)
+        coordinator = OpenHABDataUpdateCoordinator(hass, api=api)
+        coordinator.data = await api.async_get_items()
+        coordinator.coalesce_window = 0
+        counters = coordinator.metrics.counters
+        task = hass.async_create_background_task(
+            coordinator._listen_sse_events(), "test openhab sse"
+        )
+        try:
+            await _wait_for(lambda: coordinator.sse_connected)
+            await server.async_emit_states(20)
+            await _wait_for(
+                lambda: all(
+                    coordinator.data[name]._raw_state == server.items[name]["state"]
+                    for name in server.sent_at
+                )
+            )
+            # Each change is applied once; the ItemStateChangedEvent of the
+            # pair and updates repeating a value are skipped as unchanged.
+            await _wait_for(lambda: counters["sse_events"] == server.published.total())
+            assert counters["sse_events_applied"] == (
+                server.published["ItemStateChangedEvent"]
+            )
+            assert counters["sse_events_skipped"] == (
+                server.published["ItemStateUpdatedEvent"]
+            )
+
+            # The ItemCommandEvent is dropped server-side by the topic filter.
+            await api.async_send_command("Item_0", "ON")
+            assert server.published["ItemCommandEvent"] == 1
+            await _wait_for(
+                lambda: counters["sse_events"] == server.published.total() - 1
+            )
+            assert coordinator.data["Item_0"]._raw_state == "ON"
+            assert counters["sse_events_ignored"] == 0
+        finally:
+            task.cancel()
+            await api.pool.async_close()
+
+
+async def test_reconnect_resyncs_states_when_resume_is_ignored(hass):
+    """Test that ids without a resumed stream do not skip the resync."""
+    async with FakeOpenHAB(generate_catalog(20), event_ids=True) as server:
+        api = _make_client(hass, server)
+        coordinator = OpenHABDataUpdateCoordinator(hass, api=api)
+        coordinator.data = await api.async_get_items()
+        coordinator.coalesce_window = 0
+        with patch("custom_components.openhab.coordinator.SSE_BACKOFF_BASE", 0.01):
+            task = hass.async_create_background_task(
+                coordinator._listen_sse_events(), "test openhab sse"
+            )
+            try:
+                await _wait_for(lambda: coordinator.sse_connected)
+                server.set_state("Item_0", "ON")
+                await _wait_for(lambda: coordinator.data["Item_0"]._raw_state == "ON")
+
+                # Changed while the stream is down; never replayed.
+                server.items["Item_0"]["state"] = "OFF"
+                server.disconnect_streams()
+                await _wait_for(lambda: coordinator.data["Item_0"]._raw_state == "OFF")
+                assert coordinator.metrics.counters["sse_resyncs"] == 1
+            finally:
+                coordinator._stop_sse = True
+                task.cancel()
+                await api.pool.async_close()
+
+
+async def test_sse_watchdog_and_read_timeouts(hass):
+    """Test that only a silent stream trips the keepalive watchdog."""
+    async with FakeOpenHAB(generate_catalog(10), alive_interval=60) as server:
+        api = _make_client(hass, server)
+        coordinator = OpenHABDataUpdateCoordinator(hass, api=api)
+        coordinator.data = await api.async_get_items()
+        counters = coordinator.metrics.counters
+
+        # One ALIVE frame arms the watchdog, then the stream goes quiet.
+        coordinator.silence_timeout = 0.1
+        task = hass.async_create_background_task(
+            coordinator._listen_sse_events(), "test openhab sse"
+        )
+        try:
+            await _wait_for(lambda: counters["sse_watchdog_timeouts"] == 1)
+            assert counters["sse_disconnects"] == 1
+        finally:
+            coordinator._stop_sse = True
+            task.cancel()
+        coordinator._unschedule_refresh()
+
+        # A socket read timeout is a connection error, not a watchdog trip.
+        coordinator.silence_timeout = 60
+        coordinator._stop_sse = False
+        with patch("custom_components.openhab.coordinator.SSE_LEGACY_SOCK_READ", 0.1):
+            task = hass.async_create_background_task(
+                coordinator._listen_sse_events(), "test openhab sse"
+            )
+            try:
+                await _wait_for(lambda: counters["sse_disconnects"] == 2)
+                assert counters["sse_watchdog_timeouts"] == 1
+            finally:
+                coordinator._stop_sse = True
+                task.cancel()
+        coordinator._unschedule_refresh()
+        await api.pool.async_close()
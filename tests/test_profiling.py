@@ -0,0 +1,64 @@
+"""Test setup-phase timing and the sampling profiler."""
+import threading
+import time
+
+from openhab import OpenHAB
+
+from custom_components.openhab import profiling
+from custom_components.openhab.api import fetch_all_items
+from custom_components.openhab.profiling import PhaseTimer, SamplingProfiler
+
+
+def test_phase_timer_accumulates():
+    """Test that repeated phases add up and the total is recorded."""
+    timer = PhaseTimer("setup")
+    for _ in range(2):
+        with timer.phase("platform_switch"):
+            time.sleep(0.01)
+    timer.add("sort", 0.005)
+    timer.finish()
+
+    data = timer.as_dict()
+    assert data["kind"] == "setup"
+    assert data["phases_ms"]["platform_switch"] >= 20
+    assert data["phases_ms"]["sort"] == 5.0
+    assert data["total_ms"] >= 20
+
+
+def test_fetch_all_items_phases():
+    """Test that the item fetch records its classification phases."""
+    timer = PhaseTimer("refresh")
+    items_json = [
+        {"name": "Kitchen_Light", "type": "Switch", "state": "ON", "groupNames": []}
+    ]
+    items = fetch_all_items(OpenHAB("http://openhab:8080/rest"), items_json, [], timer)
+
+    assert list(items) == ["Kitchen_Light"]
+    assert set(timer.phases) == {
+        "get_from_things",
+        "build_items",
+        "devireg_enrichment",
+        "sort",
+    }
+
+
+def test_sampling_profiler_finds_hot_path(monkeypatch):
+    """Test that busy integration code in another thread shows up."""
+    # Count this test module as integration code.
+    monkeypatch.setattr(profiling, "PACKAGE_DIR", __file__)
+    stop = threading.Event()
+
+    def busy_hot_path():
+        while not stop.is_set():
+            sum(range(1000))
+
+    worker = threading.Thread(target=busy_hot_path)
+    worker.start()
+    try:
+        result = SamplingProfiler(interval=0.001).run(0.2)
+    finally:
+        stop.set()
+        worker.join()
+
+    assert result["integration_samples"] > 0
+    assert "test_profiling.py:busy_hot_path" in result["self"]
@@ -0,0 +1,64 @@
+"""Test SSE recording and replay."""
+import json
+from unittest.mock import MagicMock
+
+from custom_components.openhab.coordinator import OpenHABDataUpdateCoordinator
+from custom_components.openhab.recorder import SSERecorder, load_recording
+from custom_components.openhab.sse import SSEDecoder
+from custom_components.openhab.store import StoredItem
+
+from .benchmarks.replay_sse import async_replay
+
+
+def _frame(item_name, value):
+    """Encode one openHAB state changed SSE frame."""
+    data = {
+        "topic": f"openhab/items/{item_name}/statechanged",
+        "payload": json.dumps({"type": "String", "value": value}),
+        "type": "ItemStateChangedEvent",
+    }
+    return f"event: message\ndata: {json.dumps(data)}\n\n".encode()
+
+
+def test_ring_buffer_and_file_roundtrip(tmp_path):
+    """Test that only the newest chunks are kept and survive a save/load."""
+    recorder = SSERecorder(3)
+    for value in range(5):
+        recorder.record(_frame("Kitchen_Light", str(value)))
+    assert len(recorder) == 3
+
+    item = StoredItem.from_json(
+        {"name": "Kitchen_Light", "type": "String", "state": "0"}
+    )
+    path = str(tmp_path / "capture.sse.gz")
+    recorder.save(path, *recorder.capture({"Kitchen_Light": item}, "4.1.0"))
+
+    recording = load_recording(path)
+    assert recording.header["openhab_version"] == "4.1.0"
+    assert [chunk.data for chunk in recording.chunks] == [
+        _frame("Kitchen_Light", str(value)) for value in (2, 3, 4)
+    ]
+    assert list(recording.build_items()) == ["Kitchen_Light"]
+
+
+async def test_record_and_replay(hass, tmp_path):
+    """Test that a recorded stream replays into the same states offline."""
+    hass.config.config_dir = str(tmp_path)
+    coordinator = OpenHABDataUpdateCoordinator(hass, api=MagicMock())
+    coordinator.data = {
+        name: StoredItem.from_json({"name": name, "type": "String", "state": "idle"})
+        for name in ("Washer", "Dryer")
+    }
+    coordinator.coalesce_window = 0
+    coordinator.recorder = SSERecorder(100)
+
+    decoder = SSEDecoder()
+    for name, value in (("Washer", "busy"), ("Dryer", "busy"), ("Washer", "done")):
+        await coordinator._process_sse_chunk(decoder, _frame(name, value))
+    path = await coordinator.async_save_recording()
+
+    result = await async_replay(hass, load_recording(path), None)
+    assert result["events"] == 3
+    # Both Washer events land in one coalescing window at max speed.
+    assert result["state_writes"] == 2
+    assert result["fallback_refreshes"] == 0
@@ -0,0 +1,144 @@
+"""Test openHAB performance sensors."""
+import time
+from unittest.mock import MagicMock, patch
+
+from homeassistant.helpers.entity import Entity
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.openhab.const import CONF_DIAGNOSTIC_INTERVAL, DOMAIN
+from custom_components.openhab.coordinator import OpenHABDataUpdateCoordinator
+from custom_components.openhab.sensor import (
+    PERFORMANCE_SENSORS,
+    OpenHABPerformanceSensor,
+    OpenHABSensor,
+)
+from custom_components.openhab.store import StoredItem
+
+from .const import MOCK_CONFIG
+
+
+def _make_sensor(hass, key):
+    """Create a performance sensor for the given description key."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=MOCK_CONFIG, options={CONF_DIAGNOSTIC_INTERVAL: 60}
+    )
+    api = MagicMock()
+    api._base_url = "http://openhab:8080/rest"
+    coordinator = OpenHABDataUpdateCoordinator(hass, api=api)
+    description = next(d for d in PERFORMANCE_SENSORS if d.key == key)
+    sensor = OpenHABPerformanceSensor(coordinator, entry, description)
+    sensor.hass = hass
+    sensor.async_write_ha_state = MagicMock()
+    return coordinator, sensor
+
+
+async def test_performance_sensors_disabled_by_default(hass):
+    """Test that performance sensors are diagnostic and opt-in."""
+    _, sensor = _make_sensor(hass, "sse_events_rate")
+    assert sensor.entity_registry_enabled_default is False
+    assert sensor.entity_category == "diagnostic"
+    assert sensor._interval.total_seconds() == 60
+
+
+async def test_performance_sensor_writes_only_on_change(hass):
+    """Test that a tick without a new value does not write the state."""
+    coordinator, sensor = _make_sensor(hass, "sse_parse_failures")
+    sensor._refresh()
+    assert sensor.native_value == 0
+
+    sensor._async_tick(None)
+    sensor.async_write_ha_state.assert_not_called()
+
+    coordinator.metrics.inc("sse_parse_failures", 3)
+    sensor._async_tick(None)
+    assert sensor.native_value == 3
+    sensor.async_write_ha_state.assert_called_once()
+
+
+async def test_performance_sensor_rate_and_percentiles(hass):
+    """Test counter rates over the interval and latency percentiles in ms."""
+    coordinator, sensor = _make_sensor(hass, "sse_events_rate")
+    sensor._last_time = time.monotonic() - 10
+    coordinator.metrics.inc("sse_events", 50)
+    sensor._refresh()
+    assert 4.9 < sensor.native_value <= 5.0
+
+    coordinator, sensor = _make_sensor(hass, "state_write_lag")
+    for lag in (0.001, 0.002, 0.1):
+        coordinator.metrics.observe("state_write_lag", lag)
+    sensor._refresh()
+    assert sensor.native_value == 2.0
+    assert sensor.extra_state_attributes == {"p95": 100.0, "p99": 100.0}
+
+
+def _item(label):
+    """Return a temperature item with the given label."""
+    return StoredItem.from_json(
+        {
+            "name": "Room_Temperature",
+            "type": "Number:Temperature",
+            "label": label,
+            "state": "21.5 °C",
+        }
+    )
+
+
+async def test_item_sensor_presentation_cached(hass):
+    """Test that name, icon and device class are computed once per metadata."""
+    api = MagicMock()
+    api._base_url = "http://openhab:8080"
+    coordinator = OpenHABDataUpdateCoordinator(hass, api=api)
+    coordinator.data = {"Room_Temperature": _item("Living room")}
+    sensor = OpenHABSensor(hass, coordinator, coordinator.data["Room_Temperature"])
+    sensor.async_write_ha_state = MagicMock()
+    assert sensor.name == "Living room"
+    assert sensor.icon == "mdi:thermometer"
+    assert sensor.device_class == "temperature"
+    assert sensor.device_info["identifiers"] == {(DOMAIN, "openhab")}
+    assert sensor.native_unit_of_measurement == "°C"
+
+    sensor._device_class = MagicMock(return_value="temperature")
+    coordinator.data["Room_Temperature"].set_state("22 °C")
+    sensor._handle_item_update()
+    sensor._device_class.assert_not_called()
+
+    coordinator.data["Room_Temperature"] = _item("Kitchen")
+    sensor._handle_item_update()
+    assert sensor.name == "Kitchen"
+    sensor._device_class.assert_called_once()
+
+    # Re-described with another unit: the cached unit follows.
+    item = _item("Kitchen")
+    item.set_state("70 °F")
+    coordinator.data["Room_Temperature"] = item
+    sensor._handle_item_update()
+    assert sensor.native_unit_of_measurement == "°F"
+
+
+async def test_refresh_skips_unchanged_state_writes(hass):
+    """Test that a refresh only writes entities whose state changed."""
+    api = MagicMock()
+    api._base_url = "http://openhab:8080"
+    coordinator = OpenHABDataUpdateCoordinator(hass, api=api)
+    coordinator.is_online = True
+    coordinator.data = {"Room_Temperature": _item("Living room")}
+    sensor = OpenHABSensor(hass, coordinator, coordinator.data["Room_Temperature"])
+    remove = coordinator.async_add_listener(sensor._handle_coordinator_update)
+
+    with patch.object(Entity, "async_write_ha_state") as write:
+        sensor.async_write_ha_state()
+        coordinator.async_update_listeners()
+        assert write.call_count == 1
+        assert coordinator.last_refresh_writes == {"written": 0, "skipped": 1}
+
+        coordinator.data["Room_Temperature"].set_state("23 °C")
+        coordinator.async_update_listeners()
+        assert write.call_count == 2
+        assert coordinator.last_refresh_writes == {"written": 1, "skipped": 0}
+
+        coordinator.is_online = False
+        coordinator.async_update_listeners()
+        assert write.call_count == 3
+    remove()
+    assert coordinator.metrics.counters["refresh_writes_skipped"] == 1
@@ -0,0 +1,57 @@
+"""Tests for the openHAB item catalog snapshot."""
+
+from custom_components.openhab.snapshot import (
+    CatalogSnapshot,
+    catalog_signature,
+    item_from_json,
+    item_to_json,
+)
+from custom_components.openhab.store import StoredItem
+
+ITEMS = [
+    {
+        "name": "Temp",
+        "type": "Number:Temperature",
+        "state": "21.5 °C",
+        "label": "Living room",
+        "groupNames": ["DeviReg_Living"],
+        "tags": [],
+    },
+    {
+        "name": "Lights",
+        "type": "Group",
+        "groupType": "Switch",
+        "state": "ON",
+        "members": [],
+    },
+    {"name": "DeviReg_Living", "type": "Group", "state": "NULL", "members": []},
+]
+
+
+async def test_snapshot_round_trip(hass, hass_storage):
+    """Test that items and their classification survive a store round trip."""
+    items = {item["name"]: StoredItem.from_json(item) for item in ITEMS}
+    items["DeviReg_Living"].type_ex = "devireg_unit"
+    items["DeviReg_Living"].devireg = {"attrs": {}, "thing": {}, "name_id": "x"}
+    items["Temp"].parent_device_name = "DeviReg_Living"
+
+    assert "tags" not in item_to_json(items["Temp"])
+
+    snapshot = CatalogSnapshot(hass, "entry")
+    await snapshot.async_write("4.1.0", items)
+    assert "openhab.entry.catalog" in hass_storage
+
+    version, loaded = await CatalogSnapshot(hass, "entry").async_load()
+    assert version == "4.1.0"
+    assert catalog_signature(loaded) == catalog_signature(items)
+    assert loaded["Temp"]._state == 21.5
+    assert loaded["Temp"].unit_of_measure == "°C"
+    assert loaded["Temp"].parent_device_name == "DeviReg_Living"
+    assert loaded["Lights"].group and loaded["Lights"].type_ == "Switch"
+    assert loaded["DeviReg_Living"].devireg["name_id"] == "x"
+    assert item_from_json(item_to_json(loaded["Temp"])).label == "Living room"
+
+
+async def test_missing_snapshot(hass, hass_storage):
+    """Test that setup falls back to a first refresh without a snapshot."""
+    assert await CatalogSnapshot(hass, "entry").async_load() is None
@@ -0,0 +1,57 @@
+"""Tests for the openHAB SSE decoder."""
+from custom_components.openhab.sse import SSEDecoder, SSEEvent, build_topic_filter
+
+
+def test_single_event():
+    """Test a plain openHAB frame."""
+    decoder = SSEDecoder()
+    events = decoder.feed(b'event: message\ndata: {"type":"ALIVE"}\n\n')
+    assert events == [SSEEvent("message", b'{"type":"ALIVE"}', "")]
+
+
+def test_multi_line_data_and_default_event():
+    """Test that data lines are joined with newlines."""
+    decoder = SSEDecoder()
+    events = decoder.feed(b"data: first\ndata:second\ndata\n\n")
+    assert events == [SSEEvent("message", b"first\nsecond\n", "")]
+
+
+def test_chunk_boundaries_and_crlf():
+    """Test frames split across chunks, including a split CRLF."""
+    decoder = SSEDecoder()
+    stream = b'id: 7\r\ndata: {"a":\r\ndata: 1}\r\n\r\ndata: x\r\n\r\n'
+    events = []
+    for i in range(len(stream)):
+        events.extend(decoder.feed(stream[i : i + 1]))
+    assert events == [
+        SSEEvent("message", b'{"a":\n1}', "7"),
+        SSEEvent("message", b"x", "7"),
+    ]
+    assert decoder.last_event_id == "7"
+
+
+def test_comments_retry_and_empty_frames():
+    """Test keepalive comments, retry and frames without data."""
+    decoder = SSEDecoder()
+    events = decoder.feed(b": keepalive\n\nretry: 3000\nevent: ping\n\nretry: x\n\n")
+    assert events == []
+    assert decoder.comments == 1
+    assert decoder.retry == 3000
+
+
+def test_reset_keeps_last_event_id():
+    """Test that reset drops partial frames but keeps the event id."""
+    decoder = SSEDecoder()
+    decoder.feed(b"id: 42\ndata: first\n\ndata: partial")
+    decoder.reset()
+    assert decoder.feed(b"data: whole\n\n") == [SSEEvent("message", b"whole", "42")]
+
+
+def test_build_topic_filter():
+    """Test the topic filter for consumed event types."""
+    assert (
+        build_topic_filter(
+            ["ItemStateUpdatedEvent", "ItemStateChangedEvent", "ItemStateUpdatedEvent"]
+        )
+        == "openhab/items/*/statechanged,openhab/items/*/stateupdated"
+    )
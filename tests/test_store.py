@@ -0,0 +1,57 @@
+"""Test the compact item store."""
+from openhab import OpenHAB
+import pytest
+
+from custom_components.openhab.store import StoredItem, merge_items
+
+ITEMS = [
+    {"name": "Temp", "type": "Number:Temperature", "state": "21.5 °C", "label": "Temp"},
+    {"name": "Light", "type": "Dimmer", "state": "40", "tags": ["Lighting"]},
+    {"name": "Lamp", "type": "Color", "state": "120,100,50"},
+    {"name": "Blind", "type": "Rollershutter", "state": "NULL"},
+    {"name": "Seen", "type": "DateTime", "state": "2024-01-01T10:00:00.000+0000"},
+    {"name": "Where", "type": "Location", "state": "52.1,4.3"},
+    {
+        "name": "Power",
+        "type": "Group",
+        "groupType": "Number:Power",
+        "state": "120 W",
+        "members": [],
+        "groupNames": ["House"],
+    },
+    {"name": "House", "type": "Group", "state": "NULL", "members": []},
+]
+
+
+@pytest.mark.parametrize("data", ITEMS, ids=[item["name"] for item in ITEMS])
+def test_matches_python_openhab(data):
+    """Test that the compact item reads like the python-openhab item."""
+    expected = OpenHAB("http://openhab:8080/rest").json_to_item(data)
+    for item in (StoredItem.from_json(data), StoredItem.from_item(expected)):
+        for attr in ("name", "type_", "group", "quantityType", "_raw_state", "_state"):
+            assert getattr(item, attr) == getattr(expected, attr), attr
+        assert item.unit_of_measure == expected.unit_of_measure
+        assert list(item.groupNames) == list(expected.groupNames or [])
+
+
+def test_no_instance_dict():
+    """Test that items carry only their slots."""
+    item = StoredItem.from_json(ITEMS[0])
+    assert not hasattr(item, "__dict__")
+    with pytest.raises(AttributeError):
+        item.label = "changed"
+
+
+def test_merge_keeps_unchanged_items():
+    """Test that a refresh reuses items whose metadata did not change."""
+    current = {data["name"]: StoredItem.from_json(data) for data in ITEMS[:2]}
+    fresh = {
+        "Temp": StoredItem.from_json({**ITEMS[0], "state": "22 °C"}),
+        "Light": StoredItem.from_json({**ITEMS[1], "label": "Renamed"}),
+    }
+
+    merged = merge_items(current, fresh)
+
+    assert merged["Temp"] is current["Temp"]
+    assert merged["Temp"]._state == 22.0
+    assert merged["Light"] is fresh["Light"]
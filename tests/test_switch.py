@@ -1,5 +1,5 @@
 """Test openHAB switch."""
-from unittest.mock import call, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 from homeassistant.components.switch import SERVICE_TURN_OFF, SERVICE_TURN_ON
 from homeassistant.const import ATTR_ENTITY_ID
@@ -7,6 +7,9 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.openhab import async_setup_entry
 from custom_components.openhab.const import DEFAULT_NAME, DOMAIN, SWITCH
+from custom_components.openhab.coordinator import OpenHABDataUpdateCoordinator
+from custom_components.openhab.store import StoredItem
+from custom_components.openhab.switch import OpenHABBinarySwitch
 
 from .const import MOCK_CONFIG
 
@@ -42,3 +45,22 @@ async def test_switch_services(hass):
         )
         assert title_func.called
         assert title_func.call_args == call("ON")
+
+
+async def test_untyped_group_switch_is_not_optimistic(hass):
+    """Test that only typed switches show their command optimistically."""
+    api = MagicMock()
+    api._base_url = "http://openhab:8080"
+    coordinator = OpenHABDataUpdateCoordinator(hass, api=api)
+    coordinator.async_send_command = AsyncMock()
+    group = StoredItem.from_json(
+        {"name": "Lights", "type": "Group", "state": "NULL", "members": []}
+    )
+    light = StoredItem.from_json({"name": "Light", "type": "Switch", "state": "OFF"})
+
+    await OpenHABBinarySwitch(hass, coordinator, group).async_turn_on()
+    await OpenHABBinarySwitch(hass, coordinator, light).async_turn_on()
+    assert coordinator.async_send_command.await_args_list == [
+        call("Lights", "ON", None),
+        call("Light", "ON", "ON"),
+    ]